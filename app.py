@@ -1,36 +1,158 @@
 from __future__ import annotations
 
+import functools
 import json
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, TypeVar
 
 import streamlit as st
-from streamlit_mic_recorder import mic_recorder  # type: ignore
 
 from interview_partner.agents.orchestrator import Orchestrator
 from interview_partner.agents.memory_agent import MemoryAgent
+from interview_partner.config import settings
+from interview_partner.data.models import SessionSummary
 from interview_partner.data.rubrics import RUBRIC_DESCRIPTIONS, RUBRIC_TITLES
+from interview_partner.core.admission import ServiceBusy, admission
 from interview_partner.core.audio import transcribe_audio_bytes, text_to_speech_bytes
+from interview_partner.core.http_pool import http_pool
+from interview_partner.core.key_pool import key_pool
+from interview_partner.core.llm import prewarm_client
+from interview_partner.core.metrics import metrics
+from interview_partner.core.scheduler import Priority, get_scheduler
+from interview_partner.services.session_pool import get_session_pool
 
 
 APP_TITLE = "Interview Practice Partner"
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+# Cached static assets ----------------------------------------------------- #
+# st.cache_resource is shared by every browser session, so these are read /
+# built once per process instead of on every rerun. File-backed entries are
+# keyed by mtime so edits still show up without a restart.
+@st.cache_resource(show_spinner=False)
+def _static_text(name: str, mtime: float) -> str:
+    return (STATIC_DIR / name).read_text(encoding="utf-8")
+
+
+def _static(name: str) -> str:
+    return _static_text(name, (STATIC_DIR / name).stat().st_mtime)
+
+
+@st.cache_resource(show_spinner=False)
+def _css_markup(mtime: float) -> str:
+    return f"<style>{_static_text('style.css', mtime)}</style>"
+
+
+def _video_grid_html() -> str:
+    return _static("video_grid.html")
+
+
+@st.cache_resource(show_spinner=False)
+def _rubric_html() -> str:
+    rubric_html = '<div class="rubric-grid">'
+    for k, desc in RUBRIC_DESCRIPTIONS.items():
+        title = RUBRIC_TITLES.get(k, k)
+        rubric_html += f"""<div class="rubric-card">
+<div class="rubric-title"><span>🔹</span> {title}</div>
+<div class="rubric-desc">{desc}</div>
+</div>"""
+    rubric_html += "</div>"
+    return rubric_html
+
+
+@st.cache_resource(max_entries=1024, show_spinner=False)
+def _memory_agent(user_id: str) -> MemoryAgent:
+    return MemoryAgent(user_id=user_id)
+
+
+@st.cache_data(ttl=60, max_entries=1024, show_spinner=False)
+def _weak_spots(user_id: str) -> List[str]:
+    """Cleared after each finalized session, so new results show up at once."""
+    return _memory_agent(user_id).get_weak_spots()
+
+
+def _timed(name: str) -> Callable[[F], F]:
+    """Record the render time of a page part / fragment under "app.render.<name>_s"."""
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with metrics.timer(f"app.render.{name}_s"):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
 
 
 def _init_session_state() -> None:
     if "view" not in st.session_state:
         st.session_state["view"] = "🚀 Pre-flight"
-    if "orchestrator" not in st.session_state:
-        st.session_state["orchestrator"] = None
+    if "session_id" not in st.session_state:
+        # Key into the process-wide SessionPool, which holds the Orchestrator
+        # and its audio and may evict them to disk while the tab is idle.
+        st.session_state["session_id"] = None
     if "current_question" not in st.session_state:
         st.session_state["current_question"] = None
     if "session_summary" not in st.session_state:
         st.session_state["session_summary"] = None
-    if "tts_cache" not in st.session_state:
-        st.session_state["tts_cache"] = {}
     if "transcribed_answer" not in st.session_state:
         st.session_state["transcribed_answer"] = ""
     if "user_id" not in st.session_state:
         st.session_state["user_id"] = ""
 
+    # A fresh Streamlit session (reconnect, server restart) resumes the
+    # interview named in the URL from its last checkpoint.
+    if st.session_state["session_id"] is None and "session" in st.query_params:
+        try:
+            orch = get_session_pool().get(st.query_params["session"]).orchestrator
+        except KeyError:
+            orch = None
+        if orch is None or orch.finished:
+            del st.query_params["session"]
+        else:
+            st.session_state["session_id"] = orch.checkpoint_id
+            st.session_state["current_question"] = orch.current_question
+            st.session_state["user_id"] = orch.user_id
+            st.session_state["max_questions"] = orch.max_questions
+            st.session_state["view"] = "🎙️ Interview"
+
+
+def _current_orchestrator() -> Optional[Orchestrator]:
+    """This tab's Orchestrator (reloaded from disk if it was evicted), or None."""
+    session_id = st.session_state.get("session_id")
+    if not session_id:
+        return None
+    try:
+        return get_session_pool().get(session_id).orchestrator
+    except KeyError:
+        return None
+
+
+def _activate_session(orch: Orchestrator) -> str:
+    """Put a new session into the pool, replacing this tab's previous one; returns the first question."""
+    pool = get_session_pool()
+    previous = st.session_state.get("session_id")
+    if previous and previous != orch.checkpoint_id:
+        pool.remove(previous)
+    pool.reap_idle(settings.SERVER_SESSION_TTL)
+    first_question = orch.start_interview()
+    pool.add(orch)
+    # Start the cohort rescan in the background now, so it has finished by
+    # the time the Review page asks for percentiles.
+    from interview_partner.services.analytics import get_cohort_analytics
+
+    get_cohort_analytics(orch.memory.store)
+    st.query_params["session"] = orch.checkpoint_id
+    st.session_state["session_id"] = orch.checkpoint_id
+    st.session_state["current_question"] = first_question
+    st.session_state["view"] = "🎙️ Interview"
+    st.session_state["transcribed_answer"] = ""
+    return first_question
+
 
 def _sidebar() -> None:
     with st.sidebar:
@@ -50,21 +172,37 @@ def _sidebar() -> None:
         st.session_state["view"] = view
 
         st.markdown("---")
-        
+
         # CSS is injected in main() now to ensure it covers everything including header
-        
+
         st.markdown("### Rubric")
-        
-        rubric_html = '<div class="rubric-grid">'
-        for k, desc in RUBRIC_DESCRIPTIONS.items():
-            title = RUBRIC_TITLES.get(k, k)
-            rubric_html += f"""<div class="rubric-card">
-<div class="rubric-title"><span>🔹</span> {title}</div>
-<div class="rubric-desc">{desc}</div>
-</div>"""
-        rubric_html += "</div>"
-        
-        st.markdown(rubric_html, unsafe_allow_html=True)
+        st.markdown(_rubric_html(), unsafe_allow_html=True)
+
+        with st.expander("⚙️ Runtime metrics"):
+            from interview_partner.agents.critic import cascade_stats, parse_stats
+            from interview_partner.core.metrics import metrics
+            from interview_partner.services import checkpoints, prescorer
+            from interview_partner.services.followup_cache import followup_cache
+
+            st.caption(
+                f"Mean full rerun {metrics.mean('app.rerun_s') * 1e3:.1f} ms; "
+                f"answer panel {metrics.mean('app.render.answer_panel_s') * 1e3:.1f} ms."
+            )
+            st.json(
+                {
+                    "followup_cache": followup_cache.stats(),
+                    "prescorer": prescorer.stats(),
+                    "critic": cascade_stats(),
+                    "critic_parse": parse_stats(),
+                    "scheduler": get_scheduler().stats(),
+                    "admission": admission.stats(),
+                    "llm_http": http_pool.stats(),
+                    "key_pool": key_pool.stats(),
+                    "checkpoints": checkpoints.stats(),
+                    "session_pool": get_session_pool().stats(),
+                    **metrics.snapshot(),
+                }
+            )
 
 
 def _render_preflight() -> None:
@@ -73,6 +211,8 @@ def _render_preflight() -> None:
     col_left, col_right = st.columns([2, 1])
 
     with col_left:
+        # The user id drives the weak-spot column, so it stays outside the
+        # fragments and a change reruns the whole page.
         st.markdown('<div class="input-label">User ID</div>', unsafe_allow_html=True)
         user_id = st.text_input(
             "User ID",
@@ -81,71 +221,13 @@ def _render_preflight() -> None:
             label_visibility="collapsed",
         )
         st.session_state["user_id"] = user_id.strip() or "anonymous"
-
-        st.markdown('<div class="input-label">Target Role</div>', unsafe_allow_html=True)
-        role = st.selectbox(
-            "Target role",
-            ["Software Engineer", "Sales", "Customer Support"],
-            index=0,
-            label_visibility="collapsed",
-        )
-
-        st.markdown('<div class="input-label">Interviewer Tone</div>', unsafe_allow_html=True)
-        tone = st.radio(
-            "Interviewer tone",
-            options=["Friendly", "Neutral", "Grilling"],
-            index=1,
-            horizontal=True,
-            label_visibility="collapsed",
-        )
-
-        st.markdown('<div class="input-label">Mode</div>', unsafe_allow_html=True)
-        mode_label = st.radio(
-            "Mode",
-            ["Normal Interview", "Weak Spot Drill"],
-            horizontal=True,
-            label_visibility="collapsed",
-        )
-        mode = "drill" if "Drill" in mode_label else "normal"
-
-        st.markdown('<div class="input-label">Questions per Session</div>', unsafe_allow_html=True)
-        max_questions = st.slider(
-            "Questions per session",
-            min_value=5,
-            max_value=8,
-            value=6,
-            label_visibility="collapsed",
-        )
-
-        st.session_state["max_questions"] = max_questions
-
-        if st.button("🎙️ Start Session", type="primary"):
-            orch = Orchestrator(
-                user_id=st.session_state["user_id"],
-                role=role,
-                mode=mode,
-                tone=tone,
-                max_questions=max_questions,
-            )
-            first_question = orch.start_interview()
-
-            st.session_state["orchestrator"] = orch
-            st.session_state["current_question"] = first_question
-            st.session_state["view"] = "🎙️ Interview"
-            st.session_state["transcribed_answer"] = ""
-            st.session_state["tts_cache"] = {}
-
-            st.rerun()
+        _session_options()
 
     with col_right:
         st.markdown('<div class="weak-spot-col">', unsafe_allow_html=True)
         st.subheader("Weak-spot overview")
 
-        if st.session_state["user_id"]:
-            mem = MemoryAgent(user_id=st.session_state["user_id"])
-            weak_spots = mem.get_weak_spots()
-        else:
-            weak_spots = []
+        weak_spots = _weak_spots(st.session_state["user_id"]) if st.session_state["user_id"] else []
 
         if weak_spots:
             st.write("Based on your past sessions, focus on:")
@@ -156,36 +238,116 @@ def _render_preflight() -> None:
         st.markdown('</div>', unsafe_allow_html=True)
 
         st.markdown("---")
-        st.caption("Optional: resume & JD upload could plug into a future Resume RAG service.")
+        _context_uploads()
+
+
+@st.fragment
+@_timed("session_options")
+def _session_options() -> None:
+    """Role / tone / mode / length pickers and Start; changing them reruns only this fragment."""
+    st.markdown('<div class="input-label">Target Role</div>', unsafe_allow_html=True)
+    role = st.selectbox(
+        "Target role",
+        ["Software Engineer", "Sales", "Customer Support"],
+        index=0,
+        label_visibility="collapsed",
+    )
+
+    st.markdown('<div class="input-label">Interviewer Tone</div>', unsafe_allow_html=True)
+    tone = st.radio(
+        "Interviewer tone",
+        options=["Friendly", "Neutral", "Grilling"],
+        index=1,
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+
+    st.markdown('<div class="input-label">Mode</div>', unsafe_allow_html=True)
+    mode_label = st.radio(
+        "Mode",
+        ["Normal Interview", "Weak Spot Drill"],
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+    mode = "drill" if "Drill" in mode_label else "normal"
+
+    st.markdown('<div class="input-label">Questions per Session</div>', unsafe_allow_html=True)
+    max_questions = st.slider(
+        "Questions per session",
+        min_value=5,
+        max_value=8,
+        value=6,
+        label_visibility="collapsed",
+    )
+
+    st.session_state["max_questions"] = max_questions
+
+    if st.button("🎙️ Start Session", type="primary"):
+        try:
+            orch = Orchestrator(
+                user_id=st.session_state["user_id"],
+                role=role,
+                mode=mode,
+                tone=tone,
+                max_questions=max_questions,
+                # Uploaders live in the right column; their values are read by key.
+                resume_text=st.session_state.get("resume_file"),
+                job_description=st.session_state.get("jd_file"),
+            )
+        except ServiceBusy as e:
+            st.warning(f"We're at capacity right now. Please try again in about {e.retry_after:.0f} seconds.")
+            return
+        _activate_session(orch)
+        st.rerun()  # app scope by default: switches to the interview room
+
+
+@st.fragment
+@_timed("context_uploads")
+def _context_uploads() -> None:
+    """Resume / JD uploaders; an upload reruns only this fragment (Start reads them by key)."""
+    st.subheader("Resume & job description")
+    st.file_uploader(
+        "Resume (optional)", type=["txt", "md", "pdf"], key="resume_file"
+    )
+    st.file_uploader(
+        "Job description (optional)", type=["txt", "md", "pdf"], key="jd_file"
+    )
+    st.caption("Skill gaps between the two are analyzed locally and steer the questions.")
 
 
 def _play_question_audio(question: str) -> None:
     if not question:
         return
 
-    tts_cache: Dict[str, Optional[bytes]] = st.session_state["tts_cache"]
-
-    if question not in tts_cache:
-        audio_bytes = text_to_speech_bytes(question)
-        tts_cache[question] = audio_bytes
-        st.session_state["tts_cache"] = tts_cache
+    # Clips live in the session pool (spilled to disk with an evicted session);
+    # b"" marks a failed synthesis so it is not retried on every rerun.
+    pool = get_session_pool()
+    session_id = st.session_state["session_id"]
+    key = f"tts:{question}"
+    audio_bytes = pool.get_audio(session_id, key)
+    if audio_bytes is None:
+        audio_bytes = get_scheduler().run(
+            text_to_speech_bytes,
+            question,
+            priority=Priority.TTS_PREFETCH,
+            user_id=st.session_state["user_id"],
+        )
+        pool.put_audio(session_id, key, audio_bytes or b"")
 
-    audio_bytes = tts_cache.get(question)
     if audio_bytes:
         st.audio(audio_bytes, format="audio/wav", start_time=0)
 
 
 def _render_interview_room() -> None:
-    from pathlib import Path
-    
-    orch: Optional[Orchestrator] = st.session_state.get("orchestrator")
+    orch = _current_orchestrator()
     if orch is None:
         st.warning("Start a session from the Pre-flight view first.")
         return
 
     question = st.session_state.get("current_question") or orch.current_question
     if not question:
-        question = orch.start_interview()
+        with get_session_pool().use(orch.checkpoint_id) as pooled:
+            question = pooled.orchestrator.start_interview()
         st.session_state["current_question"] = question
 
     # Question Overlay
@@ -196,214 +358,11 @@ def _render_interview_room() -> None:
         </div>
     """, unsafe_allow_html=True)
 
-    # Google Meet-style Video Grid using components.html for proper rendering
+    # Google Meet-style video grid; the markup is cached across sessions and
+    # sits outside the answer fragment, so typing never re-sends it.
     import streamlit.components.v1 as components
-    
-    video_grid_html = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body { margin: 0; padding: 0; background: #202124; }
-            .video-grid {
-                display: grid;
-                grid-template-columns: 1fr 1fr;
-                gap: 16px;
-                padding: 20px;
-            }
-            .video-container {
-                position: relative;
-                border-radius: 12px;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                height: 400px;
-                overflow: hidden;
-            }
-            .ai-container {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            }
-            .candidate-container {
-                background: linear-gradient(135deg, #0f2027 0%, #203a43 50%, #2c5364 100%);
-            }
-            .ai-avatar {
-                width: 150px;
-                height: 150px;
-                border-radius: 50%;
-                background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                font-size: 64px;
-                box-shadow: 0 8px 24px rgba(0, 0, 0, 0.4);
-            }
-            .participant-label {
-                position: absolute;
-                bottom: 12px;
-                left: 12px;
-                background: rgba(0, 0, 0, 0.7);
-                color: white;
-                padding: 6px 12px;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: 500;
-                backdrop-filter: blur(10px);
-            }
-            .status-indicator {
-                position: absolute;
-                top: 12px;
-                right: 12px;
-                width: 12px;
-                height: 12px;
-                border-radius: 50%;
-                background: #34a853;
-                box-shadow: 0 0 8px rgba(52, 168, 83, 0.6);
-            }
-            #candidate-video {
-                width: 100%;
-                height: 100%;
-                object-fit: cover;
-                display: none;
-            }
-            .webcam-placeholder {
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                justify-content: center;
-                color: #9aa0a6;
-                text-align: center;
-            }
-            .camera-toggle {
-                position: absolute;
-                top: 12px;
-                right: 12px;
-                width: 40px;
-                height: 40px;
-                border-radius: 50%;
-                background: rgba(0, 0, 0, 0.6);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                color: white;
-                cursor: pointer;
-                font-size: 20px;
-                backdrop-filter: blur(10px);
-                transition: all 0.2s ease;
-                z-index: 10;
-            }
-            .camera-toggle:hover {
-                background: rgba(0, 0, 0, 0.8);
-                transform: scale(1.1);
-            }
-        </style>
-    </head>
-    <body>
-        <div class="video-grid">
-            <div class="video-container ai-container">
-                <div class="ai-avatar">🤖</div>
-                <div class="participant-label">AI Interviewer</div>
-                <div class="status-indicator"></div>
-            </div>
-            
-            <div class="video-container candidate-container">
-                <video id="candidate-video" autoplay muted playsinline></video>
-                <div id="webcam-placeholder" class="webcam-placeholder">
-                    <svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" stroke="currentColor" style="width: 80px; height: 80px; margin-bottom: 16px; opacity: 0.6;">
-                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M15 10l4.553-2.276A1 1 0 0121 8.618v6.764a1 1 0 01-1.447.894L15 14M5 18h8a2 2 0 002-2V8a2 2 0 00-2-2H5a2 2 0 00-2 2v8a2 2 0 002 2z" />
-                    </svg>
-                    <p id="camera-status">Initializing camera...</p>
-                </div>
-                <button id="camera-toggle" class="camera-toggle" onclick="toggleCamera()">📹</button>
-                <div class="participant-label">You</div>
-            </div>
-        </div>
-        
-        <script>
-        (function() {
-            console.log("Webcam initialization script loaded");
-            let localStream = null;
-            let videoElement = null;
-            let cameraEnabled = true;
-
-            async function initializeWebcam() {
-                console.log("Attempting to initialize webcam...");
-                const statusEl = document.getElementById("camera-status");
-                
-                try {
-                    if (!navigator.mediaDevices || !navigator.mediaDevices.getUserMedia) {
-                        throw new Error("Camera not supported in this browser");
-                    }
-                    
-                    console.log("Requesting camera access...");
-                    localStream = await navigator.mediaDevices.getUserMedia({
-                        video: { width: { ideal: 1280 }, height: { ideal: 720 }, facingMode: "user" },
-                        audio: false
-                    });
-                    
-                    console.log("Camera access granted!");
-                    videoElement = document.getElementById("candidate-video");
-                    
-                    if (videoElement) {
-                        videoElement.srcObject = localStream;
-                        videoElement.style.display = "block";
-                        await videoElement.play();
-                        console.log("Video playing");
-                        
-                        const placeholder = document.getElementById("webcam-placeholder");
-                        if (placeholder) placeholder.style.display = "none";
-                    }
-                    
-                    return true;
-                } catch (error) {
-                    console.error("Camera error:", error);
-                    let errorMessage = "Unable to access camera";
-                    
-                    if (error.name === "NotAllowedError") {
-                        errorMessage = "Camera access denied. Please allow permissions.";
-                    } else if (error.name === "NotFoundError") {
-                        errorMessage = "No camera found.";
-                    } else if (error.name === "NotReadableError") {
-                        errorMessage = "Camera in use by another app.";
-                    } else {
-                        errorMessage = error.message;
-                    }
-                    
-                    if (statusEl) statusEl.textContent = errorMessage;
-                    return false;
-                }
-            }
-
-            window.toggleCamera = function() {
-                console.log("Toggle camera clicked");
-                if (localStream) {
-                    const videoTrack = localStream.getVideoTracks()[0];
-                    if (videoTrack) {
-                        cameraEnabled = !cameraEnabled;
-                        videoTrack.enabled = cameraEnabled;
-                        
-                        const button = document.getElementById("camera-toggle");
-                        if (button) {
-                            button.innerHTML = cameraEnabled ? "📹" : "📹❌";
-                            button.style.background = cameraEnabled ? "rgba(0, 0, 0, 0.6)" : "rgba(234, 67, 53, 0.8)";
-                        }
-                        
-                        if (videoElement) {
-                            videoElement.style.opacity = cameraEnabled ? "1" : "0.3";
-                        }
-                    }
-                } else {
-                    console.log("No stream, initializing...");
-                    initializeWebcam();
-                }
-            };
 
-            setTimeout(() => initializeWebcam(), 500);
-        })();
-        </script>
-    </body>
-    </html>
-    """
-    
-    components.html(video_grid_html, height=460)
+    components.html(_video_grid_html(), height=460)
 
     # Audio Player for Question with AI spotlight
     with st.expander("🔊 Play question as audio", expanded=False):
@@ -424,9 +383,28 @@ def _render_interview_room() -> None:
 
     st.markdown("---")
 
-    # Answer Section
+    _answer_panel(question)
+
+
+@st.fragment
+@_timed("answer_panel")
+def _answer_panel(question: str) -> None:
+    """
+    Recorder, answer box, hints / provisional scores and Submit.
+
+    A fragment: recording, transcribing and every keystroke-triggered rerun
+    redraw only this panel, not the question, video grid and audio above it.
+    Submit reruns the whole app to move on.
+    """
+    orch = _current_orchestrator()
+    if orch is None:
+        return
+
     st.subheader("🎤 Your Answer")
 
+    # Imported here: the component is only needed once an interview is running.
+    from streamlit_mic_recorder import mic_recorder  # type: ignore
+
     audio_dict = mic_recorder(
         start_prompt="🎙️ Record answer",
         stop_prompt="⏹️ Stop recording",
@@ -439,7 +417,12 @@ def _render_interview_room() -> None:
         if st.button("📝 Transcribe recording"):
             with st.spinner("Transcribing..."):
                 try:
-                    transcript = transcribe_audio_bytes(audio_bytes)
+                    transcript = get_scheduler().run(
+                        transcribe_audio_bytes,
+                        audio_bytes,
+                        priority=Priority.STT,
+                        user_id=st.session_state["user_id"],
+                    )
                 except Exception as e:  # pragma: no cover - runtime only
                     st.error(f"Transcription failed: {e}")
                     transcript = ""
@@ -460,6 +443,7 @@ def _render_interview_room() -> None:
             st.info("💡 Hint: very short answer. Consider adding more context and concrete details.")
         elif word_count > 220:
             st.warning("⚠️ Hint: long answer. Consider being more concise and structured.")
+        _render_provisional_scores(question, answer_text)
 
     col_submit1, col_submit2, col_submit3 = st.columns([1, 1, 1])
     with col_submit2:
@@ -468,28 +452,78 @@ def _render_interview_room() -> None:
                 st.warning("Please record or type an answer before submitting.")
                 return
 
+            # `orch` was fetched before pinning and may have been evicted and
+            # reloaded since: every turn goes to the pinned pool copy.
+            pool = get_session_pool()
+            session_id = orch.checkpoint_id
             with st.spinner("Evaluating and generating next question..."):
-                next_q = orch.submit_answer(answer_text.strip())
+                with pool.use(session_id) as pooled:
+                    next_q = pooled.orchestrator.submit_answer(answer_text.strip())
+                    finished = pooled.orchestrator.finished
                 st.session_state["current_question"] = next_q
                 st.session_state["transcribed_answer"] = ""
-                st.session_state["orchestrator"] = orch  # persist updates
 
-            if orch.finished:
+            if finished:
                 with st.spinner("Finalizing session summary..."):
-                    summary = orch.finalize_session()
+                    with pool.use(session_id) as pooled:
+                        summary = pooled.summary = pooled.orchestrator.finalize_session()
+                    st.query_params.pop("session", None)
                     st.session_state["session_summary"] = summary
                     st.session_state["view"] = "📼 Review"
+                    _weak_spots.clear()
                 st.success("Interview complete! Moving to review.")
-                st.rerun()
-            else:
-                st.rerun()
+            st.rerun(scope="app")
+
+
+def _render_provisional_scores(question: str, answer: str) -> None:
+    """Instant local scores while typing; the critic's scores replace them on submit."""
+    from interview_partner.services.prescorer import prescore
+
+    pre = prescore(question, answer)
+    st.caption(
+        f"Provisional scores (local estimate, {pre.confidence:.0%} confidence) — "
+        "final scores come from the critic."
+    )
+    cols = st.columns(len(pre.scores))
+    for (k, v), col in zip(pre.scores.items(), cols):
+        with col:
+            st.metric(RUBRIC_TITLES.get(k, k), f"{v}/10")
+
+
+def _render_cohort_benchmark(summary: Mapping[str, Any], orch: Optional[Orchestrator]) -> None:
+    from interview_partner.services.analytics import get_cohort_analytics
+
+    scores: Dict[str, float] = summary.get("scores") or {}
+    role = summary.get("role")
+    if orch is None or not scores or not role:
+        return
+
+    analytics = get_cohort_analytics(orch.memory.store)
+    ranks = analytics.percentile_ranks(role, scores)
+    if not ranks:
+        return
+
+    st.subheader("Cohort benchmark")
+    st.caption(
+        f"Percentile vs. {analytics.cohort_size(role)} stored {role} sessions "
+        "(50 = typical, higher is better)."
+    )
+    trend = analytics.user_trend(orch.user_id, role=role)
+    rank_cols = st.columns(len(ranks))
+    for (k, pct), col in zip(ranks.items(), rank_cols):
+        with col:
+            delta = f"{trend[k]:+.2f}/session" if k in trend else None
+            st.metric(RUBRIC_TITLES.get(k, k), f"P{pct:.0f}", delta=delta)
+
+    st.markdown("---")
 
 
 def _render_review() -> None:
     st.header("📼 Game Tape Review")
 
-    summary: Optional[Dict[str, Any]] = st.session_state.get("session_summary")
-    orch: Optional[Orchestrator] = st.session_state.get("orchestrator")
+    # A SessionSummary after finishing here, or a stored header dict; both read like a mapping.
+    summary: Optional[Mapping[str, Any]] = st.session_state.get("session_summary")
+    orch = _current_orchestrator()
 
     if summary is None and orch is not None:
         latest = orch.get_latest_session()
@@ -524,9 +558,22 @@ def _render_review() -> None:
 
     st.markdown("---")
 
-    evaluations: List[Dict[str, Any]] = summary.get("evaluations", [])
+    _render_cohort_benchmark(summary, orch)
+
     st.subheader("Per-question breakdown")
 
+    # Stored sessions only carry a lightweight header; evaluation bodies
+    # (with full answer text) are loaded on demand.
+    evaluations: Optional[Sequence[Mapping[str, Any]]] = summary.get("evaluations")
+    if evaluations is None:
+        session_id = summary.get("session_id")
+        if not session_id or orch is None:
+            evaluations = []
+        elif st.toggle("Show per-question breakdown", key=f"show_evals_{session_id}"):
+            evaluations = orch.load_session_evaluations(session_id)
+        else:
+            evaluations = []
+
     for idx, ev in enumerate(evaluations, start=1):
         with st.expander(f"Q{idx}: {ev.get('question', '')[:80]}..."):
             st.markdown(f"**Question**: {ev.get('question', '')}")
@@ -555,32 +602,36 @@ def _render_review() -> None:
 
     show_json = st.checkbox("🔍 Show scoring rubric JSON (debug / explainability)")
     if show_json:
-        st.json(summary)
+        st.json(summary.to_dict() if isinstance(summary, SessionSummary) else summary)
 
     if st.button("Start Weak Spot Drill based on this session"):
         if orch is None:
             st.warning("No active orchestrator. Go to Pre-flight to start a new session.")
             return
         # Start a new drill-mode session wired to the same user.
-        orch = Orchestrator(
-            user_id=orch.user_id,
-            role=orch.role,
-            mode="drill",
-            tone=orch.tone,
-            max_questions=st.session_state.get("max_questions", 6),
-        )
-        first_q = orch.start_interview()
-        st.session_state["orchestrator"] = orch
-        st.session_state["current_question"] = first_q
+        try:
+            orch = Orchestrator(
+                user_id=orch.user_id,
+                role=orch.role,
+                mode="drill",
+                tone=orch.tone,
+                max_questions=st.session_state.get("max_questions", 6),
+            )
+        except ServiceBusy as e:
+            st.warning(f"We're at capacity right now. Please try again in about {e.retry_after:.0f} seconds.")
+            return
+        _activate_session(orch)
         st.session_state["session_summary"] = None
-        st.session_state["view"] = "🎙️ Interview"
-        st.session_state["transcribed_answer"] = ""
-        st.session_state["tts_cache"] = {}
         st.success("Weak Spot Drill session started.")
         st.rerun()
 
 
 def main() -> None:
+    with metrics.timer("app.rerun_s"):
+        _main()
+
+
+def _main() -> None:
     st.set_page_config(
         page_title=APP_TITLE,
         page_icon="⚡",
@@ -588,13 +639,11 @@ def main() -> None:
     )
 
     _init_session_state()
+    prewarm_client()  # once per process; overlaps SDK import + TLS set-up with the first render
 
-    # Inject CSS globally
-    from pathlib import Path
+    # Inject CSS globally (read once per process, see _css_markup)
     try:
-        css_path = Path("static/style.css")
-        css_content = css_path.read_text(encoding="utf-8")
-        st.markdown(f"<style>{css_content}</style>", unsafe_allow_html=True)
+        st.markdown(_css_markup((STATIC_DIR / "style.css").stat().st_mtime), unsafe_allow_html=True)
     except Exception as e:
         st.error(f"Error loading CSS: {e}")
 
@@ -1,6 +1,25 @@
 from __future__ import annotations
 
-from .interviewer import InterviewerAgent  # noqa: F401
-from .critic import CriticAgent  # noqa: F401
-from .memory_agent import MemoryAgent  # noqa: F401
-from .orchestrator import Orchestrator  # noqa: F401
+from importlib import import_module
+from typing import Any
+
+# Re-exports resolved on first access: `from interview_partner.agents import
+# Orchestrator` still works, but importing one agent module does not pull in
+# the others.
+_LAZY = {
+    "InterviewerAgent": ".interviewer",
+    "CriticAgent": ".critic",
+    "MemoryAgent": ".memory_agent",
+    "Orchestrator": ".orchestrator",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
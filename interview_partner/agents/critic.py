@@ -1,25 +1,68 @@
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from interview_partner.config import settings
+from interview_partner.data.models import Evaluation, RubricScores, intern_tags
+from interview_partner.data.rubrics import RUBRIC_DESCRIPTIONS
 from interview_partner.core import llm, prompts
+from interview_partner.core.json_repair import loads_tolerant
+from interview_partner.core.metrics import metrics
+from interview_partner.core.scheduler import Priority, get_scheduler
+from interview_partner.services import prescorer
+from interview_partner.services.session_digest import SessionDigest
 
 
 DEFAULT_SCORE = 6  # fallback mid-range score for robustness
 
 
+# Approximate USD per 1M (input, output) tokens, for cascade cost estimates only.
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+}
+BORDERLINE_BAND = (5.0, 7.0)  # mean scores in here are close calls worth a second look
+DISAGREEMENT_ESCALATE = 2.0  # mean |lite - local| beyond this also escalates
+
+
+def _estimate_cost(model: str, prompt: str, output: str) -> float:
+    in_rate, out_rate = MODEL_PRICING.get(model, (0.0, 0.0))
+    # ~4 characters per token is close enough for relative tier costs.
+    return (len(prompt) / 4 * in_rate + len(output) / 4 * out_rate) / 1e6
+
+
+def _is_borderline(scores: Mapping[str, Any]) -> bool:
+    values = [float(v) for v in scores.values()]
+    mean = sum(values) / len(values) if values else DEFAULT_SCORE
+    return BORDERLINE_BAND[0] <= mean <= BORDERLINE_BAND[1]
+
+
 @dataclass
 class CriticAgent:
-    """LLM-as-a-Judge for per-answer evaluation and session summaries."""
+    """
+    LLM-as-a-Judge for per-answer evaluation and session summaries.
+
+    With `cascade=True` each answer goes through cheaper tiers first:
+    local pre-score -> `lite_model` -> `model`. A tier's result is kept when
+    its confidence is >= `escalate_below` and its scores are not borderline;
+    otherwise the answer escalates. Per-tier latency, estimated cost and
+    escalations go to `core.metrics` under "critic.*"; see `cascade_stats()`.
+    """
 
     model: str = settings.CRITIC_MODEL
+    cascade: bool = settings.CRITIC_CASCADE
+    lite_model: str = settings.CRITIC_LITE_MODEL
+    escalate_below: float = settings.CRITIC_ESCALATE_BELOW
+    user_id: str = ""  # fair-queuing key for the shared LLM scheduler
 
-    def evaluate_answer(self, question: str, answer: str, role: str) -> Dict[str, Any]:
+    def evaluate_answer(self, question: str, answer: str, role: str, allow_llm: bool = True) -> Evaluation:
         """
-        Evaluate a single answer and return a structured dict:
+        Evaluate a single answer and return an `Evaluation`, which also
+        supports read-only dict-style access:
 
         {
           "question": str,
@@ -29,65 +72,135 @@ class CriticAgent:
           "strengths": [...],
           "comments": str
         }
+
+        Trivial answers (see `services.prescorer`), and every answer when
+        `allow_llm` is False, are scored locally without an LLM call;
+        otherwise the local pre-score is compared with the LLM's scores to
+        track their agreement rate.
+        """
+        metrics.incr("critic.evaluations")
+        started = time.perf_counter()
+        pre = prescorer.prescore(question, answer)
+        if self.cascade:
+            # Only a tier when the cascade runs; otherwise cascade_stats() would count plain pre-scores.
+            metrics.observe("critic.tier.local.latency_s", time.perf_counter() - started)
+        if (pre.trivial and settings.CRITIC_SKIP_TRIVIAL) or not allow_llm:
+            metrics.incr("prescorer.llm_skipped")
+            return self._resolved("local", prescorer.evaluation_from_prescore(question, answer, pre))
+
+        if self.cascade:
+            if pre.confidence >= self.escalate_below and not _is_borderline(pre.scores):
+                return self._resolved("local", prescorer.evaluation_from_prescore(question, answer, pre))
+            metrics.incr("critic.escalated.local")
+
+            if self.lite_model:
+                lite = self._llm_tier("lite", self.lite_model, 256, question, answer, role, pre, with_certainty=True)
+                if lite is not None:
+                    evaluation, certainty = lite
+                    disagreement = _mean_abs_diff(pre.scores, evaluation["scores"])
+                    if (
+                        certainty >= self.escalate_below
+                        and not _is_borderline(evaluation["scores"])
+                        and disagreement <= DISAGREEMENT_ESCALATE
+                    ):
+                        return self._resolved("lite", evaluation)
+                metrics.incr("critic.escalated.lite")
+
+        full = self._llm_tier("full", self.model, 512, question, answer, role, pre)
+        if full is None:
+            return self._resolved("fallback", _fallback_evaluation(question, answer))
+        return self._resolved("full", full[0])
+
+    def _llm_tier(
+        self,
+        tier: str,
+        model: str,
+        max_output_tokens: int,
+        question: str,
+        answer: str,
+        role: str,
+        pre: prescorer.Prescore,
+        with_certainty: bool = False,
+    ) -> Optional[Tuple[Evaluation, float]]:
+        """
+        One critic LLM call; returns (evaluation, certainty) or None if the call
+        failed. Parsed scores are also compared with the local pre-score.
         """
         system_prompt = prompts.critic_system_prompt()
-        user_prompt = prompts.critic_user_prompt(question=question, answer=answer, role=role)
+        user_prompt = prompts.critic_user_prompt(
+            question=question, answer=answer, role=role, with_certainty=with_certainty
+        )
 
+        metrics.incr(f"critic.tier.{tier}.calls")
         try:
-            raw = llm.chat_completion(
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                model=self.model,
-                temperature=0.3,
-                max_output_tokens=512,  # Increased from 256 to allow full JSON response
-                json_mode=True,
-            )
+            with metrics.timer(f"critic.tier.{tier}.latency_s"):
+                raw = get_scheduler().run(
+                    llm.chat_completion,
+                    priority=Priority.INTERACTIVE,
+                    user_id=self.user_id,
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    model=model,
+                    temperature=0.3,
+                    max_output_tokens=max_output_tokens,
+                    json_mode=True,
+                    response_schema=prompts.critic_response_schema(with_certainty),
+                )
         except Exception as e:
-            # If API fails completely, return a fallback evaluation
-            print(f"Critic evaluation failed: {e}. Using fallback scores.")
-            return {
-                "question": question,
-                "answer": answer,
-                "scores": {
-                    "clarity": DEFAULT_SCORE,
-                    "technical_or_role_fit": DEFAULT_SCORE,
-                    "structure_STAR": DEFAULT_SCORE,
-                    "confidence": DEFAULT_SCORE,
-                    "brevity": DEFAULT_SCORE,
-                },
-                "weak_spots": ["Unable to evaluate - API error"],
-                "strengths": ["Answer recorded"],
-                "comments": "Evaluation temporarily unavailable. Your answer has been recorded.",
-            }
+            print(f"Critic evaluation ({tier}) failed: {e}.")
+            metrics.incr(f"critic.tier.{tier}.errors")
+            return None
+        metrics.observe(f"critic.tier.{tier}.cost_usd", _estimate_cost(model, system_prompt + user_prompt, raw))
 
-        try:
-            data = json.loads(raw)
-        except Exception:
-            # Fallback if the model returns invalid JSON.
-            data = {}
-
-        scores = data.get("scores") or {}
-        normalized_scores = {
-            "clarity": int(scores.get("clarity", DEFAULT_SCORE)),
-            "technical_or_role_fit": int(scores.get("technical_or_role_fit", DEFAULT_SCORE)),
-            "structure_STAR": int(scores.get("structure_STAR", DEFAULT_SCORE)),
-            "confidence": int(scores.get("confidence", DEFAULT_SCORE)),
-            "brevity": int(scores.get("brevity", DEFAULT_SCORE)),
-        }
+        data = _parse_critic_json(raw)
+        scores = data.get("scores") if isinstance(data.get("scores"), dict) else {}
+        certainty = 0.0
+        if scores:
+            normalized_scores = _validated_scores(scores)
+            prescorer.record_agreement(pre, normalized_scores)
+            try:
+                certainty = float(data.get("certainty", 0.0))
+            except (TypeError, ValueError):
+                pass
+        else:
+            # Unusable output: the local pre-score beats flat DEFAULT_SCOREs
+            # and saves re-asking the model.
+            normalized_scores = dict(pre.scores)
 
-        return {
-            "question": question,
-            "answer": answer,
-            "scores": normalized_scores,
-            "weak_spots": data.get("weak_spots", []),
-            "strengths": data.get("strengths", []),
-            "comments": data.get("comments", ""),
-        }
+        comments = str(data.get("comments") or "")
+        evaluation = Evaluation(
+            question=question,
+            answer=answer,
+            scores=RubricScores.from_dict(normalized_scores),
+            weak_spots=intern_tags(_string_list(data.get("weak_spots"))),
+            strengths=intern_tags(_string_list(data.get("strengths"))),
+            comments=comments if scores else comments or " ".join(pre.notes),
+            source=None if scores else "prescorer",
+        )
+        return evaluation, certainty
+
+    @staticmethod
+    def _resolved(tier: str, evaluation: Evaluation) -> Evaluation:
+        metrics.incr(f"critic.resolved.{tier}")
+        if evaluation.source is None:
+            evaluation.source = tier
+        return evaluation
 
-    def summarize_session(self, evaluations: List[Dict[str, Any]], role: str) -> Dict[str, Any]:
+    def summarize_session(
+        self,
+        evaluations: Sequence[Evaluation],
+        role: str,
+        digest: Optional[SessionDigest] = None,
+        allow_llm: bool = True,
+    ) -> Dict[str, Any]:
         """
         Aggregate per-answer evaluations into a session summary.
 
+        The LLM only sees the bounded `SessionDigest` payload (built from
+        `evaluations` if the caller did not maintain one), so latency and
+        token cost do not grow with session length. Uses the digest's local
+        summary if the call fails or `allow_llm` is False.
+
         Returns:
         {
           "summary_text": str,
@@ -95,70 +208,40 @@ class CriticAgent:
           "strength_topics": [...]
         }
         """
-        evaluations_json = json.dumps(
-            [
-                {
-                    "question": e["question"],
-                    "answer": e["answer"],
-                    "scores": e["scores"],
-                    "weak_spots": e.get("weak_spots", []),
-                    "strengths": e.get("strengths", []),
-                    "comments": e.get("comments", ""),
-                }
-                for e in evaluations
-            ],
-            ensure_ascii=False,
-        )
+        if digest is None:
+            digest = SessionDigest.from_evaluations(role, evaluations)
+        digest_json = json.dumps(digest.prompt_payload(), ensure_ascii=False)
+        metrics.observe("critic.summary.payload_chars", len(digest_json))
 
         system_prompt = prompts.session_summary_system_prompt()
-        user_prompt = prompts.session_summary_user_prompt(
-            role=role, evaluations_json=evaluations_json
-        )
+        user_prompt = prompts.session_summary_user_prompt(role=role, digest_json=digest_json)
 
-        try:
-            raw = llm.chat_completion(
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                model=self.model,
-                temperature=0.4,
-                max_output_tokens=512,
-                json_mode=True,
-            )
-            data = json.loads(raw)
-        except Exception as e:
-            # Fallback if API fails
-            print(f"Session summary generation failed: {e}. Using fallback summary.")
-            
-            # Extract weak spots and strengths from evaluations
-            all_weak_spots = []
-            all_strengths = []
-            for e in evaluations:
-                all_weak_spots.extend(e.get("weak_spots", []))
-                all_strengths.extend(e.get("strengths", []))
-            
-            # Calculate average scores
-            avg_scores = {}
-            score_keys = ["clarity", "technical_or_role_fit", "structure_STAR", "confidence", "brevity"]
-            for key in score_keys:
-                scores = [e["scores"].get(key, DEFAULT_SCORE) for e in evaluations]
-                avg_scores[key] = sum(scores) / len(scores) if scores else DEFAULT_SCORE
-            
-            # Generate fallback summary
-            num_questions = len(evaluations)
-            avg_overall = sum(avg_scores.values()) / len(avg_scores) if avg_scores else DEFAULT_SCORE
-            
-            summary_text = (
-                f"You completed a {num_questions}-question interview practice session for the {role} role. "
-                f"Your overall performance averaged {avg_overall:.1f}/10 across all criteria. "
-                f"Continue practicing to improve your interview skills, focusing on providing specific examples "
-                f"and structuring your answers using the STAR method (Situation, Task, Action, Result)."
-            )
-            
-            data = {
-                "summary_text": summary_text,
-                "weak_spot_topics": list(set(all_weak_spots[:5])),  # Top 5 unique weak spots
-                "strength_topics": list(set(all_strengths[:5])),  # Top 5 unique strengths
-            }
+        if not allow_llm:
+            # Load shedding (see core.admission): skip the call entirely.
+            metrics.incr("critic.summary.local_fallback")
+            data = digest.local_summary()
+        else:
+            try:
+                with metrics.timer("critic.summary.latency_s"):
+                    raw = get_scheduler().run(
+                        llm.chat_completion,
+                        priority=Priority.BACKGROUND,
+                        user_id=self.user_id,
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        model=self.model,
+                        temperature=0.4,
+                        max_output_tokens=512,
+                        json_mode=True,
+                    )
+                data, _ = loads_tolerant(raw)
+                if not isinstance(data, dict):
+                    raise ValueError("summary is not a JSON object")
+            except Exception as e:
+                # Fallback if API fails
+                print(f"Session summary generation failed: {e}. Using local summary.")
+                metrics.incr("critic.summary.local_fallback")
+                data = digest.local_summary()
 
         return {
             "summary_text": data.get(
@@ -169,3 +252,104 @@ class CriticAgent:
             "weak_spot_topics": data.get("weak_spot_topics", []),
             "strength_topics": data.get("strength_topics", []),
         }
+
+
+def _parse_critic_json(raw: str) -> Dict[str, Any]:
+    """Parse critic output, repairing it locally if needed; {} if unusable."""
+    try:
+        data, repaired = loads_tolerant(raw)
+    except ValueError:
+        metrics.incr("critic.parse.failed")
+        return {}
+    if not isinstance(data, dict):
+        metrics.incr("critic.parse.failed")
+        return {}
+    metrics.incr("critic.parse.repaired" if repaired else "critic.parse.ok")
+    return data
+
+
+def _validated_scores(scores: Dict[str, Any]) -> Dict[str, int]:
+    """
+    One int in [0, 10] per rubric key. Keys match case-insensitively; values
+    like 7.6, "7" or "7/10" are coerced; missing or unreadable ones get
+    DEFAULT_SCORE. Each fix is counted under critic.parse.*.
+    """
+    by_lower = {str(k).lower(): v for k, v in scores.items()}
+    out: Dict[str, int] = {}
+    for key in RUBRIC_DESCRIPTIONS:
+        value = scores.get(key, by_lower.get(key.lower()))
+        if value is None:
+            metrics.incr("critic.parse.missing_score")
+            out[key] = DEFAULT_SCORE
+            continue
+        try:
+            number = float(str(value).split("/")[0].strip()) if isinstance(value, str) else float(value)
+        except (TypeError, ValueError):
+            metrics.incr("critic.parse.missing_score")
+            out[key] = DEFAULT_SCORE
+            continue
+        clamped = int(round(min(10.0, max(0.0, number))))
+        if clamped != number:
+            metrics.incr("critic.parse.clamped")
+        out[key] = clamped
+    return out
+
+
+def _string_list(value: Any) -> List[str]:
+    if isinstance(value, str):
+        return [value] if value.strip() else []
+    if isinstance(value, list):
+        return [str(v) for v in value if str(v).strip()]
+    return []
+
+
+def parse_stats() -> Dict[str, Any]:
+    """How often critic output parsed cleanly, needed local repair, or failed."""
+    ok = metrics.counter("critic.parse.ok")
+    repaired = metrics.counter("critic.parse.repaired")
+    failed = metrics.counter("critic.parse.failed")
+    total = ok + repaired + failed
+    return {
+        "responses": total,
+        "repair_rate": repaired / total if total else 0.0,
+        "failure_rate": failed / total if total else 0.0,
+        "clamped_scores": metrics.counter("critic.parse.clamped"),
+        "missing_scores": metrics.counter("critic.parse.missing_score"),
+    }
+
+
+def _mean_abs_diff(a: Mapping[str, Any], b: Mapping[str, Any]) -> float:
+    keys = [k for k in a if k in b]
+    return sum(abs(float(a[k]) - float(b[k])) for k in keys) / len(keys) if keys else 0.0
+
+
+def _fallback_evaluation(question: str, answer: str) -> Evaluation:
+    """Mid-range scores when the critic API fails completely."""
+    return Evaluation(
+        question=question,
+        answer=answer,
+        scores=RubricScores.from_dict({k: DEFAULT_SCORE for k in RUBRIC_DESCRIPTIONS}),
+        weak_spots=intern_tags(["Unable to evaluate - API error"]),
+        strengths=intern_tags(["Answer recorded"]),
+        comments="Evaluation temporarily unavailable. Your answer has been recorded.",
+    )
+
+
+def cascade_stats() -> Dict[str, Any]:
+    """Resolution share, escalation rate, mean latency and cost per tier."""
+    total = metrics.counter("critic.evaluations")
+    out: Dict[str, Any] = {"evaluations": total}
+    for tier in ("local", "lite", "full", "fallback"):
+        resolved = metrics.counter(f"critic.resolved.{tier}")
+        out[tier] = {
+            "resolved": resolved,
+            "share": resolved / total if total else 0.0,
+            "mean_latency_s": metrics.mean(f"critic.tier.{tier}.latency_s"),
+            "mean_cost_usd": metrics.mean(f"critic.tier.{tier}.cost_usd"),
+        }
+    escalated = metrics.counter("critic.escalated.local")
+    out["escalation_rate"] = escalated / total if total else 0.0
+    out["lite_escalation_rate"] = (
+        metrics.counter("critic.escalated.lite") / escalated if escalated else 0.0
+    )
+    return out
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from interview_partner.core import llm
 from interview_partner.core import prompts
-from interview_partner.data.qbank import Question, get_questions_for_role
+from interview_partner.core.scheduler import Priority, get_scheduler
+from interview_partner.data.qbank import QUESTION_BANK, Question
+from interview_partner.services.followup_cache import followup_cache
+from interview_partner.services.retrieval import rank_questions_for_topics
+
+FALLBACK_FOLLOWUP = "Can you tell me more about your experience with that? Please provide specific examples."
 
 
 @dataclass
@@ -13,33 +19,34 @@ class InterviewerAgent:
     """
     Handles visible interview behavior:
     - Pulls questions from a role-specific bank.
-    - Generates follow-up questions via LLM when needed.
+    - Generates follow-up questions via LLM when needed, reusing cached
+      follow-ups for near-identical (question, answer) situations.
     """
 
     role: str
     tone: str = "neutral"  # friendly | neutral | grilling
     mode: str = "normal"  # normal | drill
     topics: Optional[List[str]] = None
+    user_id: str = ""  # fair-queuing key for the shared LLM scheduler
 
-    _scripted_questions: List[Question] = field(init=False)
+    _scripted_questions: Sequence[Question] = field(init=False)
     _index: int = field(default=0, init=False)
 
     def __post_init__(self) -> None:
-        questions = get_questions_for_role(self.role)
-
-        if self.mode == "drill" and self.topics:
-            # Prioritize questions whose tags overlap weak-spot topics.
-            prioritized: List[Question] = []
-            others: List[Question] = []
-            topic_set = {t.lower() for t in self.topics}
-            for q in questions:
-                if any(tag.lower() in topic_set for tag in q.tags):
-                    prioritized.append(q)
-                else:
-                    others.append(q)
-            questions = prioritized + others
-
-        self._scripted_questions = questions
+        if self.topics:
+            # Prioritize questions most similar to the weak-spot / resume-gap
+            # topics, using local TF-IDF retrieval so free-form tags still match.
+            self._scripted_questions = rank_questions_for_topics(self.role, self.topics)
+        else:
+            self._scripted_questions = QUESTION_BANK.questions_for_role(self.role)
+
+    @property
+    def position(self) -> int:
+        """How many scripted questions have been asked (checkpointed by the Orchestrator)."""
+        return self._index
+
+    def seek(self, position: int) -> None:
+        self._index = max(0, min(position, len(self._scripted_questions)))
 
     def has_more_scripted(self) -> bool:
         return self._index < len(self._scripted_questions)
@@ -51,12 +58,14 @@ class InterviewerAgent:
         self._index += 1
         return q.text
 
-    def get_next_question(self, last_answer: Optional[str] = None) -> str:
+    def get_next_question(self, last_answer: Optional[str] = None, allow_llm: bool = True) -> str:
         """
         Return the next interview question.
 
         If we still have scripted questions, use them.
-        Otherwise, generate a contextual follow-up / new question with the LLM.
+        Otherwise, generate a contextual follow-up / new question with the LLM
+        (skipped when `allow_llm` is False, e.g. under admission-control load
+        shedding, in which case only cached follow-ups and the bank are used).
         """
         # First question: just use the scripted bank.
         if last_answer is None:
@@ -71,11 +80,6 @@ class InterviewerAgent:
             if scripted:
                 return scripted
 
-        # Otherwise ask the LLM for a follow-up or next question.
-        system_prompt = prompts.interviewer_system_prompt(
-            role=self.role, tone=self.tone, mode=self.mode, topics=self.topics or []
-        )
-
         # If we don't have a previous question, just ask for a new one.
         current_question = (
             self._scripted_questions[self._index - 1].text
@@ -83,6 +87,18 @@ class InterviewerAgent:
             else "Start the interview with a strong opening question."
         )
 
+        cached = followup_cache.lookup(self.role, self.tone, current_question, last_answer or "")
+        if cached:
+            return cached
+
+        if not allow_llm:
+            return self._next_scripted_question() or FALLBACK_FOLLOWUP
+
+        # Otherwise ask the LLM for a follow-up or next question.
+        system_prompt = prompts.interviewer_system_prompt(
+            role=self.role, tone=self.tone, mode=self.mode, topics=self.topics or []
+        )
+
         user_prompt = prompts.interviewer_followup_prompt(
             role=self.role,
             current_question=current_question,
@@ -91,14 +107,22 @@ class InterviewerAgent:
         )
 
         try:
-            next_q = llm.chat_completion(
+            started = time.perf_counter()
+            next_q = get_scheduler().run(
+                llm.chat_completion,
+                priority=Priority.INTERACTIVE,
+                user_id=self.user_id,
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 temperature=0.7,
                 max_output_tokens=256,  # Increased from 128
             )
+            followup_cache.record_miss_latency(time.perf_counter() - started)
             # Guardrail: avoid empty responses.
             if next_q.strip():
+                followup_cache.store(
+                    self.role, self.tone, current_question, last_answer or "", next_q.strip()
+                )
                 return next_q.strip()
         except Exception as e:
             print(f"Failed to generate follow-up question: {e}. Using scripted question.")
@@ -109,4 +133,4 @@ class InterviewerAgent:
             return fallback
         
         # Last resort: return a generic follow-up
-        return "Can you tell me more about your experience with that? Please provide specific examples."
+        return FALLBACK_FOLLOWUP
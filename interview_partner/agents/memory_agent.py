@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from interview_partner.config import settings
+from interview_partner.data.rubrics import RUBRIC_DESCRIPTIONS
+from interview_partner.services.memory_store import MemoryStore, get_memory_store
 from interview_partner.services.weak_spots import aggregate_weak_spots
+from interview_partner.services.write_behind import WriteBehindQueue, get_write_behind_queue
+
+# Striped per-user locks around every read-modify-write of a user document
+# (the write-behind flush and the one-off legacy migration), so a request
+# thread and the writer thread never interleave their saves.
+_USER_LOCKS = [threading.RLock() for _ in range(64)]
+
+
+def _user_lock(user_id: str) -> threading.RLock:
+    return _USER_LOCKS[int(hashlib.sha1(user_id.encode("utf-8")).hexdigest()[:8], 16) % len(_USER_LOCKS)]
 
 
 @dataclass
@@ -16,47 +31,137 @@ class MemoryAgent:
     Lightweight per-user memory / personalization layer.
 
     Stores:
-    - session summaries
+    - session headers (timestamp, role, summary, topics, aggregate scores)
     - aggregated weak-spot frequencies
+    - per-question evaluation bodies, kept in a separate document per session
+      so reading headers never parses answer text
+
+    Documents live in a `MemoryStore`; by default the backend chosen by
+    `settings.MEMORY_BACKEND`, rooted at `storage_dir`.
+
+    With `settings.MEMORY_WRITE_BEHIND`, new sessions are journaled and
+    written by a background thread; reads merge in still-pending sessions.
     """
 
     user_id: str
     storage_dir: Path = field(default=settings.DATA_DIR)
+    store: Optional[MemoryStore] = None
 
     def __post_init__(self) -> None:
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self._path = self.storage_dir / f"{self.user_id}_memory.json"
+        if self.store is None:
+            self.store = default_memory_store(self.storage_dir)
+        self._queue: Optional[WriteBehindQueue] = None
+        if settings.MEMORY_WRITE_BEHIND and self.store.journal_path is not None:
+            self._queue = _write_behind_queue(self.store)
 
     # Internal helpers ----------------------------------------------------- #
+    def _empty(self) -> Dict[str, Any]:
+        return {"user_id": self.user_id, "sessions": [], "weak_spots": {}}
+
+    def _read(self) -> Dict[str, Any]:
+        """Read what is stored, ignoring writes still staged in the queue."""
+        data = self.store.load_user(self.user_id)
+        if data is None:
+            return self._empty()
+
+        # Older files embedded full evaluations in every session; split them
+        # out once so later header reads stay small.
+        if _has_embedded_evaluations(data):
+            with _user_lock(self.user_id):
+                # Re-read under the lock: another thread may have migrated or
+                # appended sessions since the unlocked read above.
+                data = self.store.load_user(self.user_id) or self._empty()
+                if _has_embedded_evaluations(data):
+                    self._migrate_embedded_evaluations(data)
+        return data
+
     def _load(self) -> Dict[str, Any]:
-        if not self._path.exists():
-            return {"user_id": self.user_id, "sessions": [], "weak_spots": {}}
-        try:
-            with self._path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {"user_id": self.user_id, "sessions": [], "weak_spots": {}}
+        data = self._read()
+        pending = self._queue.pending_for(self.user_id) if self._queue else []
+        if pending:
+            sessions: List[Dict[str, Any]] = data.get("sessions", [])
+            known = {s.get("session_id") for s in sessions}
+            sessions.extend(p["session"] for p in pending if p["session"]["session_id"] not in known)
+            data["sessions"] = sessions
+            data["weak_spots"] = aggregate_weak_spots(sessions)
+        return data
 
     def _save(self, data: Dict[str, Any]) -> None:
-        with self._path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        self.store.save_user(self.user_id, data)
 
-    # Public API ----------------------------------------------------------- #
-    def add_session_summary(self, summary: Dict[str, Any]) -> None:
-        data = self._load()
+    def _write_sessions(self, payloads: List[Dict[str, Any]]) -> None:
+        """
+        Persist staged sessions in one load/aggregate/save pass.
+
+        Idempotent: sessions already stored (e.g. replayed from the journal
+        after a crash) are skipped.
+        """
+        with _user_lock(self.user_id):
+            self._write_sessions_locked(payloads)
+
+    def _write_sessions_locked(self, payloads: List[Dict[str, Any]]) -> None:
+        data = self._read()
         sessions: List[Dict[str, Any]] = data.get("sessions", [])
+        known = {s.get("session_id") for s in sessions}
+        added: List[Dict[str, Any]] = []
+        for payload in payloads:
+            header = payload["session"]
+            if header["session_id"] in known:
+                continue
+            # Body first, so a header never points at missing evaluations.
+            self.store.save_evaluations(
+                self.user_id, header["session_id"], payload.get("evaluations", [])
+            )
+            sessions.append(header)
+            added.append(header)
+            known.add(header["session_id"])
+
+        data["sessions"] = sessions
+        # Recompute weak-spot aggregates over all sessions.
+        data["weak_spots"] = aggregate_weak_spots(sessions)
+        self._save(data)
+        if added:
+            self.store.notify_sessions(self.user_id, added)
+
+    def _migrate_embedded_evaluations(self, data: Dict[str, Any]) -> None:
+        """Caller holds the user's lock."""
+        for session in data.get("sessions", []):
+            evaluations = session.pop("evaluations", None)
+            if evaluations is None:
+                continue
+            session.setdefault("session_id", legacy_session_id(session, evaluations))
+            session.setdefault("num_questions", len(evaluations))
+            session.setdefault("scores", aggregate_scores(evaluations))
+            self.store.save_evaluations(self.user_id, session["session_id"], evaluations)
+        self._save(data)
+
+    # Public API ----------------------------------------------------------- #
+    def add_session_summary(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a session summary and return its lightweight header.
+
+        The `evaluations` list (if present) is stored as its own document and
+        replaced in the header by `num_questions` and averaged `scores`.
+        With write-behind enabled this only journals the session and returns.
+        """
         timestamp = datetime.utcnow().isoformat() + "Z"
 
+        header = {key: value for key, value in summary.items() if key != "evaluations"}
+        evaluations: List[Dict[str, Any]] = summary.get("evaluations", [])
         session_record = {
+            "session_id": _new_session_id(timestamp),
             "timestamp": timestamp,
-            **summary,
+            **header,
+            "num_questions": len(evaluations),
+            "scores": aggregate_scores(evaluations),
         }
-        sessions.append(session_record)
-        data["sessions"] = sessions
+        payload = {"session": session_record, "evaluations": evaluations}
 
-        # Recompute weak-spot aggregates over all sessions.
-        data["weak_spots"] = aggregate_weak_spots(sessions)
-        self._save(data)
+        if self._queue is not None:
+            self._queue.stage(self.user_id, payload)
+        else:
+            self._write_sessions([payload])
+        return session_record
 
     def get_weak_spots(self, top_k: int = 6) -> List[str]:
         data = self._load()
@@ -68,8 +173,71 @@ class MemoryAgent:
         return [topic for topic, _ in sorted_topics[:top_k]]
 
     def get_latest_session(self) -> Optional[Dict[str, Any]]:
+        """Return the latest session header (without evaluation bodies)."""
         data = self._load()
         sessions: List[Dict[str, Any]] = data.get("sessions", [])
         if not sessions:
             return None
         return sessions[-1]
+
+    def load_evaluations(self, session_id: str) -> List[Dict[str, Any]]:
+        """Load the per-question evaluations for one stored session."""
+        for payload in self._queue.pending_for(self.user_id) if self._queue else []:
+            if payload["session"]["session_id"] == session_id:
+                return payload.get("evaluations", [])
+
+        return self.store.load_evaluations(self.user_id, session_id) or []
+
+
+def default_memory_store(storage_dir: Optional[Path] = None) -> MemoryStore:
+    """The store selected by `settings.MEMORY_BACKEND` (shared per root directory)."""
+    return get_memory_store(
+        settings.MEMORY_BACKEND,
+        root=storage_dir or settings.DATA_DIR,
+        fsync=settings.MEMORY_FSYNC != "never",
+    )
+
+
+def _new_session_id(timestamp: Optional[str] = None) -> str:
+    stamp = "".join(ch for ch in (timestamp or datetime.utcnow().isoformat()) if ch.isdigit())
+    return f"{stamp[:20]}-{uuid.uuid4().hex[:6]}"
+
+
+def legacy_session_id(session: Dict[str, Any], evaluations: List[Dict[str, Any]]) -> str:
+    """
+    Deterministic id for a stored session that predates session ids: its
+    timestamp digits plus a content hash, so every reader derives the same id.
+    """
+    stamp = "".join(ch for ch in str(session.get("timestamp") or "") if ch.isdigit())
+    digest = hashlib.sha1(
+        json.dumps([session.get("timestamp"), evaluations], sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"{stamp[:20]}-{digest[:6]}"
+
+
+def _has_embedded_evaluations(data: Dict[str, Any]) -> bool:
+    return any("evaluations" in s for s in data.get("sessions", []))
+
+
+def aggregate_scores(evaluations: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Average each rubric dimension across a session's evaluations."""
+    averages: Dict[str, float] = {}
+    for key in RUBRIC_DESCRIPTIONS:
+        values = [e.get("scores", {}).get(key) for e in evaluations]
+        values = [v for v in values if isinstance(v, (int, float))]
+        if values:
+            averages[key] = round(sum(values) / len(values), 2)
+    return averages
+
+
+def _write_behind_queue(store: MemoryStore) -> WriteBehindQueue:
+    def apply_batch(user_id: str, payloads: List[Dict[str, Any]]) -> None:
+        MemoryAgent(user_id=user_id, store=store)._write_sessions(payloads)
+
+    assert store.journal_path is not None
+    return get_write_behind_queue(
+        store.journal_path,
+        apply_batch,
+        fsync_policy=settings.MEMORY_FSYNC,
+        flush_interval=settings.MEMORY_FLUSH_INTERVAL,
+    )
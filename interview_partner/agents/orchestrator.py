@@ -1,18 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import uuid
+from dataclasses import InitVar, dataclass, field
 from typing import Any, Dict, List, Optional
 
 from interview_partner.config import settings
 from interview_partner.agents.interviewer import InterviewerAgent
 from interview_partner.agents.critic import CriticAgent
 from interview_partner.agents.memory_agent import MemoryAgent
+from interview_partner.core.admission import admission
+from interview_partner.core.metrics import metrics
+from interview_partner.data.models import Evaluation, SessionSummary, intern_tags
+from interview_partner.services.checkpoints import get_checkpoint_store
+from interview_partner.services.session_digest import SessionDigest
+from interview_partner.services.resume_rag import DocumentSource, extract_topics_from_resume
 
 
 @dataclass
 class Orchestrator:
     """
     Coordinates Interviewer, Critic, and Memory agents for a single user session.
+
+    After every turn the session state is checkpointed (see `to_state()` and
+    `services.checkpoints`) under `checkpoint_id`, so `restore()` can pick
+    the interview up again after a reconnect or worker restart.
     """
 
     user_id: str
@@ -22,29 +33,131 @@ class Orchestrator:
     max_questions: int = field(
         default_factory=lambda: settings.MAX_QUESTIONS
     )
+    # Only used to derive `resume_topics`; the documents themselves are not kept.
+    resume_text: InitVar[Optional[DocumentSource]] = None
+    job_description: InitVar[Optional[DocumentSource]] = None
 
     interviewer: InterviewerAgent = field(init=False)
     critic: CriticAgent = field(init=False)
     memory: MemoryAgent = field(init=False)
 
     current_question: Optional[str] = field(default=None, init=False)
-    evaluations: List[Dict[str, Any]] = field(default_factory=list, init=False)
+    evaluations: List[Evaluation] = field(default_factory=list, init=False)
     num_questions_asked: int = field(default=0, init=False)
     finished: bool = field(default=False, init=False)
+    resume_topics: List[str] = field(default_factory=list, init=False)
+    digest: SessionDigest = field(init=False)
+    checkpoint_id: str = field(default_factory=lambda: uuid.uuid4().hex, init=False)
 
-    def __post_init__(self) -> None:
+    def __post_init__(
+        self,
+        resume_text: Optional[DocumentSource],
+        job_description: Optional[DocumentSource],
+    ) -> None:
+        # Raises core.admission.ServiceBusy when upstream capacity is saturated.
+        admission.admit_session()
         self.memory = MemoryAgent(user_id=self.user_id)
         weak_topics: List[str] = []
         if self.mode == "drill":
             weak_topics = self.memory.get_weak_spots(top_k=5)
 
+        if resume_text is not None:
+            try:
+                self.resume_topics = extract_topics_from_resume(
+                    resume_text, job_description, user_id=self.user_id
+                )
+            except Exception as e:
+                print(f"[Orchestrator] Resume analysis failed: {e}")
+
+        topics = list(dict.fromkeys(weak_topics + self.resume_topics))
+        self._init_agents(topics or None)
+        self.digest = SessionDigest(role=self.role)
+
+    def _init_agents(self, topics: Optional[List[str]]) -> None:
         self.interviewer = InterviewerAgent(
             role=self.role,
             tone=self.tone,
             mode=self.mode,
-            topics=weak_topics or None,
+            topics=topics,
+            user_id=self.user_id,
         )
-        self.critic = CriticAgent()
+        self.critic = CriticAgent(user_id=self.user_id)
+
+    # Checkpointing ---------------------------------------------------------- #
+    def to_state(self, include_evaluations: bool = True) -> Dict[str, Any]:
+        """
+        Compact, JSON-serializable session state.
+
+        The digest is not stored (it is rebuilt from `evaluations`), nor is
+        the scripted question list (re-derived from role + topics; only the
+        interviewer's position in it is kept).
+        """
+        state: Dict[str, Any] = {
+            "checkpoint_id": self.checkpoint_id,
+            "user_id": self.user_id,
+            "role": self.role,
+            "mode": self.mode,
+            "tone": self.tone,
+            "max_questions": self.max_questions,
+            "topics": self.interviewer.topics,
+            "resume_topics": self.resume_topics,
+            "interviewer_position": self.interviewer.position,
+            "current_question": self.current_question,
+            "num_questions_asked": self.num_questions_asked,
+            "finished": self.finished,
+        }
+        if include_evaluations:
+            state["evaluations"] = [e.to_dict() for e in self.evaluations]
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "Orchestrator":
+        """
+        Rebuild a session from `to_state()` output.
+
+        Skips admission control and resume analysis: the session was already
+        admitted, and its topics are part of the state.
+        """
+        orch = cls.__new__(cls)
+        orch.checkpoint_id = state["checkpoint_id"]
+        orch.user_id = state["user_id"]
+        orch.role = state["role"]
+        orch.mode = state.get("mode", "normal")
+        orch.tone = state.get("tone", "neutral")
+        orch.max_questions = int(state.get("max_questions", settings.MAX_QUESTIONS))
+        orch.resume_topics = list(state.get("resume_topics") or [])
+        orch.memory = MemoryAgent(user_id=orch.user_id)
+        orch._init_agents(state.get("topics") or None)
+        orch.interviewer.seek(int(state.get("interviewer_position", 0)))
+        orch.current_question = state.get("current_question")
+        orch.num_questions_asked = int(state.get("num_questions_asked", 0))
+        orch.finished = bool(state.get("finished", False))
+        orch.evaluations = [Evaluation.from_dict(e) for e in state.get("evaluations") or []]
+        orch.digest = SessionDigest.from_evaluations(orch.role, orch.evaluations)
+        return orch
+
+    @classmethod
+    def restore(cls, checkpoint_id: str) -> Optional["Orchestrator"]:
+        """Load the latest checkpoint for `checkpoint_id`; None if there is none."""
+        state = get_checkpoint_store().load(checkpoint_id)
+        if state is None:
+            return None
+        try:
+            orch = cls.from_state(state)
+        except Exception as e:
+            print(f"[Orchestrator] Could not restore checkpoint {checkpoint_id}: {e}")
+            return None
+        metrics.incr("checkpoint.restored")
+        return orch
+
+    def checkpoint(self) -> None:
+        """Persist the current state; failures are logged, never raised into the turn."""
+        if not settings.CHECKPOINTS:
+            return
+        try:
+            get_checkpoint_store().save(self.checkpoint_id, self.to_state())
+        except Exception as e:
+            print(f"[Orchestrator] Checkpoint failed: {e}")
 
     # Public Orchestrator API ---------------------------------------------- #
     def start_interview(self) -> str:
@@ -56,13 +169,14 @@ class Orchestrator:
 
         self.current_question = self.interviewer.get_next_question(last_answer=None)
         self.num_questions_asked = 1
+        self.checkpoint()
         return self.current_question
 
     def submit_answer(self, answer: str) -> str:
         """
         Submit a candidate answer.
 
-        - Evaluates the answer with CriticAgent.
+        - Evaluates the answer with CriticAgent and folds it into the running digest.
         - Decides whether to continue or end.
         - Returns the next question or an end-of-interview message.
         """
@@ -74,47 +188,69 @@ class Orchestrator:
             self.current_question = self.interviewer.get_next_question(last_answer=None)
 
         question = self.current_question
+        # Under load shedding the turn stays responsive: local scoring and
+        # scripted / cached questions only.
+        allow_llm = not admission.degraded()
+        if not allow_llm:
+            metrics.incr("admission.degraded_turns")
         evaluation = self.critic.evaluate_answer(
             question=question,
             answer=answer,
             role=self.role,
+            allow_llm=allow_llm,
         )
         self.evaluations.append(evaluation)
+        self.digest.add(evaluation)
 
         # Decide whether to continue.
         if self.num_questions_asked >= self.max_questions:
             self.finished = True
+            self.checkpoint()
             return "Thank you, that concludes this mock interview."
 
         # Ask the interviewer for the next question.
-        next_q = self.interviewer.get_next_question(last_answer=answer)
+        next_q = self.interviewer.get_next_question(last_answer=answer, allow_llm=allow_llm)
         self.current_question = next_q
         self.num_questions_asked += 1
+        self.checkpoint()
         return next_q
 
-    def finalize_session(self) -> Dict[str, Any]:
+    def finalize_session(self) -> SessionSummary:
         """
         Produce a session summary, update long-term memory, and return the summary.
+
+        The summary shares this session's `evaluations` list rather than copying it.
         """
         summary_core = self.critic.summarize_session(
             evaluations=self.evaluations,
             role=self.role,
+            digest=self.digest,
+            allow_llm=not admission.degraded(),
         )
 
-        summary_record: Dict[str, Any] = {
-            "user_id": self.user_id,
-            "role": self.role,
-            "summary_text": summary_core["summary_text"],
-            "weak_spot_topics": summary_core.get("weak_spot_topics", []),
-            "strength_topics": summary_core.get("strength_topics", []),
-            "evaluations": self.evaluations,
-        }
+        summary = SessionSummary(
+            user_id=self.user_id,
+            role=self.role,
+            summary_text=summary_core["summary_text"],
+            weak_spot_topics=intern_tags(summary_core.get("weak_spot_topics", [])),
+            strength_topics=intern_tags(summary_core.get("strength_topics", [])),
+            evaluations=self.evaluations,
+        )
 
-        self.memory.add_session_summary(summary_record)
-        return summary_record
+        header = self.memory.add_session_summary(summary.to_dict())
+        summary.session_id = header["session_id"]
+        summary.timestamp = header["timestamp"]
+        summary.scores = header["scores"]
+        # The session now lives in long-term memory; the checkpoint is done.
+        if settings.CHECKPOINTS:
+            get_checkpoint_store().delete(self.checkpoint_id)
+        return summary
 
     def get_weak_spot_topics(self) -> List[str]:
         return self.memory.get_weak_spots()
 
     def get_latest_session(self) -> Optional[Dict[str, Any]]:
         return self.memory.get_latest_session()
+
+    def load_session_evaluations(self, session_id: str) -> List[Dict[str, Any]]:
+        return self.memory.load_evaluations(session_id)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Tuple
 
 try:
     # Optional: make local development easier by loading a .env file if present
@@ -24,11 +25,26 @@ def _load_env() -> None:
 _load_env()
 
 
+def _csv(*values: str) -> Tuple[str, ...]:
+    """Comma-separated env values as a tuple, blanks and duplicates dropped, order kept."""
+    items = (item.strip() for value in values for item in value.split(","))
+    return tuple(dict.fromkeys(item for item in items if item))
+
+
 @dataclass(frozen=True)
 class Settings:
     """Global configuration for the Interview Practice Partner project."""
 
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+    # Key pool (see core.key_pool): GEMINI_API_KEY first, then GEMINI_API_KEYS (comma-separated).
+    # Calls are spread across keys; a key that hits its quota (429) cools down.
+    GEMINI_API_KEYS: Tuple[str, ...] = _csv(os.getenv("GEMINI_API_KEY", ""), os.getenv("GEMINI_API_KEYS", ""))
+    # Text models to fall back to, in order, while every key is cooling down for the requested model
+    GEMINI_FALLBACK_MODELS: Tuple[str, ...] = _csv(os.getenv("GEMINI_FALLBACK_MODELS", ""))
+    KEY_COOLDOWN_S: float = float(os.getenv("KEY_COOLDOWN_S", "30"))  # first 429; doubles per repeat
+    KEY_COOLDOWN_MAX_S: float = float(os.getenv("KEY_COOLDOWN_MAX_S", "600"))
+    # Longest a call sleeps for a cooling key when every key / model is cooling down; longer fails fast
+    KEY_COOLDOWN_WAIT_MAX_S: float = float(os.getenv("KEY_COOLDOWN_WAIT_MAX_S", "10"))
     # Fast, cost-effective default text model
     DEFAULT_MODEL: str = os.getenv("GEMINI_MODEL_TEXT", "gemini-2.5-flash")
     CRITIC_MODEL: str = os.getenv("GEMINI_MODEL_CRITIC", "gemini-2.5-flash")
@@ -38,6 +54,72 @@ class Settings:
 
     # Where we store per-user memory JSON
     DATA_DIR: Path = PROJECT_ROOT / "storage"
+    # Memory store backend: flat (one directory) | sharded (hashed subdirs) | memory (tests)
+    MEMORY_BACKEND: str = os.getenv("MEMORY_BACKEND", "flat")
+
+    # Write-behind persistence for session summaries: finalize returns once the
+    # summary is journaled; a background writer batches the actual file updates.
+    MEMORY_WRITE_BEHIND: bool = os.getenv("MEMORY_WRITE_BEHIND", "1") != "0"
+    MEMORY_FSYNC: str = os.getenv("MEMORY_FSYNC", "always")  # always | batch | never
+    MEMORY_FLUSH_INTERVAL: float = float(os.getenv("MEMORY_FLUSH_INTERVAL", "0.5"))
+
+    # Per-user memory-mapped chunk vectors for resumes / job descriptions
+    VECTOR_INDEX_DIR: Path = Path(
+        os.getenv("VECTOR_INDEX_DIR", str(PROJECT_ROOT / "storage" / "vectors"))
+    )
+
+    # Per-turn checkpoints of in-progress sessions, rehydrated on reconnect / restart
+    CHECKPOINTS: bool = os.getenv("CHECKPOINTS", "1") != "0"
+    CHECKPOINT_DIR: Path = Path(
+        os.getenv("CHECKPOINT_DIR", str(PROJECT_ROOT / "storage" / "checkpoints"))
+    )
+    CHECKPOINT_FSYNC: bool = os.getenv("CHECKPOINT_FSYNC", "0") == "1"
+
+    # Memory budget for live sessions; idle ones beyond it are evicted to disk (see services.session_pool)
+    SESSION_POOL_BUDGET_MB: int = int(os.getenv("SESSION_POOL_BUDGET_MB", "256"))
+    SESSION_POOL_MIN_IDLE_S: float = float(os.getenv("SESSION_POOL_MIN_IDLE_S", "120"))
+    SESSION_SPILL_DIR: Path = Path(
+        os.getenv("SESSION_SPILL_DIR", str(PROJECT_ROOT / "storage" / "spill"))
+    )
+
+    # Question bank data files (index.json + one JSONL file per role)
+    QUESTION_BANK_DIR: Path = Path(
+        os.getenv("QUESTION_BANK_DIR", str(PROJECT_ROOT / "interview_partner" / "data" / "questions"))
+    )
+
+    # Reuse LLM follow-ups when a new answer is this similar (cosine) to a cached one
+    FOLLOWUP_CACHE_THRESHOLD: float = float(os.getenv("FOLLOWUP_CACHE_THRESHOLD", "0.85"))
+    FOLLOWUP_CACHE_SIZE: int = int(os.getenv("FOLLOWUP_CACHE_SIZE", "2048"))
+
+    # Critic cascade: local pre-score -> lite model -> CRITIC_MODEL, escalating
+    # only when a tier's confidence is low or its scores are borderline.
+    CRITIC_CASCADE: bool = os.getenv("CRITIC_CASCADE", "0") == "1"
+    CRITIC_LITE_MODEL: str = os.getenv("GEMINI_MODEL_CRITIC_LITE", "gemini-2.5-flash-lite")
+    CRITIC_ESCALATE_BELOW: float = float(os.getenv("CRITIC_ESCALATE_BELOW", "0.75"))
+
+    # Score trivially short / non-answers locally instead of calling the critic LLM
+    CRITIC_SKIP_TRIVIAL: bool = os.getenv("CRITIC_SKIP_TRIVIAL", "1") != "0"
+
+    # Import the GenAI SDK and open its connection in the background at startup (see core.llm.prewarm_client)
+    LLM_PREWARM: bool = os.getenv("LLM_PREWARM", "1") != "0"
+
+    # HTTP transport of the shared GenAI client (see core.http_pool); HTTP/2 needs httpx[http2]
+    LLM_HTTP_MAX_CONNECTIONS: int = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "32"))
+    LLM_HTTP_MAX_KEEPALIVE: int = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "16"))
+    LLM_HTTP_KEEPALIVE_S: float = float(os.getenv("LLM_HTTP_KEEPALIVE_S", "120"))
+    LLM_HTTP2: bool = os.getenv("LLM_HTTP2", "1") != "0"
+    LLM_TIMEOUT_S: float = float(os.getenv("LLM_TIMEOUT_S", "60"))  # per request
+
+    # Shared pool for all LLM / TTS / STT calls (see core.scheduler)
+    SCHEDULER_WORKERS: int = int(os.getenv("SCHEDULER_WORKERS", "8"))
+
+    # Admission control: refuse new sessions / degrade turns when Gemini is saturated
+    ADMISSION_MAX_IN_FLIGHT: int = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "32"))  # in flight + queued
+    ADMISSION_LATENCY_SLO_S: float = float(os.getenv("ADMISSION_LATENCY_SLO_S", "8"))
+
+    # Headless interview server (interview_partner.server)
+    SERVER_WORKERS: int = int(os.getenv("SERVER_WORKERS", "32"))  # threads for blocking agent calls
+    SERVER_SESSION_TTL: float = float(os.getenv("SERVER_SESSION_TTL", "3600"))  # idle seconds before reaping (server and app)
 
     # Max questions per interview session
     MIN_QUESTIONS: int = 5
@@ -1,4 +1,22 @@
 from __future__ import annotations
 
-# Convenience re-exports
-from .llm import chat_completion, get_client  # noqa: F401
+from importlib import import_module
+from typing import Any
+
+# Convenience re-exports, resolved on first access so that importing a
+# `core` submodule does not load the GenAI SDK.
+_LAZY = {
+    "chat_completion": ".llm",
+    "get_client": ".llm",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+from interview_partner.config import settings
+from interview_partner.core.metrics import metrics
+from interview_partner.core.scheduler import get_scheduler
+
+EWMA_ALPHA = 0.2
+DEGRADE_EXIT_LOAD = 0.7  # hysteresis: leave degraded mode only once load falls below this
+
+
+class ServiceBusy(RuntimeError):
+    """Raised when a new session is refused; retry after `retry_after` seconds."""
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__(f"Service is busy, please retry in {retry_after:.0f}s.")
+
+
+class AdmissionController:
+    """
+    Upstream-capacity guard for Gemini calls.
+
+    Load is the larger of:
+    - (calls in flight + calls queued in the scheduler) / `max_in_flight`
+    - EWMA call latency / `latency_slo_s`
+
+    At load >= 1 new sessions are refused with `ServiceBusy` and running
+    sessions switch to a degraded mode (scripted questions, local scoring),
+    which they leave once load drops below DEGRADE_EXIT_LOAD. LLM retries
+    are cut to one attempt while degraded, so workers do not sit in backoff.
+    """
+
+    def __init__(self, max_in_flight: int, latency_slo_s: float) -> None:
+        self.max_in_flight = max_in_flight
+        self.latency_slo_s = latency_slo_s
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._ewma_latency = 0.0
+        self._last_sample = time.perf_counter()
+        self._degraded = False
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count an upstream call as in flight and fold its latency into the EWMA."""
+        with self._lock:
+            self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._in_flight -= 1
+                self._ewma_latency += EWMA_ALPHA * (elapsed - self._ewma_latency)
+                self._last_sample = time.perf_counter()
+
+    def _latency(self) -> float:
+        """
+        EWMA latency, halved for every SLO interval without a new sample, so a
+        degraded (LLM-free) period cannot pin the old latency forever; caller
+        holds the lock.
+        """
+        if self.latency_slo_s <= 0:
+            return self._ewma_latency
+        idle = time.perf_counter() - self._last_sample
+        return self._ewma_latency * 0.5 ** (idle / self.latency_slo_s)
+
+    def load(self) -> float:
+        queued = get_scheduler().queued()
+        with self._lock:
+            pressure = (self._in_flight + queued) / max(1, self.max_in_flight)
+            latency = self._latency() / self.latency_slo_s if self.latency_slo_s > 0 else 0.0
+        return max(pressure, latency)
+
+    def degraded(self) -> bool:
+        """Whether turns should avoid LLM calls right now (with hysteresis)."""
+        load = self.load()
+        with self._lock:
+            if load >= 1.0 and not self._degraded:
+                metrics.incr("admission.degrade_entered")
+            self._degraded = load >= 1.0 or (self._degraded and load >= DEGRADE_EXIT_LOAD)
+            return self._degraded
+
+    def retry_after(self) -> float:
+        load = self.load()
+        with self._lock:
+            latency = self._latency() or 1.0
+        return max(1.0, min(60.0, latency * load))
+
+    def admit_session(self) -> None:
+        """Raise ServiceBusy instead of starting a session onto a saturated upstream."""
+        if self.degraded():
+            metrics.incr("admission.rejected")
+            raise ServiceBusy(self.retry_after())
+        metrics.incr("admission.admitted")
+
+    def max_retries(self, requested: int) -> int:
+        return 1 if self._degraded else requested
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight, ewma, degraded = self._in_flight, self._latency(), self._degraded
+        return {
+            "load": self.load(),
+            "in_flight": in_flight,
+            "ewma_latency_s": ewma,
+            "degraded": degraded,
+            "admitted": metrics.counter("admission.admitted"),
+            "rejected": metrics.counter("admission.rejected"),
+            "degraded_turns": metrics.counter("admission.degraded_turns"),
+        }
+
+
+admission = AdmissionController(
+    max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+    latency_slo_s=settings.ADMISSION_LATENCY_SLO_S,
+)
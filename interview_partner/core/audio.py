@@ -5,10 +5,8 @@ from typing import Optional
 import io
 import wave
 
-from google.genai import types  # type: ignore
-
 from interview_partner.config import settings
-from interview_partner.core.llm import get_client
+from interview_partner.core.llm import genai_types, get_client, routed_client
 
 
 def transcribe_audio_bytes(audio_bytes: bytes, mime_type: str = "audio/wav") -> str:
@@ -18,26 +16,28 @@ def transcribe_audio_bytes(audio_bytes: bytes, mime_type: str = "audio/wav") ->
     This uses a text+audio prompt: we ask Gemini to transcribe exactly and
     return just the transcript as plain text.
     """
-    client = get_client()
+    types = genai_types()
 
     # Build an audio Part from raw bytes
     audio_part = types.Part.from_bytes(data=audio_bytes, mime_type=mime_type)
 
-    response = client.models.generate_content(
-        model=settings.STT_MODEL,
-        contents=[
-            types.Content(
-                role="user",
-                parts=[
-                    types.Part.from_text(
-                        "Transcribe the spoken audio to plain text. "
-                        "Return ONLY the raw transcript, no extra commentary."
-                    ),
-                    audio_part,
-                ],
-            )
-        ],
-    )
+    # Spread over the key pool, but always on the STT model.
+    with routed_client(settings.STT_MODEL, allow_fallback=False) as (client, model):
+        response = client.models.generate_content(
+            model=model,
+            contents=[
+                types.Content(
+                    role="user",
+                    parts=[
+                        types.Part.from_text(
+                            "Transcribe the spoken audio to plain text. "
+                            "Return ONLY the raw transcript, no extra commentary."
+                        ),
+                        audio_part,
+                    ],
+                )
+            ],
+        )
 
     # Validate response
     if response is None:
@@ -62,23 +62,25 @@ def text_to_speech_bytes(text: str) -> Optional[bytes]:
     if not text.strip():
         return None
 
-    client = get_client()
+    get_client()  # raises without an API key
+    types = genai_types()
 
     try:
-        response = client.models.generate_content(
-            model=settings.TTS_MODEL,
-            contents=text,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name="Kore"  # you can change this voice if you want
+        with routed_client(settings.TTS_MODEL, allow_fallback=False) as (client, model):
+            response = client.models.generate_content(
+                model=model,
+                contents=text,
+                config=types.GenerateContentConfig(
+                    response_modalities=["AUDIO"],
+                    speech_config=types.SpeechConfig(
+                        voice_config=types.VoiceConfig(
+                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                                voice_name="Kore"  # you can change this voice if you want
+                            )
                         )
-                    )
+                    ),
                 ),
-            ),
-        )
+            )
     except Exception as e:
         # Fail gracefully; caller can fall back to text-only behavior.
         print(f"TTS generation failed: {e}")
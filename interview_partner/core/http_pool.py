@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import importlib.util
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+from interview_partner.config import settings
+from interview_partner.core.metrics import metrics
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (pip install "httpx[http2]")."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpPool:
+    """
+    Connection-pool settings and usage counters for the GenAI SDK's httpx client.
+
+    - `client_args()` is passed as `HttpOptions.client_args`: pool limits,
+      keep-alive expiry, HTTP/2 when `h2` is installed, and request /
+      response hooks that count traffic
+    - `attach()` registers the httpx client the SDK built, so `stats()` can
+      report open / idle connections from its pool
+    - every TCP connect (httpcore's "connection.connect_tcp" trace event,
+      which a reused connection never fires) counts as opened: with
+      keep-alive working, "connections_opened" stays flat while "requests"
+      grows
+    - `track()` wraps each SDK call, so "in_flight" also drops for calls
+      that time out, fail or are cancelled before any response arrives
+
+    One httpx client is shared by all threads (httpx clients are
+    thread-safe); connections are reused across sessions and turns.
+    """
+
+    def __init__(self, max_connections: int, max_keepalive: int, keepalive_expiry_s: float, http2: bool) -> None:
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.keepalive_expiry_s = keepalive_expiry_s
+        self.http2 = http2 and http2_available()
+        self._lock = threading.Lock()
+        self._clients: List[Any] = []
+        self._in_flight = 0
+
+    def client_args(self) -> Dict[str, Any]:
+        import httpx
+
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive,
+                keepalive_expiry=self.keepalive_expiry_s,
+            ),
+            "http2": self.http2,
+            "event_hooks": {"request": [self._on_request], "response": [self._on_response]},
+        }
+
+    def attach(self, httpx_client: Any) -> None:
+        if httpx_client is not None:
+            with self._lock:
+                self._clients.append(httpx_client)
+
+    def _connections(self) -> List[Any]:
+        """Connections in the attached clients' pools (httpcore objects; empty if unavailable)."""
+        out: List[Any] = []
+        for client in self._clients:
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            out.extend(getattr(pool, "connections", None) or [])
+        return out
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count one SDK call as in flight until it returns, raises or is cancelled."""
+        with self._lock:
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _on_request(self, request: Any) -> None:
+        metrics.incr("llm.http.requests")
+        request.extensions.setdefault("trace", self._trace)
+
+    def _trace(self, event: str, info: Dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.complete":
+            metrics.incr("llm.http.connections_opened")
+
+    def _on_response(self, response: Any) -> None:
+        metrics.incr(f"llm.http.{response.http_version}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            connections = self._connections()
+            in_flight = self._in_flight
+        idle = sum(1 for c in connections if c.is_idle())
+        requests = metrics.counter("llm.http.requests")
+        opened = metrics.counter("llm.http.connections_opened")
+        return {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "open_connections": len(connections),
+            "idle_connections": idle,
+            "in_flight": in_flight,
+            "requests": requests,
+            "connections_opened": opened,
+            "reuse_rate": 1 - opened / requests if requests else 0.0,
+        }
+
+
+http_pool = HttpPool(
+    max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+    max_keepalive=settings.LLM_HTTP_MAX_KEEPALIVE,
+    keepalive_expiry_s=settings.LLM_HTTP_KEEPALIVE_S,
+    http2=settings.LLM_HTTP2,
+)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, List, Tuple
+
+_FENCE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.I)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+def loads_tolerant(raw: str) -> Tuple[Any, bool]:
+    """
+    Parse model JSON output, repairing common damage locally.
+
+    Returns `(value, repaired)`. Handles, in order:
+    - markdown code fences and prose around the outermost object / array
+    - trailing commas
+    - truncation: an unterminated string is closed, a dangling key, colon,
+      comma or partial literal is dropped, and open brackets are closed
+
+    Raises `ValueError` if the text still cannot be parsed.
+    """
+    try:
+        return json.loads(raw), False
+    except (TypeError, ValueError):
+        pass
+
+    text = _FENCE.sub("", raw or "").strip()
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        raise ValueError("no JSON object or array found")
+    text = text[min(starts) :]
+
+    for candidate in (text, _close_truncated(text)):
+        candidate = _TRAILING_COMMA.sub(r"\1", candidate)
+        try:
+            return json.loads(candidate), True
+        except ValueError:
+            # Extra text after a complete value ("{...} Hope this helps").
+            try:
+                value, _ = json.JSONDecoder().raw_decode(candidate)
+                return value, True
+            except ValueError:
+                continue
+    raise ValueError("JSON could not be repaired")
+
+
+def _close_truncated(text: str) -> str:
+    """Close an output cut off mid-value (e.g. by max_output_tokens)."""
+    stack: List[str] = []
+    in_string = False
+    escaped = False
+    last_safe = 0  # end of the last complete value / container member
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+                last_safe = i + 1
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+            last_safe = i + 1
+        elif ch in "}]":
+            if stack:
+                stack.pop()
+            last_safe = i + 1
+        elif ch.isalnum() or ch in ".-+":
+            last_safe = i + 1
+
+    out = text
+    if in_string:
+        out = (out[:-1] if escaped else out) + '"'
+    else:
+        out = out[:last_safe]
+    out = out.rstrip()
+
+    # A partial literal or number left by the cut ("tr", "7.") is dropped.
+    out = re.sub(r"(?<![\w\"])(?!(?:true|false|null)$)[A-Za-z]+$", "", out).rstrip()
+    out = re.sub(r"(?<=\d)[.eE+-]+$", "", out)
+    out = re.sub(r"-$", "", out)
+
+    # Inside an object, drop a dangling `"key"` / `"key":` / trailing comma.
+    while stack and stack[-1] == "}":
+        trimmed = re.sub(r'(,|\{)\s*"[^"\\]*"\s*:?\s*$', r"\1", out)
+        trimmed = re.sub(r",\s*$", "", trimmed)
+        if trimmed == out:
+            break
+        out = trimmed
+    out = re.sub(r",\s*$", "", out)
+    if out.endswith(":"):
+        out += " null"
+    return out + "".join(reversed(stack))
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from interview_partner.config import settings
+from interview_partner.core.metrics import metrics
+
+EWMA_ALPHA = 0.2
+THROTTLE_HALF_LIFE_S = 60.0  # how fast past 429s stop counting against a lane
+THROTTLE_PENALTY = 2.0  # one recent 429 weighs like two calls in flight
+
+_RETRY_DELAY = re.compile(r"retryDelay['\"]?\s*:\s*['\"]?(\d+(?:\.\d+)?)s")
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """True for quota / rate-limit errors (HTTP 429, RESOURCE_EXHAUSTED)."""
+    if getattr(error, "code", None) == 429:
+        return True
+    text = str(error)
+    return text.startswith("429 ") or "RESOURCE_EXHAUSTED" in text
+
+
+def retry_delay(error: BaseException) -> Optional[float]:
+    """The server's suggested retry delay (RetryInfo.retryDelay), if the error carries one."""
+    match = _RETRY_DELAY.search(str(error))
+    return float(match.group(1)) if match else None
+
+
+@dataclass(frozen=True)
+class Route:
+    """Where one call goes: a key (by position in GEMINI_API_KEYS) and a model."""
+
+    key_index: int
+    api_key: str = field(repr=False)  # keep keys out of logs and tracebacks
+    model: str
+
+    @property
+    def label(self) -> str:
+        return f"key{self.key_index}"  # never log the key itself
+
+
+@dataclass
+class _Lane:
+    """Observed health of one (key, model) pair; Gemini quotas are per project and model."""
+
+    in_flight: int = 0
+    calls: int = 0
+    ewma_latency_s: float = 0.0
+    throttle_score: float = 0.0  # decayed count of recent 429s
+    throttle_at: float = 0.0
+    strikes: int = 0  # consecutive 429s; drives the cooldown backoff
+    cooldown_until: float = 0.0
+
+    def throttle(self, now: float) -> float:
+        self.throttle_score = self.decayed_throttle(now) + 1.0
+        self.throttle_at = now
+        return self.throttle_score
+
+    def decayed_throttle(self, now: float) -> float:
+        if not self.throttle_score:
+            return 0.0
+        return self.throttle_score * math.pow(0.5, (now - self.throttle_at) / THROTTLE_HALF_LIFE_S)
+
+    def load(self, now: float) -> float:
+        """Lower is more headroom: calls in flight, latency against the SLO, recent 429s."""
+        return (
+            self.in_flight
+            + self.ewma_latency_s / settings.ADMISSION_LATENCY_SLO_S
+            + THROTTLE_PENALTY * self.decayed_throttle(now)
+        )
+
+
+class KeyPool:
+    """
+    Quota-aware routing of Gemini calls over several API keys and models.
+
+    - `choose(model)` picks, among the keys not cooling down for `model`,
+      the one with the most headroom (fewest calls in flight, lowest latency
+      EWMA, fewest recent 429s; least used on ties, so idle keys share the
+      load)
+    - only if every key is cooling down for `model` does it move to the
+      fallback models, in order; with nothing available it returns the lane
+      whose cooldown ends first
+    - `track(route)` wraps the call: a 429 puts the (key, model) lane on
+      cooldown for the server's retryDelay, else `cooldown_s` doubled per
+      consecutive 429 up to `max_cooldown_s`; a success resets the backoff
+
+    Per-key counters go to `core.metrics` as "key_pool.<keyN>.*"; see `stats()`.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        fallback_models: Sequence[str] = (),
+        cooldown_s: float = 30.0,
+        max_cooldown_s: float = 600.0,
+    ) -> None:
+        self.keys = tuple(keys)
+        self.fallback_models = tuple(fallback_models)
+        self.cooldown_s = cooldown_s
+        self.max_cooldown_s = max_cooldown_s
+        self._lanes: Dict[Tuple[int, str], _Lane] = {}
+        self._lock = threading.Lock()
+
+    def _lane(self, key_index: int, model: str) -> _Lane:
+        """Caller holds the lock."""
+        lane = self._lanes.get((key_index, model))
+        if lane is None:
+            lane = self._lanes[(key_index, model)] = _Lane()
+        return lane
+
+    def choose(self, model: str, allow_fallback: bool = True) -> Route:
+        if not self.keys:
+            raise RuntimeError(
+                "GEMINI_API_KEY is not set. "
+                "Create a .env file with GEMINI_API_KEY=your_key_here."
+            )
+        models = [model]
+        if allow_fallback:
+            models += [m for m in self.fallback_models if m != model]
+        now = time.time()
+        with self._lock:
+            for rank, candidate in enumerate(models):
+                ready = []
+                for i in range(len(self.keys)):
+                    lane = self._lane(i, candidate)
+                    if lane.cooldown_until <= now:
+                        ready.append((lane.load(now), lane.calls, i))
+                if ready:
+                    if rank:
+                        metrics.incr("key_pool.fallback_model")
+                    i = min(ready)[2]
+                    return Route(i, self.keys[i], candidate)
+            # Everything is cooling down: take whatever recovers first.
+            _, i, candidate = min(
+                (self._lane(i, m).cooldown_until, i, m) for m in models for i in range(len(self.keys))
+            )
+        metrics.incr("key_pool.all_cooling")
+        return Route(i, self.keys[i], candidate)
+
+    def cooldown_remaining(self, model: str, allow_fallback: bool = True) -> float:
+        """Seconds until some key (or fallback model) can take `model` again; 0.0 if one can now."""
+        models = [model, *self.fallback_models] if allow_fallback else [model]
+        now = time.time()
+        with self._lock:
+            first = min(
+                (self._lane(i, m).cooldown_until for m in models for i in range(len(self.keys))),
+                default=now,
+            )
+        return max(0.0, first - now)
+
+    @contextmanager
+    def track(self, route: Route) -> Iterator[None]:
+        """Account one call on `route`; a rate-limit error puts the lane on cooldown."""
+        with self._lock:
+            lane = self._lane(route.key_index, route.model)
+            lane.in_flight += 1
+            lane.calls += 1
+        metrics.incr(f"key_pool.{route.label}.calls")
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            if is_rate_limited(e):
+                self.throttle(route, retry_delay(e))
+            else:
+                metrics.incr(f"key_pool.{route.label}.errors")
+            raise
+        else:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                lane.ewma_latency_s += EWMA_ALPHA * (elapsed - lane.ewma_latency_s)
+                lane.strikes = 0
+        finally:
+            with self._lock:
+                lane.in_flight -= 1
+
+    def throttle(self, route: Route, delay: Optional[float] = None) -> float:
+        """Put the route's lane on cooldown; returns the cooldown in seconds."""
+        now = time.time()
+        with self._lock:
+            lane = self._lane(route.key_index, route.model)
+            lane.throttle(now)
+            lane.strikes += 1
+            cooldown = delay if delay is not None else self.cooldown_s * 2 ** (lane.strikes - 1)
+            cooldown = min(cooldown, self.max_cooldown_s)
+            lane.cooldown_until = max(lane.cooldown_until, now + cooldown)
+        metrics.incr(f"key_pool.{route.label}.throttled")
+        print(f"[KeyPool] {route.label} / {route.model} rate-limited; cooling down for {cooldown:.0f}s.")
+        return cooldown
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        keys: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            lanes = sorted(self._lanes.items())
+        for (i, model), lane in lanes:
+            label = f"key{i}"
+            entry = keys.setdefault(
+                label,
+                {
+                    "calls": metrics.counter(f"key_pool.{label}.calls"),
+                    "throttled": metrics.counter(f"key_pool.{label}.throttled"),
+                    "errors": metrics.counter(f"key_pool.{label}.errors"),
+                    "models": {},
+                },
+            )
+            entry["models"][model] = {
+                "in_flight": lane.in_flight,
+                "ewma_latency_s": lane.ewma_latency_s,
+                "cooling_for_s": max(0.0, lane.cooldown_until - now),
+            }
+        return {
+            "keys": len(self.keys),
+            "fallback_models": list(self.fallback_models),
+            "fallback_calls": metrics.counter("key_pool.fallback_model"),
+            "all_cooling": metrics.counter("key_pool.all_cooling"),
+            "per_key": keys,
+        }
+
+
+key_pool = KeyPool(
+    keys=settings.GEMINI_API_KEYS,
+    fallback_models=settings.GEMINI_FALLBACK_MODELS,
+    cooldown_s=settings.KEY_COOLDOWN_S,
+    max_cooldown_s=settings.KEY_COOLDOWN_MAX_S,
+)
@@ -1,29 +1,117 @@
 from __future__ import annotations
 
+import threading
 import time
-from typing import Any, Optional
-
-from google import genai  # type: ignore
-from google.genai import types  # type: ignore
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
 
 from interview_partner.config import settings
+from interview_partner.core.admission import admission
+from interview_partner.core.http_pool import http_pool
+from interview_partner.core.key_pool import is_rate_limited, key_pool
+from interview_partner.core.metrics import metrics
+
+if TYPE_CHECKING:  # the SDK takes ~0.7 s to import; it is loaded on first use
+    from google import genai  # type: ignore
+
+_clients: Dict[str, "genai.Client"] = {}  # one per API key
+_client_lock = threading.Lock()
+
+
+def genai_types() -> Any:
+    """`google.genai.types`, imported on first call (cached by the import system)."""
+    from google.genai import types  # type: ignore
 
-_client: Optional[genai.Client] = None
+    return types
 
 
-def get_client() -> genai.Client:
+def get_client(api_key: Optional[str] = None) -> "genai.Client":
     """
-    Return a singleton Gemini GenAI client configured with GEMINI_API_KEY.
+    Return the shared Gemini GenAI client for `api_key` (default: the first
+    key in GEMINI_API_KEYS, i.e. GEMINI_API_KEY).
+
+    The SDK is imported here, not at module import, so importing the agents
+    stays cheap; `prewarm_client()` pays the cost in the background. Each
+    client (and its connection pool, see `core.http_pool`) is shared by all
+    threads; the lock only guards its creation.
+    """
+    key = api_key or next(iter(settings.GEMINI_API_KEYS), "")
+    client = _clients.get(key)
+    if client is None:
+        with _client_lock:
+            client = _clients.get(key)
+            if client is None:
+                if not key:
+                    raise RuntimeError(
+                        "GEMINI_API_KEY is not set. "
+                        "Create a .env file with GEMINI_API_KEY=your_key_here."
+                    )
+                started = time.perf_counter()
+                from google import genai  # type: ignore
+
+                client = genai.Client(
+                    api_key=key,
+                    http_options=genai_types().HttpOptions(
+                        timeout=int(settings.LLM_TIMEOUT_S * 1000),  # milliseconds
+                        client_args=http_pool.client_args(),
+                    ),
+                )
+                # The SDK has no public handle on its httpx client; pool stats are best-effort.
+                http_pool.attach(getattr(getattr(client, "_api_client", None), "_httpx_client", None))
+                _clients[key] = client
+                metrics.observe("llm.client_init_s", time.perf_counter() - started)
+    return client
+
+
+@contextmanager
+def routed_client(model: str, allow_fallback: bool = True) -> Iterator[Tuple["genai.Client", str]]:
+    """
+    Client and model for one call, picked by the key pool (see `core.key_pool`).
+
+    The call's latency and any 429 are fed back into the routing, so wrap
+    exactly one request. `allow_fallback=False` pins the model (TTS / STT).
     """
-    global _client
-    if _client is None:
-        if not settings.GEMINI_API_KEY:
-            raise RuntimeError(
-                "GEMINI_API_KEY is not set. "
-                "Create a .env file with GEMINI_API_KEY=your_key_here."
-            )
-        _client = genai.Client(api_key=settings.GEMINI_API_KEY)
-    return _client
+    route = key_pool.choose(model, allow_fallback=allow_fallback)
+    client = get_client(route.api_key)
+    with key_pool.track(route), http_pool.track():
+        yield client, route.model
+
+
+_prewarm_thread: Optional[threading.Thread] = None
+
+
+def prewarm_client() -> Optional[threading.Thread]:
+    """
+    Import the SDK, build the client and open its HTTPS connection on a
+    daemon thread, so the first real question does not pay for them.
+
+    - one light authenticated request (model metadata) does DNS, TLS and the
+      connection pool set-up
+    - warms one client per configured key
+    - a no-op without an API key or with `LLM_PREWARM=0`; called once per
+      process (later calls return the same thread)
+    - failures are printed and ignored: the first real call simply pays
+    """
+    global _prewarm_thread
+    if not settings.LLM_PREWARM or not settings.GEMINI_API_KEYS:
+        return None
+    with _client_lock:
+        if _prewarm_thread is not None:
+            return _prewarm_thread
+
+        def _prewarm() -> None:
+            for key in settings.GEMINI_API_KEYS:
+                started = time.perf_counter()
+                try:
+                    get_client(key).models.get(model=settings.DEFAULT_MODEL)
+                except Exception as e:
+                    print(f"[llm] Client pre-warm failed: {e}")
+                    return
+                metrics.observe("llm.prewarm_s", time.perf_counter() - started)
+
+        _prewarm_thread = threading.Thread(target=_prewarm, name="genai-prewarm", daemon=True)
+        _prewarm_thread.start()
+    return _prewarm_thread
 
 
 def chat_completion(
@@ -34,6 +122,7 @@ def chat_completion(
     temperature: float = 0.4,
     max_output_tokens: int = 512,
     json_mode: bool = False,
+    response_schema: Optional[dict] = None,
     max_retries: int = 3,
 ) -> str:
     """
@@ -41,10 +130,18 @@ def chat_completion(
 
     - `system_prompt` is inlined before the `user_prompt`.
     - When `json_mode=True`, we set `response_mime_type="application/json"`
-      so the model returns a JSON *string*, which the caller can parse.
-    - Retries up to `max_retries` times with exponential backoff on failures.
+      so the model returns a JSON *string*, which the caller can parse;
+      `response_schema` additionally constrains its shape.
+    - Retries up to `max_retries` times with exponential backoff on failures
+      (a single attempt while admission control reports saturation).
+    - Each attempt is routed to the key / model with the most headroom
+      (`routed_client`); after a 429 the next attempt goes straight to
+      another key or fallback model when one is available, else waits out
+      the shortest remaining cooldown (raising instead if that is longer
+      than `KEY_COOLDOWN_WAIT_MAX_S`).
     """
-    client = get_client()
+    get_client()  # fail fast, before any retry / backoff, when no key is configured
+    requested_model = model or settings.DEFAULT_MODEL
 
     if system_prompt:
         prompt = f"{system_prompt.strip()}\n\nUser:\n{user_prompt.strip()}"
@@ -58,22 +155,27 @@ def chat_completion(
     if json_mode:
         # Ask Gemini explicitly for JSON output
         config_kwargs["response_mime_type"] = "application/json"
+        if response_schema is not None:
+            config_kwargs["response_schema"] = response_schema
 
+    types = genai_types()
     gen_config = types.GenerateContentConfig(**config_kwargs)
 
+    max_retries = admission.max_retries(max_retries)
     last_error = None
     for attempt in range(max_retries):
         try:
-            response = client.models.generate_content(
-                model=model or settings.DEFAULT_MODEL,
-                contents=[
-                    types.Content(
-                        role="user",
-                        parts=[types.Part.from_text(text=prompt)],
-                    )
-                ],
-                config=gen_config,
-            )
+            with admission.track(), routed_client(requested_model) as (client, routed_model):
+                response = client.models.generate_content(
+                    model=routed_model,
+                    contents=[
+                        types.Content(
+                            role="user",
+                            parts=[types.Part.from_text(text=prompt)],
+                        )
+                    ],
+                    config=gen_config,
+                )
 
             if response is None:
                 raise RuntimeError("Gemini API returned None response. Check your API key and quota.")
@@ -124,6 +226,16 @@ def chat_completion(
         except Exception as e:
             last_error = e
             if attempt < max_retries - 1:
+                if is_rate_limited(e):
+                    wait_time = key_pool.cooldown_remaining(requested_model)
+                    if not wait_time:
+                        print(f"Rate-limited on attempt {attempt + 1}/{max_retries}. Retrying on another key / model...")
+                        continue
+                    if wait_time > settings.KEY_COOLDOWN_WAIT_MAX_S:
+                        raise  # every key / model is cooling down for longer than a caller should wait
+                    print(f"Rate-limited on attempt {attempt + 1}/{max_retries}; every key cooling down. Retrying in {wait_time:.1f}s...")
+                    time.sleep(wait_time)
+                    continue
                 wait_time = 2 ** attempt
                 print(f"API error on attempt {attempt + 1}/{max_retries}: {e}. Retrying in {wait_time}s...")
                 time.sleep(wait_time)
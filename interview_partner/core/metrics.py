@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+
+class Metrics:
+    """
+    Tiny in-process metrics registry (counters + value summaries).
+
+    Counters are plain integers; observations keep count / sum / max so
+    callers can report rates and mean latencies without extra dependencies.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._values: Dict[str, Dict[str, float]] = {}
+
+    def incr(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            stats = self._values.setdefault(name, {"count": 0, "sum": 0.0, "max": 0.0})
+            stats["count"] += 1
+            stats["sum"] += value
+            stats["max"] = max(stats["max"], value)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Observe the wall-clock seconds spent inside the block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def counter(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def mean(self, name: str) -> float:
+        with self._lock:
+            stats = self._values.get(name)
+            return stats["sum"] / stats["count"] if stats and stats["count"] else 0.0
+
+    def snapshot(self, prefix: str = "") -> Dict[str, Any]:
+        """Counters and value summaries (with `mean`) whose names start with `prefix`."""
+        with self._lock:
+            out: Dict[str, Any] = {
+                k: v for k, v in self._counters.items() if k.startswith(prefix)
+            }
+            for k, stats in self._values.items():
+                if k.startswith(prefix):
+                    mean = stats["sum"] / stats["count"] if stats["count"] else 0.0
+                    out[k] = {**stats, "mean": mean}
+            return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._values.clear()
+
+
+metrics = Metrics()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List
+
+from interview_partner.data.rubrics import RUBRIC_DESCRIPTIONS
 
 
 def interviewer_system_prompt(
@@ -101,6 +103,35 @@ Return a STRICT JSON object with the following structure:
 """.strip()
 
 
+def critic_response_schema(with_certainty: bool = False) -> Dict[str, Any]:
+    """
+    Gemini `response_schema` matching CRITIC_JSON_SCHEMA_DESCRIPTION, with one
+    required 0-10 integer per rubric key.
+    """
+    properties: Dict[str, Any] = {
+        "scores": {
+            "type": "OBJECT",
+            "properties": {
+                k: {"type": "INTEGER", "minimum": 0, "maximum": 10} for k in RUBRIC_DESCRIPTIONS
+            },
+            "required": list(RUBRIC_DESCRIPTIONS),
+        },
+        "weak_spots": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "strengths": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "comments": {"type": "STRING"},
+    }
+    required = ["scores", "weak_spots", "strengths", "comments"]
+    if with_certainty:
+        properties["certainty"] = {"type": "NUMBER", "minimum": 0, "maximum": 1}
+        required.append("certainty")
+    return {
+        "type": "OBJECT",
+        "properties": properties,
+        "required": required,
+        "propertyOrdering": required,
+    }
+
+
 def critic_system_prompt() -> str:
     """
     System prompt for the CriticAgent, describing the JSON rubric.
@@ -119,10 +150,19 @@ Rules:
 """.strip()
 
 
-def critic_user_prompt(question: str, answer: str, role: str) -> str:
+def critic_user_prompt(question: str, answer: str, role: str, with_certainty: bool = False) -> str:
     """
     User prompt for evaluating a single Q&A pair.
+
+    `with_certainty` asks for an extra top-level "certainty" field, used by the
+    critic cascade to decide whether to escalate to the full model.
     """
+    certainty_text = ""
+    if with_certainty:
+        certainty_text = (
+            'Also include a top-level "certainty" field (0.0-1.0): how sure you are '
+            "that a more careful evaluator would give the same scores.\n"
+        )
     return f"""
 Evaluate the following {role} interview answer.
 
@@ -134,7 +174,7 @@ Answer:
 
 {answer}
 
-Return ONLY the JSON object described above.
+{certainty_text}Return ONLY the JSON object described above.
 """.strip()
 
 
@@ -144,7 +184,8 @@ def session_summary_system_prompt() -> str:
     """
     return """
 You are an interview coach summarizing a full mock interview session.
-You are given per-question evaluations and must produce a concise review.
+You are given aggregated evaluation data (average scores, topic frequencies and
+the most recent answers) and must produce a concise review.
 
 Return a STRICT JSON object:
 
@@ -158,16 +199,64 @@ Do NOT include any other keys or any text outside the JSON object.
 """.strip()
 
 
-def session_summary_user_prompt(role: str, evaluations_json: str) -> str:
+def session_summary_user_prompt(role: str, digest_json: str) -> str:
     """
-    User prompt for summarizing all evaluations into the JSON summary object.
+    User prompt for summarizing a session digest into the JSON summary object.
     """
     return f"""
 You are summarizing a completed mock interview for the role: {role}.
 
-Here is the per-question evaluation data as JSON:
+Here is the session's evaluation digest as JSON:
 
-{evaluations_json}
+{digest_json}
 
 Create the JSON summary object described above.
 """.strip()
+
+
+def question_generation_system_prompt() -> str:
+    """
+    System prompt for the offline question-bank expansion pipeline.
+    """
+    return """
+You are an experienced hiring manager writing a bank of mock interview questions.
+
+Return a STRICT JSON object:
+
+{
+  "questions": [
+    {
+      "text": string,     // one interview question, a single sentence or two
+      "topic": string,    // snake_case topic, e.g. "system_design"
+      "tags": [string]    // 2-4 snake_case skill tags, e.g. ["scalability", "caching"]
+    }
+  ]
+}
+
+Rules:
+- Questions must be concrete and experience- or scenario-based.
+- Do not repeat or lightly reword the example questions.
+- Vary difficulty and angle (behavioral, situational, technical depth).
+- Do NOT include any text outside the JSON object.
+""".strip()
+
+
+def question_generation_user_prompt(
+    role: str, topic: str, count: int, examples: List[str], angle: str = ""
+) -> str:
+    """
+    User prompt asking for `count` new questions for one role/topic pair,
+    optionally from a given angle (varied per batch).
+    """
+    examples_text = "\n".join(f"- {e}" for e in examples) or "- (none yet)"
+    angle_text = f"\nAngle for this batch: {angle}." if angle else ""
+    return f"""
+Write {count} new interview questions for the role: {role}.
+Focus topic: {topic}.{angle_text}
+
+Existing questions to avoid duplicating:
+
+{examples_text}
+
+Return ONLY the JSON object described above.
+""".strip()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, Optional, TypeVar
+
+from interview_partner.config import settings
+from interview_partner.core.metrics import metrics
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """Work classes, most urgent first."""
+
+    INTERACTIVE = 0  # the candidate is waiting on this turn (next question, evaluation)
+    STT = 1
+    TTS_PREFETCH = 2
+    BACKGROUND = 3  # summaries, analytics, offline jobs
+
+
+@dataclass
+class _Task:
+    fn: Callable[[], Any]
+    future: Future
+    priority: Priority
+    user_id: str
+    enqueued: float = field(default_factory=time.perf_counter)
+
+
+class Scheduler:
+    """
+    Central, bounded worker pool for LLM / TTS / STT calls.
+
+    - strict priority between classes (see `Priority`), except that a task
+      waiting longer than `aging_s` is served next regardless of class, so
+      background work is never starved outright
+    - within a class, per-user FIFO queues served round-robin, so one busy
+      user cannot crowd out the others
+    - at most `workers` calls in flight process-wide
+
+    Submitting from a worker thread runs the call inline (no nested queueing,
+    so no pool deadlock). Queue depth, wait and run time per class are
+    recorded under "scheduler.*"; see `stats()`.
+    """
+
+    def __init__(self, workers: int = 8, aging_s: float = 10.0) -> None:
+        self.workers = workers
+        self.aging_s = aging_s
+        # class -> user -> FIFO; OrderedDict order is the round-robin order.
+        self._queues: Dict[Priority, "OrderedDict[str, Deque[_Task]]"] = {p: OrderedDict() for p in Priority}
+        self._depth: Dict[Priority, int] = {p: 0 for p in Priority}
+        self._busy = 0
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._threads: list[threading.Thread] = []
+        self._ids = itertools.count()
+
+    # Submission ------------------------------------------------------------ #
+    def submit(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        priority: Priority = Priority.INTERACTIVE,
+        user_id: str = "",
+        **kwargs: Any,
+    ) -> "Future[T]":
+        future: Future = Future()
+        task = _Task(fn=lambda: fn(*args, **kwargs), future=future, priority=priority, user_id=user_id)
+        if getattr(self._local, "is_worker", False):
+            self._execute(task)
+            return future
+
+        with self._cond:
+            self._ensure_started()
+            self._queues[priority].setdefault(user_id, deque()).append(task)
+            self._depth[priority] += 1
+            metrics.observe(f"scheduler.queue_depth.{priority.name.lower()}", self._depth[priority])
+            self._cond.notify()
+        return future
+
+    def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        priority: Priority = Priority.INTERACTIVE,
+        user_id: str = "",
+        **kwargs: Any,
+    ) -> T:
+        """Submit and block for the result (exceptions are re-raised)."""
+        return self.submit(fn, *args, priority=priority, user_id=user_id, **kwargs).result()
+
+    # Workers --------------------------------------------------------------- #
+    def _ensure_started(self) -> None:
+        while len(self._threads) < self.workers:
+            t = threading.Thread(target=self._worker, name=f"scheduler-{next(self._ids)}", daemon=True)
+            self._threads.append(t)
+            t.start()
+
+    def _next_task(self) -> Optional[_Task]:
+        """Pick the next task; caller holds the lock."""
+        now = time.perf_counter()
+        candidates = [(p, q) for p, q in self._queues.items() if q]
+        if not candidates:
+            return None
+        # Aging: the oldest head-of-line task beyond aging_s jumps the classes.
+        overdue = [
+            (next(iter(q.values()))[0].enqueued, p)
+            for p, q in candidates
+            if now - next(iter(q.values()))[0].enqueued > self.aging_s
+        ]
+        priority = min(overdue)[1] if overdue else candidates[0][0]
+
+        users = self._queues[priority]
+        user_id, tasks = next(iter(users.items()))
+        task = tasks.popleft()
+        users.pop(user_id)
+        if tasks:
+            users[user_id] = tasks  # back of the round-robin
+        self._depth[priority] -= 1
+        return task
+
+    def _worker(self) -> None:
+        self._local.is_worker = True
+        while True:
+            with self._cond:
+                task = self._next_task()
+                while task is None:
+                    self._cond.wait()
+                    task = self._next_task()
+                self._busy += 1
+            try:
+                metrics.observe(f"scheduler.wait_s.{task.priority.name.lower()}", time.perf_counter() - task.enqueued)
+                self._execute(task)
+            finally:
+                with self._cond:
+                    self._busy -= 1
+
+    @staticmethod
+    def _execute(task: _Task) -> None:
+        if not task.future.set_running_or_notify_cancel():
+            return
+        started = time.perf_counter()
+        try:
+            task.future.set_result(task.fn())
+        except BaseException as e:
+            task.future.set_exception(e)
+        finally:
+            metrics.observe(f"scheduler.run_s.{task.priority.name.lower()}", time.perf_counter() - started)
+
+    def queued(self) -> int:
+        with self._cond:
+            return sum(self._depth.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            depths = {p.name.lower(): self._depth[p] for p in Priority}
+            busy = self._busy
+        return {
+            "workers": self.workers,
+            "busy": busy,
+            "queue_depth": depths,
+            "mean_wait_s": {p.name.lower(): metrics.mean(f"scheduler.wait_s.{p.name.lower()}") for p in Priority},
+        }
+
+
+_scheduler: Optional[Scheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """Process-wide scheduler shared by every agent and session."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = Scheduler(workers=settings.SCHEDULER_WORKERS)
+    return _scheduler
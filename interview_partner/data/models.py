@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def intern_tags(tags: Any) -> Tuple[str, ...]:
+    """
+    Tag list as a tuple of interned strings.
+
+    Weak-spot / strength tags repeat across answers, sessions and users;
+    interning keeps one copy of each distinct tag per process.
+    """
+    if isinstance(tags, str):
+        tags = [tags]
+    if not isinstance(tags, Iterable):
+        return ()
+    out = []
+    for tag in tags:
+        text = str(tag).strip()
+        if text:
+            out.append(sys.intern(text))
+    return tuple(out)
+
+
+class _FieldMapping(Mapping):
+    """
+    Read-only Mapping view over a dataclass's fields, so models can stand in
+    where plain dicts were used (`ev["scores"]`, `ev.get("weak_spots", [])`,
+    `scores.items()`). Fields set to None are treated as absent.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__dataclass_fields__:  # type: ignore[attr-defined]
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (k for k in self.__dataclass_fields__ if getattr(self, k) is not None)  # type: ignore[attr-defined]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+@dataclass(slots=True, eq=True)
+class RubricScores(_FieldMapping):
+    """One 0–10 score per rubric key (see `data.rubrics.RUBRIC_DESCRIPTIONS`); None if not scored."""
+
+    clarity: Optional[int] = None
+    technical_or_role_fit: Optional[int] = None
+    structure_STAR: Optional[int] = None
+    confidence: Optional[int] = None
+    brevity: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, int]:
+        return dict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Mapping]) -> "RubricScores":
+        if isinstance(data, RubricScores):
+            return data
+        data = data or {}
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if data.get(k) is not None})
+
+
+@dataclass(slots=True, eq=True)
+class Evaluation(_FieldMapping):
+    """
+    The critic's verdict on one answer.
+
+    `question` is the same string object the interviewer asked (bank
+    questions are shared, not copied); tags are interned tuples.
+    """
+
+    question: str
+    answer: str
+    scores: RubricScores
+    weak_spots: Tuple[str, ...] = ()
+    strengths: Tuple[str, ...] = ()
+    comments: str = ""
+    source: Optional[str] = None  # resolving tier: local | lite | full | fallback | prescorer
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "question": self.question,
+            "answer": self.answer,
+            "scores": self.scores.to_dict(),
+            "weak_spots": list(self.weak_spots),
+            "strengths": list(self.strengths),
+            "comments": self.comments,
+        }
+        if self.source is not None:
+            out["source"] = self.source
+        return out
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Evaluation":
+        if isinstance(data, Evaluation):
+            return data
+        return cls(
+            question=sys.intern(str(data.get("question", ""))),
+            answer=str(data.get("answer", "")),
+            scores=RubricScores.from_dict(data.get("scores")),
+            weak_spots=intern_tags(data.get("weak_spots", ())),
+            strengths=intern_tags(data.get("strengths", ())),
+            comments=str(data.get("comments") or ""),
+            source=data.get("source"),
+        )
+
+
+@dataclass(slots=True, eq=True)
+class SessionSummary(_FieldMapping):
+    """
+    End-of-session record returned by `Orchestrator.finalize_session()`.
+
+    `evaluations` is the orchestrator's own list (shared, not copied);
+    `scores` holds the per-rubric averages computed when it was stored.
+    """
+
+    user_id: str
+    role: str
+    summary_text: str
+    weak_spot_topics: Tuple[str, ...] = ()
+    strength_topics: Tuple[str, ...] = ()
+    evaluations: List[Evaluation] = field(default_factory=list)
+    session_id: Optional[str] = None
+    timestamp: Optional[str] = None
+    scores: Optional[Dict[str, float]] = None
+
+    def to_dict(self, include_evaluations: bool = True) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "user_id": self.user_id,
+            "role": self.role,
+            "summary_text": self.summary_text,
+            "weak_spot_topics": list(self.weak_spot_topics),
+            "strength_topics": list(self.strength_topics),
+        }
+        if include_evaluations:
+            out["evaluations"] = [e.to_dict() for e in self.evaluations]
+        for key in ("session_id", "timestamp", "scores"):
+            value = getattr(self, key)
+            if value is not None:
+                out[key] = value
+        return out
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "SessionSummary":
+        if isinstance(data, SessionSummary):
+            return data
+        return cls(
+            user_id=str(data.get("user_id", "")),
+            role=str(data.get("role", "")),
+            summary_text=str(data.get("summary_text", "")),
+            weak_spot_topics=intern_tags(data.get("weak_spot_topics", ())),
+            strength_topics=intern_tags(data.get("strength_topics", ())),
+            evaluations=[Evaluation.from_dict(e) for e in data.get("evaluations") or []],
+            session_id=data.get("session_id"),
+            timestamp=data.get("timestamp"),
+            scores=data.get("scores"),
+        )
@@ -1,97 +1,166 @@
 from __future__ import annotations
 
+import json
+import re
+import threading
 from dataclasses import dataclass
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
+from interview_partner.config import settings
 
-@dataclass
+
+@dataclass(frozen=True)
 class Question:
     text: str
     topic: str
     tags: List[str]
 
 
-# A small but easily extensible role-based question bank.
-QUESTION_BANK: Dict[str, List[Question]] = {
-    "Software Engineer": [
-        Question(
-            text="Tell me about a time you debugged a particularly hard production issue.",
-            topic="behavioral",
-            tags=["STAR_method", "debugging", "ownership"],
-        ),
-        Question(
-            text="Describe how you would design a rate limiter for an HTTP API.",
-            topic="system_design",
-            tags=["system_design", "scalability"],
-        ),
-        Question(
-            text="Walk me through a piece of code you wrote that you're proud of.",
-            topic="technical_experience",
-            tags=["coding", "communication"],
-        ),
-        Question(
-            text="How do you ensure code quality and reliability in your projects?",
-            topic="process",
-            tags=["testing", "code_review"],
-        ),
-    ],
-    "Sales": [
-        Question(
-            text="Describe a time you turned around a difficult customer situation.",
-            topic="behavioral",
-            tags=["relationship_building", "objection_handling"],
-        ),
-        Question(
-            text="How do you qualify and prioritize leads in your pipeline?",
-            topic="sales_process",
-            tags=["qualification", "prioritization"],
-        ),
-        Question(
-            text="Walk me through your discovery process for a new prospect.",
-            topic="discovery",
-            tags=["questioning", "listening"],
-        ),
-    ],
-    "Customer Support": [
-        Question(
-            text="Tell me about a time you handled an escalated, frustrated customer.",
-            topic="behavioral",
-            tags=["de_escalation", "empathy"],
-        ),
-        Question(
-            text="How do you balance speed and quality when handling support tickets?",
-            topic="prioritization",
-            tags=["time_management", "quality"],
-        ),
-        Question(
-            text="Describe your approach to documenting and sharing recurring issues.",
-            topic="process",
-            tags=["documentation", "collaboration"],
-        ),
-    ],
-}
-
-
-def get_questions_for_role(role: str) -> List[Question]:
-    """Return a copy of the questions for the given role (or a generic set)."""
-    if role in QUESTION_BANK:
-        return list(QUESTION_BANK[role])
-
-    # Fallback generic questions if an unknown role is requested.
-    return [
-        Question(
-            text="Tell me about a time you faced a major challenge at work and how you handled it.",
-            topic="behavioral",
-            tags=["STAR_method"],
-        ),
-        Question(
-            text="What do you consider your strongest professional skill, and why?",
-            topic="self_assessment",
-            tags=["self_awareness"],
-        ),
-        Question(
-            text="Describe a situation where you had to collaborate with a difficult teammate.",
-            topic="collaboration",
-            tags=["communication", "teamwork"],
-        ),
-    ]
+_TAG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_tag(tag: str) -> str:
+    """Canonical tag form: lowercase words joined by "_" ("STAR method" -> "star_method")."""
+    return _TAG_SEPARATORS.sub("_", tag.lower()).strip("_")
+
+
+def role_slug(role: str) -> str:
+    """File-name slug for a role ("Software Engineer" -> "software_engineer")."""
+    return normalize_tag(role)
+
+
+@dataclass
+class RoleBank:
+    """All questions for one role plus a normalized tag -> question-index inverted index."""
+
+    questions: Tuple[Question, ...]
+    by_tag: Dict[str, Tuple[int, ...]]
+
+    @classmethod
+    def from_questions(cls, questions: Iterable[Question]) -> "RoleBank":
+        questions = tuple(questions)
+        index: Dict[str, List[int]] = {}
+        for i, q in enumerate(questions):
+            for tag in q.tags:
+                index.setdefault(tag, []).append(i)
+        return cls(questions=questions, by_tag={t: tuple(ids) for t, ids in index.items()})
+
+    def indices_for_tags(self, tags: Iterable[str]) -> List[int]:
+        """Sorted indices of questions carrying any of `tags` (index lookup only)."""
+        hits: set[int] = set()
+        for tag in tags:
+            hits.update(self.by_tag.get(normalize_tag(tag), ()))
+        return sorted(hits)
+
+
+class QuestionBank(Mapping[str, Sequence[Question]]):
+    """
+    Role-based question bank loaded from data files.
+
+    Layout of `bank_dir`:
+    - `index.json`: {"roles": {role name: file name}, "fallback": file name}
+    - one JSONL file per role, one {"text", "topic", "tags"} object per line
+
+    Role files are parsed lazily on first use and cached, so startup only
+    reads the small manifest. Tags are normalized with `normalize_tag` at
+    load time.
+    """
+
+    def __init__(self, bank_dir: Path) -> None:
+        self.bank_dir = bank_dir
+        self._manifest: Optional[Dict[str, object]] = None
+        self._roles: Dict[str, RoleBank] = {}
+        self._lock = threading.Lock()
+
+    # Loading -------------------------------------------------------------- #
+    @property
+    def manifest(self) -> Dict[str, object]:
+        if self._manifest is None:
+            path = self.bank_dir / "index.json"
+            if path.exists():
+                with path.open("r", encoding="utf-8") as f:
+                    self._manifest = json.load(f)
+            else:
+                self._manifest = {"roles": {}, "fallback": "_generic.jsonl"}
+        return self._manifest
+
+    @property
+    def role_files(self) -> Dict[str, str]:
+        return dict(self.manifest.get("roles", {}))  # type: ignore[arg-type]
+
+    def _file_for(self, role: str) -> Optional[str]:
+        return self.role_files.get(role)
+
+    def role_bank(self, role: str) -> RoleBank:
+        """Return the (cached) bank for `role`, or the generic fallback bank."""
+        file_name = self._file_for(role) or str(self.manifest.get("fallback", "_generic.jsonl"))
+        bank = self._roles.get(file_name)
+        if bank is None:
+            with self._lock:
+                bank = self._roles.get(file_name)
+                if bank is None:
+                    bank = RoleBank.from_questions(load_questions_file(self.bank_dir / file_name))
+                    self._roles[file_name] = bank
+        return bank
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached manifest and role banks so the next query re-reads
+        the files. `tools.expand_qbank` calls this after rewriting a bank
+        in place; other processes serving the bank pick up changes on restart.
+        """
+        with self._lock:
+            self._manifest = None
+            self._roles.clear()
+
+    # Queries -------------------------------------------------------------- #
+    def questions_for_role(self, role: str) -> Tuple[Question, ...]:
+        """The role's questions, shared with the cache (a tuple, so no per-caller copy)."""
+        return self.role_bank(role).questions
+
+    # Mapping interface (role name -> questions) ---------------------------- #
+    def __getitem__(self, role: str) -> Tuple[Question, ...]:
+        if self._file_for(role) is None:
+            raise KeyError(role)
+        return self.questions_for_role(role)
+
+    def __contains__(self, role: object) -> bool:
+        return isinstance(role, str) and self._file_for(role) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.role_files)
+
+    def __len__(self) -> int:
+        return len(self.role_files)
+
+
+def load_questions_file(path: Path) -> List[Question]:
+    """Parse one JSONL question file, normalizing tags; missing files yield []."""
+    questions: List[Question] = []
+    if not path.exists():
+        return questions
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            row = json.loads(line)
+            tags = [normalize_tag(t) for t in row.get("tags", []) if t]
+            questions.append(
+                Question(
+                    text=row["text"],
+                    topic=normalize_tag(row.get("topic", "")) or "general",
+                    tags=list(dict.fromkeys(t for t in tags if t)),
+                )
+            )
+    return questions
+
+
+# Default bank: ships in data/questions, overridable via settings.QUESTION_BANK_DIR.
+QUESTION_BANK = QuestionBank(settings.QUESTION_BANK_DIR)
+
+
+def get_questions_for_role(role: str) -> Tuple[Question, ...]:
+    """Return the (read-only) questions for the given role (or a generic set)."""
+    return QUESTION_BANK.questions_for_role(role)
@@ -0,0 +1,4 @@
+from __future__ import annotations
+
+# Headless asyncio interview service (HTTP + WebSocket) around Orchestrator.
+# Run with: python -m interview_partner.server --port 8080
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from interview_partner.server.app import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+HTTP + WebSocket API around Orchestrator.
+
+    POST   /sessions                    start; body: user_id, role, mode, tone,
+                                        max_questions, resume_text, job_description
+                                        (503 + Retry-After while upstream is saturated)
+    GET    /sessions/{id}               session state (rehydrated from its checkpoint
+                                        if the server restarted mid-interview)
+    POST   /sessions/{id}/answers       body: answer -> evaluation + next question
+    GET    /sessions/{id}/ws            WebSocket: send {"type": "answer", "answer": ...};
+                                        receives "provisional", "evaluation" and
+                                        "question" messages as each becomes ready
+    POST   /sessions/{id}/finalize      session summary (idempotent)
+    DELETE /sessions/{id}               drop the session
+    GET    /metrics, GET /healthz
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, Optional
+
+from interview_partner.config import settings
+from interview_partner.core.admission import ServiceBusy, admission
+from interview_partner.core.http_pool import http_pool
+from interview_partner.core.key_pool import key_pool
+from interview_partner.core.llm import prewarm_client
+from interview_partner.core.metrics import metrics
+from interview_partner.server.sessions import ServerSession, SessionRegistry
+from interview_partner.services.prescorer import prescore
+from interview_partner.services.session_pool import PooledSession
+
+try:
+    from aiohttp import WSMsgType, web  # type: ignore
+except Exception:  # pragma: no cover - aiohttp is only needed for the server
+    WSMsgType = None  # type: ignore
+    web = None  # type: ignore
+
+REGISTRY_KEY = "registry"
+START_FIELDS = ("user_id", "role", "mode", "tone", "max_questions", "resume_text", "job_description")
+MODES = ("normal", "drill")
+TONES = ("friendly", "neutral", "grilling")
+
+
+def _json_error(status: int, message: str) -> "web.Response":
+    return web.json_response({"error": message}, status=status)
+
+
+async def _session(request: "web.Request") -> ServerSession:
+    try:
+        return await request.app[REGISTRY_KEY].lookup(request.match_info["session_id"])
+    except KeyError:
+        raise web.HTTPNotFound(
+            text=json.dumps({"error": "unknown session"}), content_type="application/json"
+        )
+
+
+async def _read_json(request: "web.Request") -> Dict[str, Any]:
+    try:
+        body = await request.json()
+    except Exception:
+        raise web.HTTPBadRequest(text=json.dumps({"error": "invalid JSON body"}), content_type="application/json")
+    if not isinstance(body, dict):
+        raise web.HTTPBadRequest(text=json.dumps({"error": "expected a JSON object"}), content_type="application/json")
+    return body
+
+
+async def _answer_turn(registry: SessionRegistry, session: ServerSession, answer: str) -> Dict[str, Any]:
+    """Submit one answer (serialized per session) and return evaluation + next question."""
+
+    def _turn(pooled: PooledSession) -> Dict[str, Any]:
+        orch = pooled.orchestrator
+        if orch.finished:
+            return {"error": "session already finished", "finished": True}
+        next_question = orch.submit_answer(answer)
+        return {
+            "evaluation": orch.evaluations[-1].to_dict() if orch.evaluations else None,
+            "question": None if orch.finished else next_question,
+            "message": next_question if orch.finished else None,
+            "finished": orch.finished,
+            "num_questions_asked": orch.num_questions_asked,
+        }
+
+    async with session.lock:
+        started = time.perf_counter()
+        result = await registry.turn(session, _turn)
+        metrics.observe("server.turn_s", time.perf_counter() - started)
+        return result
+
+
+async def start_session(request: "web.Request") -> "web.Response":
+    body = await _read_json(request)
+    if not body.get("user_id") or not body.get("role"):
+        return _json_error(400, "user_id and role are required")
+    max_questions = body.get("max_questions")
+    if max_questions is not None and (
+        not isinstance(max_questions, int) or isinstance(max_questions, bool) or max_questions < 1
+    ):
+        return _json_error(400, "max_questions must be a positive integer")
+    if body.get("mode") is not None and body["mode"] not in MODES:
+        return _json_error(400, f"mode must be one of: {', '.join(MODES)}")
+    if body.get("tone") is not None and body["tone"] not in TONES:
+        return _json_error(400, f"tone must be one of: {', '.join(TONES)}")
+    kwargs = {k: body[k] for k in START_FIELDS if body.get(k) is not None}
+    registry: SessionRegistry = request.app[REGISTRY_KEY]
+    try:
+        session = await registry.create(**kwargs)
+    except ServiceBusy as e:
+        return web.json_response(
+            {"error": str(e), "retry_after": e.retry_after},
+            status=503,
+            headers={"Retry-After": str(int(e.retry_after + 0.5))},
+        )
+    async with session.lock:
+        question = await registry.turn(session, lambda pooled: pooled.orchestrator.start_interview())
+    return web.json_response({**(await session.state()), "question": question}, status=201)
+
+
+async def get_session(request: "web.Request") -> "web.Response":
+    return web.json_response(await (await _session(request)).state())
+
+
+async def submit_answer(request: "web.Request") -> "web.Response":
+    session = await _session(request)
+    body = await _read_json(request)
+    answer = str(body.get("answer", "")).strip()
+    if not answer:
+        return _json_error(400, "answer is required")
+    result = await _answer_turn(request.app[REGISTRY_KEY], session, answer)
+    return web.json_response(result, status=409 if "error" in result else 200)
+
+
+async def finalize_session(request: "web.Request") -> "web.Response":
+    session = await _session(request)
+    registry: SessionRegistry = request.app[REGISTRY_KEY]
+
+    def _finalize(pooled: PooledSession) -> Optional[Dict[str, Any]]:
+        if pooled.summary is None and pooled.orchestrator.evaluations:
+            pooled.summary = pooled.orchestrator.finalize_session()
+        return pooled.summary.to_dict() if pooled.summary is not None else None
+
+    async with session.lock:
+        summary = await registry.turn(session, _finalize)
+    if summary is None:
+        return _json_error(409, "no answers submitted yet")
+    return web.json_response(summary)
+
+
+async def delete_session(request: "web.Request") -> "web.Response":
+    removed = await request.app[REGISTRY_KEY].remove(request.match_info["session_id"])
+    return web.json_response({"removed": removed}, status=200 if removed else 404)
+
+
+async def session_ws(request: "web.Request") -> "web.WebSocketResponse":
+    """
+    Turn-by-turn WebSocket. Each answer yields, in order and as soon as ready:
+    - {"type": "provisional", "scores": ...}   local pre-score, instant
+    - {"type": "evaluation", ...}              critic result
+    - {"type": "question", "text": ..., "finished": bool}
+    """
+    session = await _session(request)
+    registry: SessionRegistry = request.app[REGISTRY_KEY]
+    ws = web.WebSocketResponse(heartbeat=30)
+    await ws.prepare(request)
+    state = await session.state()
+    current_question = state["current_question"]
+    await ws.send_json({"type": "question", "text": current_question, "finished": state["finished"]})
+
+    async for msg in ws:
+        if msg.type != WSMsgType.TEXT:
+            continue
+        try:
+            data = json.loads(msg.data)
+        except ValueError:
+            await ws.send_json({"type": "error", "error": "invalid JSON"})
+            continue
+        if data.get("type") != "answer" or not str(data.get("answer", "")).strip():
+            await ws.send_json({"type": "error", "error": "expected {\"type\": \"answer\", \"answer\": ...}"})
+            continue
+
+        answer = str(data["answer"]).strip()
+        pre = prescore(current_question or "", answer)
+        await ws.send_json({"type": "provisional", "scores": pre.scores, "confidence": pre.confidence})
+        result = await _answer_turn(registry, session, answer)
+        if "error" in result:
+            await ws.send_json({"type": "error", **result})
+            continue
+        await ws.send_json({"type": "evaluation", **(result["evaluation"] or {})})
+        current_question = result["question"]
+        await ws.send_json(
+            {
+                "type": "question",
+                "text": result["question"] or result["message"],
+                "finished": result["finished"],
+            }
+        )
+    return ws
+
+
+async def get_metrics(request: "web.Request") -> "web.Response":
+    registry: SessionRegistry = request.app[REGISTRY_KEY]
+    sessions = await registry.stats()
+    return web.json_response(
+        {
+            "sessions": sessions["sessions"],
+            "admission": admission.stats(),
+            "llm_http": http_pool.stats(),
+            "key_pool": key_pool.stats(),
+            "session_pool": sessions["session_pool"],
+            **metrics.snapshot(),
+        }
+    )
+
+
+async def healthz(request: "web.Request") -> "web.Response":
+    return web.json_response({"ok": True})
+
+
+def create_app(registry: SessionRegistry | None = None) -> "web.Application":
+    if web is None:
+        raise RuntimeError("The interview server needs the optional 'aiohttp' package (pip install aiohttp).")
+    app = web.Application(client_max_size=2 * 1024 * 1024)
+    app[REGISTRY_KEY] = registry if registry is not None else SessionRegistry()
+    app.add_routes(
+        [
+            web.post("/sessions", start_session),
+            web.get("/sessions/{session_id}", get_session),
+            web.delete("/sessions/{session_id}", delete_session),
+            web.post("/sessions/{session_id}/answers", submit_answer),
+            web.get("/sessions/{session_id}/ws", session_ws),
+            web.post("/sessions/{session_id}/finalize", finalize_session),
+            web.get("/metrics", get_metrics),
+            web.get("/healthz", healthz),
+        ]
+    )
+
+    async def _background(app: "web.Application"):
+        prewarm_client()
+        reaper = asyncio.create_task(app[REGISTRY_KEY].reap_forever())
+        yield
+        reaper.cancel()
+        app[REGISTRY_KEY].shutdown()
+
+    app.cleanup_ctx.append(_background)
+    return app
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the headless interview server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS, help="Threads for blocking agent calls.")
+    args = parser.parse_args(argv)
+    web.run_app(create_app(SessionRegistry(workers=args.workers)), host=args.host, port=args.port)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from interview_partner.agents.orchestrator import Orchestrator
+from interview_partner.config import settings
+from interview_partner.core.metrics import metrics
+from interview_partner.services.session_pool import PooledSession, SessionPool, get_session_pool
+
+T = TypeVar("T")
+
+
+@dataclass
+class ServerSession:
+    """
+    Handle to one interview hosted by the server.
+
+    The orchestrator and summary live in the `SessionPool` and may be evicted
+    to disk between turns, so every access goes through the pool on the
+    registry's worker threads (a lookup may reload from disk). `lock`
+    serializes turns: one answer / finalize at a time per session.
+    """
+
+    session_id: str
+    registry: "SessionRegistry"
+    lock: asyncio.Lock
+
+    async def state(self) -> Dict[str, Any]:
+        return await self.registry.run(self._state)
+
+    def _state(self) -> Dict[str, Any]:
+        pooled = self.registry.pool.get(self.session_id)
+        orch = pooled.orchestrator
+        return {
+            "session_id": self.session_id,
+            "user_id": orch.user_id,
+            "role": orch.role,
+            "mode": orch.mode,
+            "tone": orch.tone,
+            "current_question": orch.current_question,
+            "num_questions_asked": orch.num_questions_asked,
+            "max_questions": orch.max_questions,
+            "finished": orch.finished,
+            "finalized": pooled.summary is not None,
+            "resident_bytes": pooled.resident_bytes,
+        }
+
+
+class SessionRegistry:
+    """
+    Server-side sessions, keyed by session id (= the orchestrator's checkpoint id).
+
+    Session state is held by a memory-bounded `SessionPool`: idle sessions
+    beyond its budget are evicted to disk and reloaded on the next request,
+    and `lookup()` also rehydrates sessions from their checkpoint after a
+    server restart. Every pool access and all blocking agent work (LLM
+    calls, file IO) runs on a bounded thread pool via `run()` / `turn()`,
+    never on the event loop.
+    Idle sessions are reaped (checkpoint included) after `idle_ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.SERVER_WORKERS,
+        idle_ttl: float = settings.SERVER_SESSION_TTL,
+        pool: Optional[SessionPool] = None,
+    ) -> None:
+        self.idle_ttl = idle_ttl
+        self.pool = pool if pool is not None else get_session_pool()  # an empty pool is falsy
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="interview-worker")
+
+    def __len__(self) -> int:
+        """Takes the pool lock; call it through `run()` from the event loop."""
+        return len(self.pool)
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking agent call on the worker pool."""
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._executor, lambda: fn(*args, **kwargs))
+        finally:
+            metrics.observe("server.worker_call_s", time.perf_counter() - started)
+
+    async def turn(self, session: ServerSession, fn: Callable[[PooledSession], T]) -> T:
+        """
+        Run `fn(pooled_session)` on the worker pool with the session pinned in
+        memory; afterwards its footprint is re-measured and the pool's budget
+        enforced.
+        """
+
+        def _pinned() -> T:
+            with self.pool.use(session.session_id) as pooled:
+                return fn(pooled)
+
+        return await self.run(_pinned)
+
+    def _handle(self, session_id: str) -> ServerSession:
+        lock = self._locks.setdefault(session_id, asyncio.Lock())
+        return ServerSession(session_id=session_id, registry=self, lock=lock)
+
+    async def create(self, **orchestrator_kwargs: Any) -> ServerSession:
+        pooled = await self.run(lambda: self.pool.add(Orchestrator(**orchestrator_kwargs)))
+        metrics.incr("server.sessions_created")
+        return self._handle(pooled.session_id)
+
+    async def lookup(self, session_id: str) -> ServerSession:
+        """The session, reloaded from disk if evicted or checkpointed; KeyError if unknown."""
+
+        def _lookup() -> bool:
+            resident = self.pool.is_resident(session_id)
+            self.pool.get(session_id)  # marks it recently used; KeyError if there is nothing to reload
+            return not resident
+
+        if await self.run(_lookup):
+            metrics.incr("server.sessions_rehydrated")
+        return self._handle(session_id)
+
+    async def remove(self, session_id: str) -> bool:
+        self._locks.pop(session_id, None)
+        return await self.run(self.pool.remove, session_id)
+
+    async def stats(self) -> Dict[str, Any]:
+        return await self.run(lambda: {"sessions": len(self), "session_pool": self.pool.stats()})
+
+    async def reap_idle(self) -> int:
+        """
+        Reap idle sessions on the worker pool, then prune their turn locks
+        back on the event loop, like every other `_locks` access; a lock
+        that is still held is kept.
+        """
+        candidates = list(self._locks)
+
+        def _reap() -> Tuple[int, List[str]]:
+            reaped = self.pool.reap_idle(self.idle_ttl)
+            return reaped, [sid for sid in candidates if sid not in self.pool]
+
+        reaped, gone = await self.run(_reap)
+        for sid in gone:
+            lock = self._locks.get(sid)
+            if lock is not None and not lock.locked():
+                del self._locks[sid]
+        if reaped:
+            metrics.incr("server.sessions_reaped", reaped)
+        return reaped
+
+    async def reap_forever(self, interval: float = 60.0) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.reap_idle()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import threading
+import time
+import warnings
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from interview_partner.agents.memory_agent import aggregate_scores, legacy_session_id
+from interview_partner.core.metrics import metrics
+from interview_partner.data.rubrics import RUBRIC_DESCRIPTIONS
+from interview_partner.services.memory_store import MemoryStore
+
+SCORE_KEYS: List[str] = list(RUBRIC_DESCRIPTIONS)
+SCORE_BINS = 11  # integer buckets 0..10
+
+# (scores, role_idx, user_idx, timestamps), always replaced as a whole.
+Columns = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class CohortAnalytics:
+    """
+    Vectorized cohort statistics over stored session scores.
+
+    Every stored session header contributes one row:
+    - `scores`:     float32 (N, D) averaged rubric scores, NaN where missing
+    - `role_idx`:   int32 (N,) index into `roles`
+    - `user_idx`:   int32 (N,) index into `users`
+    - `timestamps`: float64 (N,) POSIX seconds
+
+    Only headers are read (never evaluation bodies). New sessions arrive
+    through the store's session listener and are appended incrementally;
+    sessions written by other processes are picked up by a rescan that runs
+    on a background thread (started on construction, then at most every
+    `rescan_interval` when queried) and only re-reads users whose document
+    changed since the last scan (`MemoryStore.user_version`). Queries never
+    wait for a scan.
+
+    The four columns are swapped in as one tuple, so a query always sees
+    arrays of the same length.
+    """
+
+    def __init__(self, store: MemoryStore, rescan_interval: float = 300.0) -> None:
+        self.store = store
+        self.rescan_interval = rescan_interval
+
+        self.roles: List[str] = []
+        self.users: List[str] = []
+        self._role_codes: Dict[str, int] = {}
+        self._user_codes: Dict[str, int] = {}
+        self._seen_sessions: Dict[str, set[str]] = {}
+
+        self._columns: Columns = (
+            np.empty((0, len(SCORE_KEYS)), dtype=np.float32),
+            np.empty(0, dtype=np.int32),
+            np.empty(0, dtype=np.int32),
+            np.empty(0, dtype=np.float64),
+        )
+
+        # Rows staged since the last materialization.
+        self._buffer: List[tuple[List[float], int, int, float]] = []
+        self._lock = threading.RLock()
+        self._last_scan = 0.0
+        self._scan_thread: Optional[threading.Thread] = None
+        self._user_versions: Dict[str, Any] = {}  # user id -> version seen by the last scan
+
+        store.add_session_listener(self.ingest)
+        self.refresh(force=True)
+
+    @property
+    def scores(self) -> np.ndarray:
+        return self._columns[0]
+
+    @property
+    def role_idx(self) -> np.ndarray:
+        return self._columns[1]
+
+    @property
+    def user_idx(self) -> np.ndarray:
+        return self._columns[2]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._columns[3]
+
+    # Loading -------------------------------------------------------------- #
+    def ingest(self, user_id: str, headers: Sequence[Dict[str, Any]]) -> None:
+        """
+        Append sessions not seen before (idempotent by session_id).
+
+        Legacy headers that still embed their evaluations get the id and
+        averages the memory agent's migration gives them, so the same session
+        is not counted again once its file is migrated; headers with neither
+        a session id nor evaluations are skipped.
+        """
+        with self._lock:
+            seen = self._seen_sessions.setdefault(user_id, set())
+            for header in headers:
+                evaluations = header.get("evaluations")
+                session_id = header.get("session_id")
+                if not session_id:
+                    if evaluations is None:
+                        continue
+                    session_id = legacy_session_id(header, evaluations)
+                if session_id in seen:
+                    continue
+                seen.add(session_id)
+                scores = header.get("scores") or (aggregate_scores(evaluations) if evaluations else {})
+                row = [float(scores.get(k, np.nan)) for k in SCORE_KEYS]
+                self._buffer.append(
+                    (
+                        row,
+                        self._code(self._role_codes, self.roles, header.get("role", "")),
+                        self._code(self._user_codes, self.users, user_id),
+                        _parse_timestamp(header.get("timestamp")),
+                    )
+                )
+
+    def refresh(self, force: bool = False, wait: bool = False) -> None:
+        """
+        Start a background rescan for sessions written elsewhere (at most
+        every `rescan_interval` unless `force`); `wait` blocks until it ends.
+        """
+        with self._lock:
+            now = time.monotonic()
+            running = self._scan_thread is not None and self._scan_thread.is_alive()
+            due = force or not self._last_scan or now - self._last_scan >= self.rescan_interval
+            if due and not running:
+                self._last_scan = now
+                self._scan_thread = threading.Thread(target=self._rescan, name="cohort-rescan", daemon=True)
+                self._scan_thread.start()
+            thread = self._scan_thread
+        if wait and thread is not None:
+            thread.join()
+
+    def _rescan(self) -> None:
+        """Re-read only the users whose stored document changed since the last scan."""
+        started = time.perf_counter()
+        reread = 0
+        try:
+            for user_id in self.store.iter_user_ids():
+                version = self.store.user_version(user_id)
+                if version is not None and self._user_versions.get(user_id) == version:
+                    continue
+                data = self.store.load_user(user_id) or {}
+                self.ingest(user_id, data.get("sessions", []))
+                self._user_versions[user_id] = version
+                reread += 1
+        except Exception as e:
+            print(f"[CohortAnalytics] Rescan failed: {e}")
+        metrics.observe("analytics.rescan_s", time.perf_counter() - started)
+        metrics.incr("analytics.users_reread", reread)
+
+    def _snapshot(self) -> Tuple[Columns, Dict[str, int], Dict[str, int]]:
+        """Fold staged rows in and return consistent columns plus the code tables."""
+        with self._lock:
+            if self._buffer:
+                rows, roles, users, stamps = zip(*self._buffer)
+                scores, role_idx, user_idx, timestamps = self._columns
+                self._columns = (
+                    np.concatenate([scores, np.asarray(rows, dtype=np.float32)]),
+                    np.concatenate([role_idx, np.asarray(roles, dtype=np.int32)]),
+                    np.concatenate([user_idx, np.asarray(users, dtype=np.int32)]),
+                    np.concatenate([timestamps, np.asarray(stamps, dtype=np.float64)]),
+                )
+                self._buffer.clear()
+            return self._columns, dict(self._role_codes), dict(self._user_codes)
+
+    @staticmethod
+    def _code(codes: Dict[str, int], names: List[str], name: str) -> int:
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(names)
+            names.append(name)
+        return code
+
+    def _cohort(self, role: str) -> np.ndarray:
+        self.refresh()
+        (scores, role_idx, _, _), role_codes, _ = self._snapshot()
+        code = role_codes.get(role)
+        if code is None:
+            return np.empty((0, len(SCORE_KEYS)), dtype=np.float32)
+        return scores[role_idx == code]
+
+    # Queries -------------------------------------------------------------- #
+    def cohort_size(self, role: str) -> int:
+        return int(self._cohort(role).shape[0])
+
+    def percentile_ranks(self, role: str, scores: Dict[str, float]) -> Dict[str, float]:
+        """
+        Percentile rank (0-100) of each given score within the role's cohort.
+
+        Ties count half, so a score equal to everyone else's lands at 50.
+        """
+        cohort = self._cohort(role)
+        if cohort.shape[0] == 0:
+            return {}
+        values = np.array([scores.get(k, np.nan) for k in SCORE_KEYS], dtype=np.float32)
+        valid = ~np.isnan(cohort)
+        below = ((cohort < values) & valid).sum(axis=0)
+        equal = ((cohort == values) & valid).sum(axis=0)
+        counts = valid.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ranks = 100.0 * (below + 0.5 * equal) / counts
+        return {
+            key: round(float(rank), 1)
+            for key, rank, value in zip(SCORE_KEYS, ranks, values)
+            if not np.isnan(rank) and not np.isnan(value)
+        }
+
+    def quantiles(
+        self, role: str, qs: Sequence[float] = (25, 50, 75, 90)
+    ) -> Dict[str, Dict[float, float]]:
+        """Per-dimension score quantiles for the role's cohort."""
+        cohort = self._cohort(role)
+        if cohort.shape[0] == 0:
+            return {}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN dimensions
+            table = np.nanpercentile(cohort, qs, axis=0)  # (len(qs), D)
+        return {
+            key: {q: round(float(v), 2) for q, v in zip(qs, table[:, i])}
+            for i, key in enumerate(SCORE_KEYS)
+            if not np.isnan(table[:, i]).all()
+        }
+
+    def distributions(self, role: str) -> Dict[str, List[int]]:
+        """Histogram of rounded scores (buckets 0..10) per dimension."""
+        cohort = self._cohort(role)
+        valid = ~np.isnan(cohort)
+        buckets = np.clip(np.rint(np.nan_to_num(cohort)), 0, SCORE_BINS - 1).astype(np.int64)
+        offsets = buckets + np.arange(len(SCORE_KEYS)) * SCORE_BINS
+        counts = np.bincount(offsets[valid], minlength=len(SCORE_KEYS) * SCORE_BINS)
+        counts = counts.reshape(len(SCORE_KEYS), SCORE_BINS)
+        return {key: counts[i].tolist() for i, key in enumerate(SCORE_KEYS)}
+
+    def user_trend(self, user_id: str, role: Optional[str] = None) -> Dict[str, float]:
+        """
+        Least-squares slope (score points per session) over a user's sessions,
+        ordered by time.
+
+        Dimensions with fewer than two scored sessions are omitted.
+        """
+        self.refresh()
+        (scores, role_idx, user_idx, timestamps), role_codes, user_codes = self._snapshot()
+        code = user_codes.get(user_id)
+        if code is None:
+            return {}
+        mask = user_idx == code
+        if role is not None:
+            mask &= role_idx == role_codes.get(role, -1)
+
+        order = np.argsort(timestamps[mask], kind="stable")
+        y = scores[mask][order].astype(np.float64)  # (n, D)
+        t = np.repeat(np.arange(y.shape[0], dtype=np.float64)[:, None], y.shape[1], axis=1)
+        valid = ~np.isnan(y)
+        n = valid.sum(axis=0)
+        t = np.where(valid, t, 0.0)
+        y = np.where(valid, y, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t_mean = t.sum(axis=0) / n
+            y_mean = y.sum(axis=0) / n
+            dt = np.where(valid, t - t_mean, 0.0)
+            slopes = (dt * (y - y_mean)).sum(axis=0) / (dt * dt).sum(axis=0)
+        return {
+            key: round(float(slope), 3)
+            for key, slope, count in zip(SCORE_KEYS, slopes, n)
+            if count >= 2 and np.isfinite(slope)
+        }
+
+
+def _parse_timestamp(value: Optional[str]) -> float:
+    if not value:
+        return float("nan")
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return float("nan")
+
+
+_analytics: Dict[int, CohortAnalytics] = {}
+_analytics_lock = threading.Lock()
+
+
+def get_cohort_analytics(store: MemoryStore) -> CohortAnalytics:
+    """Return the cached analytics for `store`, building it on first use."""
+    with _analytics_lock:
+        analytics = _analytics.get(id(store))
+        if analytics is None:
+            analytics = _analytics[id(store)] = CohortAnalytics(store)
+        return analytics
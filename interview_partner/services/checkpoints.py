@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from interview_partner.config import settings
+from interview_partner.core.metrics import metrics
+from interview_partner.services.memory_store import encode_name
+
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointStore:
+    """
+    Durable snapshots of in-progress sessions (`Orchestrator.to_state()`).
+
+    Layout, hash-sharded like the memory store so no directory grows large:
+
+        <root>/<h[0:2]>/<h[2:4]>/<encoded checkpoint id>.json
+
+    Each save is one compact JSON document written to a temp file and renamed
+    over the previous snapshot, so a crash leaves either the old or the new
+    checkpoint, never a torn one. fsync is optional (`CHECKPOINT_FSYNC`):
+    rename alone survives a worker restart, which is the case this covers.
+
+    Snapshot size and save / load time are recorded under "checkpoint.*".
+    """
+
+    def __init__(self, root: Path, fsync: bool = False) -> None:
+        self.root = Path(root)
+        self.fsync = fsync
+
+    def _path(self, checkpoint_id: str) -> Path:
+        digest = hashlib.sha1(checkpoint_id.encode("utf-8")).hexdigest()
+        return self.root / digest[:2] / digest[2:4] / f"{encode_name(checkpoint_id)}.json"
+
+    def save(self, checkpoint_id: str, state: Dict[str, Any]) -> int:
+        """Atomically replace the checkpoint; returns its size in bytes."""
+        started = time.perf_counter()
+        payload = json.dumps(
+            {"version": CHECKPOINT_VERSION, "saved_at": time.time(), "state": state},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        path = self._path(checkpoint_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with tmp_path.open("wb") as f:
+            f.write(payload)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        metrics.incr("checkpoint.saved")
+        metrics.observe("checkpoint.bytes", len(payload))
+        metrics.observe("checkpoint.save_s", time.perf_counter() - started)
+        return len(payload)
+
+    def load(self, checkpoint_id: str) -> Optional[Dict[str, Any]]:
+        """The saved state, or None if missing, unreadable or from another version."""
+        started = time.perf_counter()
+        try:
+            with self._path(checkpoint_id).open("rb") as f:
+                doc = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[CheckpointStore] Unreadable checkpoint {checkpoint_id}: {e}")
+            return None
+        metrics.observe("checkpoint.load_s", time.perf_counter() - started)
+        if not isinstance(doc, dict) or doc.get("version") != CHECKPOINT_VERSION:
+            return None
+        return doc.get("state")
+
+    def delete(self, checkpoint_id: str) -> bool:
+        try:
+            self._path(checkpoint_id).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+
+_store: Optional[CheckpointStore] = None
+_store_lock = threading.Lock()
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """Process-wide store rooted at `settings.CHECKPOINT_DIR`."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = CheckpointStore(settings.CHECKPOINT_DIR, fsync=settings.CHECKPOINT_FSYNC)
+    return _store
+
+
+def stats() -> Dict[str, Any]:
+    return {
+        "saves": metrics.counter("checkpoint.saved"),
+        "restores": metrics.counter("checkpoint.restored"),
+        "mean_bytes": metrics.mean("checkpoint.bytes"),
+        "mean_save_ms": metrics.mean("checkpoint.save_s") * 1e3,
+    }
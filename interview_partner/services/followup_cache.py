@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from interview_partner.config import settings
+from interview_partner.core.metrics import metrics
+from interview_partner.services.retrieval import embed
+
+CacheKey = Tuple[str, str, str]
+
+
+@dataclass
+class _Bucket:
+    """Cached follow-ups for one (role, tone, question) key."""
+
+    vectors: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.float32))
+    followups: List[str] = field(default_factory=list)
+
+
+class FollowupCache:
+    """
+    Similarity cache for LLM-generated follow-up questions.
+
+    Entries are grouped by (role, tone, current question). Within a group,
+    an answer's local embedding is compared against earlier answers; if the
+    best cosine similarity is >= `threshold`, the earlier follow-up is reused.
+
+    Bounded: at most `max_entries` answers in total and `max_per_key` per
+    group (oldest first out). Whole groups are evicted LRU.
+
+    Hit/miss counts and miss latency go to `core.metrics` under
+    "followup_cache.*"; see `stats()`.
+    """
+
+    def __init__(self, threshold: float = 0.85, max_entries: int = 2048, max_per_key: int = 32) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_per_key = max_per_key
+        self._buckets: "OrderedDict[CacheKey, _Bucket]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(role: str, tone: str, question: str) -> CacheKey:
+        return (role.strip().lower(), tone.strip().lower(), " ".join(question.lower().split()))
+
+    def lookup(self, role: str, tone: str, question: str, answer: str) -> Optional[str]:
+        """Return a cached follow-up for a near-identical answer, or None."""
+        vec = embed(answer)
+        if not vec.any():
+            return None
+        key = self._key(role, tone, question)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None and bucket.followups:
+                self._buckets.move_to_end(key)
+                sims = bucket.vectors @ vec
+                best = int(np.argmax(sims))
+                if sims[best] >= self.threshold:
+                    metrics.incr("followup_cache.hit")
+                    return bucket.followups[best]
+        metrics.incr("followup_cache.miss")
+        return None
+
+    def store(self, role: str, tone: str, question: str, answer: str, followup: str) -> None:
+        vec = embed(answer)
+        if not vec.any() or not followup.strip():
+            return
+        key = self._key(role, tone, question)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(vectors=np.empty((0, vec.shape[0]), dtype=np.float32))
+            self._buckets.move_to_end(key)
+
+            bucket.vectors = np.vstack([bucket.vectors, vec[None, :]])
+            bucket.followups.append(followup)
+            self._size += 1
+            if len(bucket.followups) > self.max_per_key:
+                bucket.vectors = bucket.vectors[1:]
+                bucket.followups.pop(0)
+                self._size -= 1
+
+            while self._size > self.max_entries and self._buckets:
+                _, evicted = self._buckets.popitem(last=False)
+                self._size -= len(evicted.followups)
+                metrics.incr("followup_cache.evicted", len(evicted.followups))
+
+    def record_miss_latency(self, seconds: float) -> None:
+        metrics.observe("followup_cache.miss_latency_s", seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        hits = metrics.counter("followup_cache.hit")
+        misses = metrics.counter("followup_cache.miss")
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+            "mean_miss_latency_s": metrics.mean("followup_cache.miss_latency_s"),
+            "entries": self._size,
+            "keys": len(self._buckets),
+        }
+
+
+followup_cache = FollowupCache(
+    threshold=settings.FOLLOWUP_CACHE_THRESHOLD,
+    max_entries=settings.FOLLOWUP_CACHE_SIZE,
+)
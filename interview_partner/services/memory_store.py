@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+MEMORY_BACKENDS = ("flat", "sharded", "memory")
+
+_SAFE_NAME_CHARS = re.compile(r"[A-Za-z0-9_\-]")
+_MAX_NAME_LEN = 120
+
+# listener(user_id, new_session_headers) runs after sessions are stored.
+SessionListener = Callable[[str, List[Dict[str, Any]]], None]
+
+
+class MemoryStore(ABC):
+    """
+    Storage backend behind `MemoryAgent`.
+
+    A store holds two kinds of per-user documents:
+    - the user document (session headers + weak-spot aggregates)
+    - one evaluations document per stored session
+
+    `journal_path` is where the write-behind queue may keep its journal;
+    backends without durable storage leave it as None (writes stay synchronous).
+    """
+
+    journal_path: Optional[Path] = None
+
+    def __init__(self) -> None:
+        self._session_listeners: List[SessionListener] = []
+
+    def add_session_listener(self, listener: SessionListener) -> None:
+        """Register a callback for newly stored sessions (e.g. analytics caches)."""
+        self._session_listeners.append(listener)
+
+    def notify_sessions(self, user_id: str, headers: List[Dict[str, Any]]) -> None:
+        for listener in list(self._session_listeners):
+            try:
+                listener(user_id, headers)
+            except Exception as e:
+                print(f"Session listener failed for user {user_id!r}: {e}")
+
+    @abstractmethod
+    def load_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Return the user document, or None if the user has no memory yet."""
+
+    @abstractmethod
+    def save_user(self, user_id: str, data: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    def load_evaluations(self, user_id: str, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        ...
+
+    @abstractmethod
+    def save_evaluations(
+        self, user_id: str, session_id: str, evaluations: List[Dict[str, Any]]
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def iter_user_ids(self) -> Iterator[str]:
+        """Yield every user id that has a stored user document."""
+
+    def user_version(self, user_id: str) -> Optional[Any]:
+        """
+        Cheap change marker for the user document (e.g. its mtime), or None
+        if the backend cannot tell; lets scanners skip unchanged users.
+        """
+        return None
+
+
+# Filesystem backends ------------------------------------------------------ #
+class _FileMemoryStore(MemoryStore):
+    """Shared JSON read/write logic for the filesystem backends."""
+
+    def __init__(self, root: Path, fsync: bool = True) -> None:
+        super().__init__()
+        self.root = root
+        self.fsync = fsync
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.root / "_write_behind.jsonl"
+
+    @abstractmethod
+    def _user_path(self, user_id: str) -> Path:
+        ...
+
+    @abstractmethod
+    def _evaluations_path(self, user_id: str, session_id: str) -> Path:
+        ...
+
+    def load_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return _read_json(self._user_path(user_id))
+
+    def user_version(self, user_id: str) -> Optional[Any]:
+        try:
+            stat = self._user_path(user_id).stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def save_user(self, user_id: str, data: Dict[str, Any]) -> None:
+        _write_json(self._user_path(user_id), data, indent=2, fsync=self.fsync)
+
+    def load_evaluations(self, user_id: str, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        return _read_json(self._evaluations_path(user_id, session_id))
+
+    def save_evaluations(
+        self, user_id: str, session_id: str, evaluations: List[Dict[str, Any]]
+    ) -> None:
+        _write_json(self._evaluations_path(user_id, session_id), evaluations, fsync=self.fsync)
+
+
+class FlatFileMemoryStore(_FileMemoryStore):
+    """
+    Original layout: everything directly under one directory.
+
+        <root>/<encoded user_id>_memory.json
+        <root>/<encoded user_id>_evaluations/<encoded session_id>.json
+
+    Files written before ids were encoded used the raw user id; they are
+    still read, and moved to the encoded name on the next save.
+    """
+
+    def _user_path(self, user_id: str) -> Path:
+        return self.root / f"{encode_name(user_id)}_memory.json"
+
+    def _evaluations_path(self, user_id: str, session_id: str) -> Path:
+        return self.root / f"{encode_name(user_id)}_evaluations" / f"{encode_name(session_id)}.json"
+
+    def _legacy_name(self, user_id: str) -> Optional[str]:
+        """The pre-encoding file prefix, if it differs and is a safe single path component."""
+        if user_id == encode_name(user_id) or user_id in ("", ".", "..") or Path(user_id).name != user_id:
+            return None
+        return user_id
+
+    def load_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        data = super().load_user(user_id)
+        legacy = self._legacy_name(user_id)
+        if data is None and legacy is not None:
+            data = _read_json(self.root / f"{legacy}_memory.json")
+        return data
+
+    def save_user(self, user_id: str, data: Dict[str, Any]) -> None:
+        super().save_user(user_id, data)
+        legacy = self._legacy_name(user_id)
+        if legacy is not None:
+            # The encoded file now supersedes the raw-named one.
+            (self.root / f"{legacy}_memory.json").unlink(missing_ok=True)
+
+    def load_evaluations(self, user_id: str, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        evaluations = super().load_evaluations(user_id, session_id)
+        legacy = self._legacy_name(user_id)
+        if evaluations is None and legacy is not None:
+            evaluations = _read_json(self.root / f"{legacy}_evaluations" / f"{encode_name(session_id)}.json")
+        return evaluations
+
+    def iter_user_ids(self) -> Iterator[str]:
+        for path in self.root.glob("*_memory.json"):
+            name = path.name[: -len("_memory.json")]
+            try:
+                user_id = decode_name(name)
+            except (ValueError, UnicodeDecodeError):
+                user_id = name  # raw legacy name that is not a valid encoding
+            if user_id is None:
+                # Over-long ids are stored under a digest; the document knows the id.
+                user_id = (_read_json(path) or {}).get("user_id")
+            if user_id is not None:
+                yield user_id
+
+
+class ShardedFileMemoryStore(_FileMemoryStore):
+    """
+    Hash-sharded layout that keeps every directory small:
+
+        <root>/users/<h[0:2]>/<h[2:4]>/<encoded user_id>/memory.json
+        <root>/users/<h[0:2]>/<h[2:4]>/<encoded user_id>/evaluations/<session_id>.json
+
+    where `h` is the SHA-1 of the user id and the directory name is a
+    filesystem-safe encoding of it (see `encode_name`).
+    """
+
+    def _user_dir(self, user_id: str) -> Path:
+        digest = hashlib.sha1(user_id.encode("utf-8")).hexdigest()
+        return self.root / "users" / digest[:2] / digest[2:4] / encode_name(user_id)
+
+    def _user_path(self, user_id: str) -> Path:
+        return self._user_dir(user_id) / "memory.json"
+
+    def _evaluations_path(self, user_id: str, session_id: str) -> Path:
+        return self._user_dir(user_id) / "evaluations" / f"{encode_name(session_id)}.json"
+
+    def iter_user_ids(self) -> Iterator[str]:
+        for path in self.root.glob("users/*/*/*/memory.json"):
+            user_id = decode_name(path.parent.name)
+            if user_id is None:
+                # Over-long ids are stored under a digest; the document knows the id.
+                data = _read_json(path) or {}
+                user_id = data.get("user_id")
+            if user_id is not None:
+                yield user_id
+
+
+# In-memory backend -------------------------------------------------------- #
+class InMemoryMemoryStore(MemoryStore):
+    """Process-local store for tests; documents are deep-copied in and out."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._users: Dict[str, Dict[str, Any]] = {}
+        self._evaluations: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def load_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            data = self._users.get(user_id)
+            return copy.deepcopy(data) if data is not None else None
+
+    def save_user(self, user_id: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._users[user_id] = copy.deepcopy(data)
+
+    def load_evaluations(self, user_id: str, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            evaluations = self._evaluations.get((user_id, session_id))
+            return copy.deepcopy(evaluations) if evaluations is not None else None
+
+    def save_evaluations(
+        self, user_id: str, session_id: str, evaluations: List[Dict[str, Any]]
+    ) -> None:
+        with self._lock:
+            self._evaluations[(user_id, session_id)] = copy.deepcopy(evaluations)
+
+    def iter_user_ids(self) -> Iterator[str]:
+        with self._lock:
+            user_ids = list(self._users)
+        return iter(user_ids)
+
+
+# Helpers ------------------------------------------------------------------ #
+def encode_name(name: str) -> str:
+    """
+    Encode an arbitrary id as a single safe path component.
+
+    Characters outside [A-Za-z0-9_-] become `~XX` UTF-8 escapes, so names like
+    "../x", "a/b" or "CON" cannot escape the directory or collide. Results
+    longer than a safe limit are replaced by `~h<sha1>`, which `decode_name`
+    reports as undecodable.
+    """
+    encoded = "".join(
+        ch if _SAFE_NAME_CHARS.fullmatch(ch) else "".join(f"~{b:02X}" for b in ch.encode("utf-8"))
+        for ch in name
+    )
+    if not encoded or len(encoded) > _MAX_NAME_LEN:
+        return "~h" + hashlib.sha1(name.encode("utf-8")).hexdigest()
+    return encoded
+
+
+def decode_name(encoded: str) -> Optional[str]:
+    """Invert `encode_name`; returns None for digest-only names."""
+    if encoded.startswith("~h"):
+        return None
+    raw = bytearray()
+    i = 0
+    while i < len(encoded):
+        if encoded[i] == "~":
+            raw.append(int(encoded[i + 1 : i + 3], 16))
+            i += 3
+        else:
+            raw.extend(encoded[i].encode("ascii"))
+            i += 1
+    return raw.decode("utf-8")
+
+
+def _read_json(path: Path) -> Optional[Any]:
+    if not path.exists():
+        return None
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _write_json(path: Path, obj: Any, indent: Optional[int] = None, fsync: bool = True) -> None:
+    """Atomically replace `path` (tmp file + rename), optionally fsyncing first."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=indent)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+_stores: Dict[Tuple[str, Optional[Path]], MemoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_memory_store(
+    backend: str = "flat", root: Optional[Path] = None, fsync: bool = True
+) -> MemoryStore:
+    """
+    Return the shared store for `backend` ("flat" | "sharded" | "memory").
+
+    File backends need `root`; the in-memory backend is one per process.
+    """
+    if backend not in MEMORY_BACKENDS:
+        raise ValueError(f"Unknown memory backend {backend!r}; expected one of {MEMORY_BACKENDS}")
+
+    key = (backend, None if backend == "memory" else root)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            if backend == "memory":
+                store = InMemoryMemoryStore()
+            else:
+                if root is None:
+                    raise ValueError(f"The {backend!r} memory backend needs a root directory.")
+                store_cls = ShardedFileMemoryStore if backend == "sharded" else FlatFileMemoryStore
+                store = store_cls(root, fsync=fsync)
+            _stores[key] = store
+        return store
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from interview_partner.core.metrics import metrics
+from interview_partner.data.models import Evaluation, RubricScores
+from interview_partner.data.rubrics import RUBRIC_DESCRIPTIONS
+from interview_partner.services.retrieval import tokenize
+
+TRIVIAL_WORDS = 8  # below this an answer is scored locally, never sent to the LLM
+IDEAL_WORDS = (60, 200)
+IDEAL_SENTENCE_WORDS = (8, 25)
+AGREEMENT_TOLERANCE = 1.5  # mean absolute score difference still counted as agreement
+
+_SENTENCE = re.compile(r"[^.!?]+[.!?]*")
+_NUMBER = re.compile(r"\b\d+(?:[.,]\d+)?\s*(?:%|percent|x|k|m|ms|s|hours?|days?|weeks?|users?)?", re.I)
+_FILLERS = re.compile(r"\b(?:um+|uh+|erm|like|you know|basically|actually|literally|sort of|kind of)\b", re.I)
+_HEDGES = re.compile(r"\b(?:i think|i guess|maybe|probably|not sure|i'm not sure|perhaps|hopefully)\b", re.I)
+# Matched against the whole stripped, lowercased answer: "not sure at first, so I profiled it" is an answer.
+_NON_ANSWER = re.compile(
+    r"(?:(?:sorry|honestly|um+|uh+)[,.]?\s+)?"
+    r"(?:i (?:really )?don'?t know|(?:i have )?no idea|(?:i'?m )?not sure|pass|skip|no comment|next question)"
+    r"[.!?]*"
+)
+
+# Cue phrases per STAR section (matched case-insensitively).
+STAR_CUES: Dict[str, re.Pattern] = {
+    "situation": re.compile(r"\b(?:when i was|at my (?:previous|last|current)|situation|context|background|we had|there was)\b", re.I),
+    "task": re.compile(r"\b(?:my (?:task|role|goal|job) was|i (?:was|were) responsible|i needed to|i had to|goal was|objective)\b", re.I),
+    "action": re.compile(r"\b(?:i (?:decided|built|designed|implemented|led|created|wrote|organized|reached out|set up|proposed|worked))\b", re.I),
+    "result": re.compile(r"\b(?:as a result|resulted|outcome|in the end|reduced|increased|improved|saved|grew|delivered|launched)\b", re.I),
+}
+
+
+@dataclass(frozen=True)
+class AnswerFeatures:
+    word_count: int
+    sentence_count: int
+    avg_sentence_words: float
+    filler_rate: float  # fillers per word
+    hedge_count: int
+    star_sections: List[str]
+    number_mentions: int
+    result_mentions: int
+    question_overlap: float  # share of question terms echoed in the answer
+    non_answer: bool
+
+
+@dataclass
+class Prescore:
+    scores: Dict[str, int]
+    confidence: float  # 0..1, how likely the LLM critic lands within tolerance
+    trivial: bool
+    features: AnswerFeatures
+    notes: List[str] = field(default_factory=list)
+
+
+def extract_features(question: str, answer: str) -> AnswerFeatures:
+    words = answer.split()
+    sentences = [s for s in _SENTENCE.findall(answer) if s.split()]
+    q_terms = set(tokenize(question))
+    a_terms = set(tokenize(answer))
+    return AnswerFeatures(
+        word_count=len(words),
+        sentence_count=len(sentences),
+        avg_sentence_words=len(words) / len(sentences) if sentences else float(len(words)),
+        filler_rate=len(_FILLERS.findall(answer)) / len(words) if words else 0.0,
+        hedge_count=len(_HEDGES.findall(answer)),
+        star_sections=[name for name, cue in STAR_CUES.items() if cue.search(answer)],
+        number_mentions=len(_NUMBER.findall(answer)),
+        result_mentions=len(STAR_CUES["result"].findall(answer)),
+        question_overlap=len(q_terms & a_terms) / len(q_terms) if q_terms else 0.0,
+        non_answer=_NON_ANSWER.fullmatch(" ".join(words).lower()) is not None,
+    )
+
+
+def _clamp(value: float) -> int:
+    return int(max(1, min(10, round(value))))
+
+
+def _band(value: float, low: float, high: float) -> float:
+    """1.0 inside [low, high], falling off linearly to 0 at half / double the band."""
+    if value < low:
+        return max(0.0, (value - low / 2) / (low / 2))
+    if value > high:
+        return max(0.0, 1 - (value - high) / high)
+    return 1.0
+
+
+def prescore(question: str, answer: str) -> Prescore:
+    """
+    Instant, network-free provisional rubric scores.
+
+    - brevity: word count against an ideal band
+    - clarity: sentence length and filler-word rate
+    - structure_STAR: number of STAR sections detected by cue phrases
+    - confidence: hedges and fillers
+    - technical_or_role_fit: question-term overlap plus concrete numbers/results
+
+    Trivial answers (a few words, or "I don't know") are decidable locally and
+    get a high confidence; everything else is provisional.
+    """
+    f = extract_features(question, answer)
+    if f.word_count < TRIVIAL_WORDS or f.non_answer:
+        return Prescore(
+            scores={**{k: 2 for k in RUBRIC_DESCRIPTIONS}, "brevity": 3},
+            confidence=0.95,
+            trivial=True,
+            features=f,
+            notes=["Answer is too short to demonstrate the skill asked about."],
+        )
+
+    length = _band(f.word_count, *IDEAL_WORDS)
+    concrete = min(1.0, (f.number_mentions + f.result_mentions) / 3)
+    scores = {
+        "brevity": _clamp(3 + 6 * length),
+        "clarity": _clamp(3 + 5 * _band(f.avg_sentence_words, *IDEAL_SENTENCE_WORDS) - 40 * f.filler_rate + length),
+        "structure_STAR": _clamp(2 + 2 * len(f.star_sections)),
+        "confidence": _clamp(7 - f.hedge_count - 30 * f.filler_rate + concrete),
+        "technical_or_role_fit": _clamp(3 + 3 * f.question_overlap + 2 * concrete + length),
+    }
+
+    # Far-off-band answers are easier to call than middling ones.
+    confidence = 0.35
+    if f.word_count < 25:
+        confidence += 0.25
+    if len(f.star_sections) in (0, 4):
+        confidence += 0.1
+    notes = []
+    if f.word_count < 30:
+        notes.append("Very short answer; add context and concrete details.")
+    if "result" not in f.star_sections:
+        notes.append("No clear result or outcome.")
+    if f.filler_rate > 0.05:
+        notes.append("Frequent filler words.")
+    return Prescore(
+        scores={k: scores[k] for k in RUBRIC_DESCRIPTIONS},
+        confidence=min(confidence, 0.9),
+        trivial=False,
+        features=f,
+        notes=notes,
+    )
+
+
+def evaluation_from_prescore(question: str, answer: str, pre: Prescore) -> Evaluation:
+    """
+    A critic-shaped evaluation built only from the local pre-score.
+
+    It carries no weak spots: the pre-score cannot tell which topic an answer
+    was weak on, and fixed tags would flow into long-term memory and drill
+    selection for every locally scored turn.
+    """
+    return Evaluation(
+        question=question,
+        answer=answer,
+        scores=RubricScores.from_dict(pre.scores),
+        weak_spots=[],
+        comments=" ".join(pre.notes) or "Scored locally.",
+        source="prescorer",
+    )
+
+
+def record_agreement(pre: Prescore, llm_scores: Dict[str, Any]) -> None:
+    """Compare a pre-score with the LLM critic's scores and update metrics."""
+    diffs = [
+        abs(pre.scores[k] - float(llm_scores[k]))
+        for k in pre.scores
+        if isinstance(llm_scores.get(k), (int, float))
+    ]
+    if not diffs:
+        return
+    mean_diff = sum(diffs) / len(diffs)
+    metrics.incr("prescorer.compared")
+    metrics.observe("prescorer.abs_error", mean_diff)
+    if mean_diff <= AGREEMENT_TOLERANCE:
+        metrics.incr("prescorer.agreed")
+
+
+def stats() -> Dict[str, Any]:
+    compared = metrics.counter("prescorer.compared")
+    return {
+        "compared": compared,
+        "agreement_rate": metrics.counter("prescorer.agreed") / compared if compared else 0.0,
+        "mean_abs_error": metrics.mean("prescorer.abs_error"),
+        "llm_skipped": metrics.counter("prescorer.llm_skipped"),
+    }
@@ -1,17 +1,284 @@
 from __future__ import annotations
 
-from typing import List
+import hashlib
+import io
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
+import numpy as np
 
-def extract_topics_from_resume(resume_text: str, job_description: str | None = None) -> List[str]:
+from interview_partner.core.metrics import metrics
+from interview_partner.data.qbank import QUESTION_BANK, normalize_tag
+from interview_partner.services.retrieval import EMBED_DIM, embed, tokenize
+from interview_partner.services.vector_index import UserVectorIndex
+
+try:
+    from pypdf import PdfReader  # type: ignore
+except Exception:  # pragma: no cover - PDF support is optional
+    PdfReader = None  # type: ignore
+
+DocumentSource = Union[str, bytes, Path, IO[bytes], IO[str]]
+
+CHUNK_WORDS = 120
+CHUNK_OVERLAP = 30
+
+# Common skills beyond the question-bank tags, written as plain phrases.
+SKILL_LEXICON: Tuple[str, ...] = (
+    "python", "java", "javascript", "typescript", "golang", "rust", "sql", "nosql",
+    "react", "node", "django", "flask", "spring", "kubernetes", "docker", "terraform",
+    "aws", "gcp", "azure", "ci cd", "microservices", "distributed systems", "system design",
+    "data structures", "algorithms", "machine learning", "data analysis", "testing",
+    "unit testing", "code review", "debugging", "performance", "security", "observability",
+    "api design", "graphql", "caching", "databases", "scalability",
+    "leadership", "mentoring", "stakeholder management", "communication", "collaboration",
+    "project management", "agile", "ownership", "prioritization", "time management",
+    "negotiation", "prospecting", "lead qualification", "pipeline management", "crm",
+    "salesforce", "cold calling", "account management", "closing", "objection handling",
+    "customer success", "de escalation", "empathy", "ticketing", "zendesk", "sla",
+    "documentation", "onboarding", "troubleshooting",
+)
+
+
+# Parsing & chunking ------------------------------------------------------- #
+def iter_document_lines(source: DocumentSource, name: str = "") -> Iterator[str]:
     """
-    Stub for future Resume RAG integration.
+    Stream text lines from a resume / JD without loading it whole.
+
+    Accepts raw text, bytes, a path, or a binary/text file object (e.g. a
+    Streamlit upload). PDFs are read page by page when `pypdf` is installed.
+    """
+    if isinstance(source, str):
+        yield from io.StringIO(source)
+        return
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    if isinstance(source, Path):
+        name = name or source.name
+        with source.open("rb") as f:
+            yield from iter_document_lines(f, name=name)
+        return
+
+    name = name or getattr(source, "name", "") or ""
+    if getattr(source, "seekable", lambda: False)():
+        source.seek(0)  # uploads are re-read across reruns
+    if name.lower().endswith(".pdf"):
+        if PdfReader is None:
+            raise RuntimeError("Reading PDF resumes needs 'pypdf' (pip install -r requirements.txt).")
+        for page in PdfReader(source).pages:
+            yield from (page.extract_text() or "").splitlines()
+        return
+
+    for line in source:
+        yield line.decode("utf-8", errors="replace") if isinstance(line, bytes) else line
+
+
+def iter_chunks(
+    lines: Iterable[str], chunk_words: int = CHUNK_WORDS, overlap: int = CHUNK_OVERLAP
+) -> Iterator[str]:
+    """Sliding word windows over a line stream (only one window is held in memory)."""
+    window: List[str] = []
+    for line in lines:
+        window.extend(line.split())
+        while len(window) >= chunk_words:
+            yield " ".join(window[:chunk_words])
+            window = window[chunk_words - overlap :]
+    if window:
+        yield " ".join(window)
+
+
+# BM25 --------------------------------------------------------------------- #
+@dataclass
+class BM25Index:
+    """In-memory Okapi BM25 over document chunks."""
+
+    k1: float = 1.5
+    b: float = 0.75
+    chunks: List[str] = field(default_factory=list)
+    postings: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)  # term -> [(chunk, tf)]
+    lengths: List[int] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, chunks: Iterable[str]) -> "BM25Index":
+        index = cls()
+        for chunk in chunks:
+            index.add(chunk)
+        return index
+
+    def add(self, chunk: str) -> None:
+        doc_id = len(self.chunks)
+        terms = tokenize(chunk)
+        self.chunks.append(chunk)
+        self.lengths.append(len(terms))
+        for term, tf in Counter(terms).items():
+            self.postings.setdefault(term, []).append((doc_id, tf))
+
+    @property
+    def avg_length(self) -> float:
+        return sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+
+    def idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        n = len(self.chunks)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def scores(self, query: str) -> Dict[int, float]:
+        avg = self.avg_length or 1.0
+        out: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            idf = self.idf(term)
+            for doc_id, tf in self.postings.get(term, ()):
+                norm = tf + self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / avg)
+                out[doc_id] = out.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / norm
+        return out
+
+    def search(self, query: str, k: int = 3) -> List[Tuple[int, float]]:
+        return sorted(self.scores(query).items(), key=lambda kv: kv[1], reverse=True)[:k]
+
+    def contains_phrase_terms(self, phrase: str) -> bool:
+        """True if some chunk contains every term of `phrase`."""
+        terms = set(tokenize(phrase))
+        if not terms:
+            return False
+        docs: Optional[Set[int]] = None
+        for term in terms:
+            ids = {doc_id for doc_id, _ in self.postings.get(term, ())}
+            docs = ids if docs is None else docs & ids
+            if not docs:
+                return False
+        return bool(docs)
+
+
+# Skill gaps --------------------------------------------------------------- #
+def skill_vocabulary() -> List[str]:
+    """Lexicon skills plus every question-bank tag, as plain phrases."""
+    phrases = {s for s in SKILL_LEXICON}
+    for role in QUESTION_BANK:
+        for q in QUESTION_BANK.role_bank(role).questions:
+            phrases.update(tag.replace("_", " ") for tag in q.tags)
+    return sorted(p for p in phrases if tokenize(p))
+
+
+def mentioned_skills(index: BM25Index, vocabulary: Sequence[str]) -> Dict[str, float]:
+    """Skills whose terms co-occur in some chunk, with their best BM25 chunk score."""
+    found: Dict[str, float] = {}
+    for skill in vocabulary:
+        if index.contains_phrase_terms(skill):
+            best = index.search(skill, k=1)
+            found[skill] = best[0][1] if best else 0.0
+    return found
+
+
+def skill_gaps(
+    resume: BM25Index,
+    job: BM25Index,
+    vocabulary: Optional[Sequence[str]] = None,
+    coverage: Optional[np.ndarray] = None,
+) -> List[str]:
+    """
+    Skills the JD asks for that the resume does not evidence, most
+    prominent in the JD first; then frequent JD terms absent from the resume.
+
+    `coverage` (per JD chunk, best cosine similarity to any resume chunk)
+    down-weights gaps found in JD sections the resume already covers in
+    other words.
+    """
+    vocabulary = list(vocabulary) if vocabulary is not None else skill_vocabulary()
+    job_skills = mentioned_skills(job, vocabulary)
+    gaps = [s for s in job_skills if not resume.contains_phrase_terms(s)]
+
+    def weight(skill: str) -> float:
+        if coverage is None or not len(coverage):
+            return job_skills[skill]
+        chunk, score = job.search(skill, k=1)[0]
+        return score * (1.0 - float(coverage[chunk]))
+
+    gaps.sort(key=weight, reverse=True)
+
+    # Frequent JD terms outside the lexicon (e.g. product names) missing from the resume.
+    covered = {t for s in job_skills for t in tokenize(s)}
+    frequent = sorted(
+        (
+            (sum(tf for _, tf in posts), term)
+            for term, posts in job.postings.items()
+            if len(term) > 3 and term not in covered and term not in resume.postings
+        ),
+        reverse=True,
+    )
+    gaps.extend(term for count, term in frequent if count >= 2)
+    return gaps
+
+
+def chunk_document(source: DocumentSource, name: str = "") -> Tuple[List[str], str]:
+    """Chunks of a document plus the SHA-1 of its text, in one streaming pass."""
+    digest = hashlib.sha1()
+
+    def hashed(lines: Iterable[str]) -> Iterator[str]:
+        for line in lines:
+            digest.update(line.encode("utf-8"))
+            yield line
+
+    chunks = list(iter_chunks(hashed(iter_document_lines(source, name=name))))
+    return chunks, digest.hexdigest()
+
+
+def document_vectors(
+    source: DocumentSource, kind: str, user_id: Optional[str] = None
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Chunks and chunk embeddings for a document.
+
+    With a `user_id`, vectors live in that user's persistent `UserVectorIndex`
+    keyed by content hash: an unchanged re-upload skips embedding entirely and
+    returns a read-only mmap view.
+    """
+    chunks, content_hash = chunk_document(source)
+    if user_id is None:
+        vectors = np.stack([embed(c) for c in chunks]) if chunks else np.zeros((0, EMBED_DIM), dtype=np.float32)
+        return chunks, vectors
+    index = UserVectorIndex(user_id)
+    cached = index.get(content_hash)
+    if cached is not None:
+        return cached
+    return chunks, index.put(content_hash, kind, chunks)
+
+
+def build_index(source: DocumentSource, name: str = "") -> BM25Index:
+    with metrics.timer("resume_rag.index_build_s"):
+        return BM25Index.build(iter_chunks(iter_document_lines(source, name=name)))
+
+
+def extract_topics_from_resume(
+    resume_text: DocumentSource,
+    job_description: Optional[DocumentSource] = None,
+    top_k: int = 6,
+    user_id: Optional[str] = None,
+) -> List[str]:
+    """
+    Infer interview topics from a resume and (optionally) a job description.
+
+    - With a JD: skill gaps (JD skills the resume does not evidence), ranked
+      by how poorly the resume covers the JD section they appear in.
+    - Without: the resume's most prominent skills, to probe its claims.
 
-    For now, returns an empty list to keep the wiring simple. In a future version,
-    this can:
-    - chunk the resume and job description,
-    - run them through a retrieval model,
-    - and infer skill / topic gaps to feed into the InterviewerAgent.
+    Everything runs locally (chunking, in-memory BM25, hashed embeddings);
+    with a `user_id` the chunk vectors are reused from the persistent index.
+    Topics are returned as normalized tags ready for `InterviewerAgent.topics`.
     """
-    _ = (resume_text, job_description)  # unused
-    return []
+    with metrics.timer("resume_rag.index_build_s"):
+        resume_chunks, resume_vecs = document_vectors(resume_text, "resume", user_id)
+        resume = BM25Index.build(resume_chunks)
+    with metrics.timer("resume_rag.query_s"):
+        if job_description is not None:
+            job_chunks, job_vecs = document_vectors(job_description, "job_description", user_id)
+            job = BM25Index.build(job_chunks)
+            coverage = None
+            if len(resume_vecs) and len(job_vecs):
+                coverage = np.max(job_vecs @ resume_vecs.T, axis=1)  # mmap scan, no copy of the index
+            topics = skill_gaps(resume, job, coverage=coverage)
+        else:
+            skills = mentioned_skills(resume, skill_vocabulary())
+            topics = sorted(skills, key=skills.get, reverse=True)
+    return list(dict.fromkeys(normalize_tag(t) for t in topics if normalize_tag(t)))[:top_k]
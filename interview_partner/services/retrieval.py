@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import re
+import threading
+import zlib
+from typing import Dict, Iterable, List, Sequence, Tuple, overload
+
+import numpy as np
+
+from interview_partner.data.qbank import QUESTION_BANK, Question, RoleBank
+
+N_FEATURES = 1 << 18
+EMBED_DIM = 1024  # `embed()` output size; persisted and stacked vectors use it too
+MIN_DRILL_SIMILARITY = 0.12
+
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by do for from how i in is it me of on or that the this to "
+    "was we what when where which who why with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; "_" and "-" split words so tags read like text."""
+    return [w for w in _WORD.findall(text.lower()) if w not in _STOPWORDS]
+
+
+def _features(text: str) -> Dict[int, float]:
+    """
+    Hashed bag of features for one text:
+    - word unigrams and bigrams
+    - character trigrams of each word (with boundary markers), which lets
+      "designing" match "design" without a stemmer
+    """
+    words = tokenize(text)
+    grams: List[str] = list(words)
+    grams.extend(f"{a} {b}" for a, b in zip(words, words[1:]))
+    for w in words:
+        padded = f"<{w}>"
+        grams.extend("#" + padded[i : i + 3] for i in range(len(padded) - 2))
+
+    counts: Dict[int, float] = {}
+    for g in grams:
+        h = zlib.crc32(g.encode("utf-8")) % N_FEATURES
+        counts[h] = counts.get(h, 0.0) + 1.0
+    return counts
+
+
+def embed(text: str, dim: int = EMBED_DIM) -> np.ndarray:
+    """
+    Corpus-free dense embedding: hashed features folded into `dim` buckets,
+    sublinear TF, L2-normalized (all zeros for empty text).
+    """
+    vec = np.zeros(dim, dtype=np.float32)
+    feats = _features(text)
+    if not feats:
+        return vec
+    idx = np.fromiter(feats.keys(), dtype=np.int64, count=len(feats)) % dim
+    np.add.at(vec, idx, np.log1p(np.fromiter(feats.values(), dtype=np.float32, count=len(feats))))
+    return vec / np.linalg.norm(vec)
+
+
+class HashedTfidfIndex:
+    """
+    Local TF-IDF retrieval over hashed features (no network, no GPU).
+
+    Documents are stored as an L2-normalized CSR matrix in plain NumPy arrays
+    (`indptr`, `indices`, `data`); scoring a query is one gather-multiply
+    plus `np.add.reduceat` over all rows.
+    """
+
+    def __init__(self, documents: Sequence[str]) -> None:
+        rows = [_features(doc) for doc in documents]
+        self.n_docs = len(rows)
+
+        lengths = np.fromiter((len(r) for r in rows), dtype=np.int64, count=self.n_docs)
+        self.indptr = np.zeros(self.n_docs + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        self.indices = np.fromiter(
+            (h for r in rows for h in r), dtype=np.int64, count=int(self.indptr[-1])
+        )
+        tf = np.fromiter(
+            (c for r in rows for c in r.values()), dtype=np.float32, count=int(self.indptr[-1])
+        )
+
+        # Smoothed IDF over the hashed feature space.
+        df = np.bincount(self.indices, minlength=N_FEATURES).astype(np.float32)
+        self.idf = np.log((1.0 + self.n_docs) / (1.0 + df)) + 1.0
+
+        data = np.log1p(tf) * self.idf[self.indices]
+        norms = np.sqrt(np.add.reduceat(data * data, self.indptr[:-1])) if self.n_docs else data
+        norms = np.where(lengths > 0, norms, 1.0)
+        self.data = (data / np.repeat(norms, lengths)).astype(np.float32)
+        self._nonempty = lengths > 0
+
+    def _query_vector(self, text: str) -> np.ndarray:
+        vec = np.zeros(N_FEATURES, dtype=np.float32)
+        feats = _features(text)
+        if not feats:
+            return vec
+        idx = np.fromiter(feats.keys(), dtype=np.int64, count=len(feats))
+        tf = np.fromiter(feats.values(), dtype=np.float32, count=len(feats))
+        weights = np.log1p(tf) * self.idf[idx]
+        vec[idx] = weights / np.linalg.norm(weights)
+        return vec
+
+    def scores(self, text: str) -> np.ndarray:
+        """Cosine similarity of `text` against every document."""
+        out = np.zeros(self.n_docs, dtype=np.float32)
+        if self.n_docs == 0:
+            return out
+        q = self._query_vector(text)
+        summed = np.add.reduceat(self.data * q[self.indices], self.indptr[:-1])
+        out[self._nonempty] = summed[self._nonempty]
+        return out
+
+    def top_k(self, queries: Iterable[str], k: int = 5) -> List[Tuple[int, float]]:
+        """
+        Best `k` documents for a set of queries, scoring each document by its
+        best match across the queries.
+        """
+        queries = [q for q in queries if q.strip()]
+        if not queries or self.n_docs == 0:
+            return []
+        best = np.max(np.stack([self.scores(q) for q in queries]), axis=0)
+        k = min(k, self.n_docs)
+        top = np.argpartition(-best, k - 1)[:k]
+        top = top[np.argsort(-best[top], kind="stable")]
+        return [(int(i), float(best[i])) for i in top]
+
+
+def question_document(q: Question) -> str:
+    # Tags carry the topical signal, so they are repeated to weigh more than wording.
+    tags = " ".join(q.tags)
+    return f"{q.text} {q.topic} {tags} {tags}"
+
+
+_indexes: Dict[int, Tuple[RoleBank, HashedTfidfIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def question_index(bank: RoleBank) -> HashedTfidfIndex:
+    """Return the (cached) retrieval index for one role bank."""
+    cached = _indexes.get(id(bank))
+    if cached is not None and cached[0] is bank:
+        return cached[1]
+    with _indexes_lock:
+        cached = _indexes.get(id(bank))
+        if cached is None or cached[0] is not bank:
+            index = HashedTfidfIndex([question_document(q) for q in bank.questions])
+            _indexes[id(bank)] = (bank, index)
+            return index
+        return cached[1]
+
+
+class RankedQuestions(Sequence[Question]):
+    """
+    Read-only view of a role bank with the questions at `first` moved to the
+    front (in that order) and the rest following in bank order.
+
+    Only the ranked indices are stored; the bank's question tuple is shared,
+    not copied, so each interviewer costs O(hits) rather than O(bank size).
+    """
+
+    __slots__ = ("questions", "first", "_skipped")
+
+    def __init__(self, questions: Tuple[Question, ...], first: Sequence[int]) -> None:
+        self.questions = questions
+        self.first = tuple(first)
+        self._skipped = sorted(self.first)
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    @overload
+    def __getitem__(self, pos: int) -> Question: ...
+
+    @overload
+    def __getitem__(self, pos: slice) -> List[Question]: ...
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            return [self[i] for i in range(*pos.indices(len(self)))]
+        if pos < 0:
+            pos += len(self)
+        if not 0 <= pos < len(self):
+            raise IndexError(pos)
+        if pos < len(self.first):
+            return self.questions[self.first[pos]]
+        # The j-th question not in `first`: step over every ranked index at or below it.
+        i = pos - len(self.first)
+        for skipped in self._skipped:
+            if skipped > i:
+                break
+            i += 1
+        return self.questions[i]
+
+
+def rank_questions_for_topics(
+    role: str, topics: Sequence[str], min_similarity: float = MIN_DRILL_SIMILARITY
+) -> Sequence[Question]:
+    """
+    Questions for `role` ordered for a drill on `topics` (e.g. weak spots):
+
+    - exact tag matches first, in bank order (an inverted-index lookup)
+    - then the other questions similar to `topics`, in descending similarity
+    - then the rest, in bank order
+
+    Returns the bank's own tuple when nothing matches, else a `RankedQuestions`
+    view over it.
+    """
+    bank = QUESTION_BANK.role_bank(role)
+    first = bank.indices_for_tags(topics)
+    tagged = set(first)
+    first += [
+        i
+        for i, score in question_index(bank).top_k(topics, k=len(bank.questions))
+        if score >= min_similarity and i not in tagged
+    ]
+    if not first:
+        return bank.questions
+    return RankedQuestions(bank.questions, first)
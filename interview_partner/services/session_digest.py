@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping
+
+from interview_partner.data.rubrics import RUBRIC_DESCRIPTIONS
+
+RECENT_ENTRIES = 6  # per-answer lines kept verbatim in the digest
+TOP_TOPICS = 8
+QUESTION_CHARS = 120
+NOTE_CHARS = 160
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+@dataclass
+class SessionDigest:
+    """
+    Running aggregate of a session's evaluations, updated after every answer.
+
+    - score sums per rubric key (for averages)
+    - weak-spot / strength topic frequencies
+    - a rolling window of compact per-answer lines (clipped question, scores,
+      tags and comment)
+
+    `prompt_payload()` stays bounded no matter how long the session runs, so
+    the end-of-session summary call has a fixed input size, and
+    `local_summary()` produces a summary without any LLM call.
+    """
+
+    role: str
+    count: int = 0
+    score_sums: Dict[str, float] = field(default_factory=lambda: {k: 0.0 for k in RUBRIC_DESCRIPTIONS})
+    weak_counts: Counter = field(default_factory=Counter)
+    strength_counts: Counter = field(default_factory=Counter)
+    recent: List[Dict[str, Any]] = field(default_factory=list)
+
+    def add(self, evaluation: Mapping[str, Any]) -> None:
+        scores = evaluation.get("scores") or {}
+        self.count += 1
+        for k in self.score_sums:
+            if isinstance(scores.get(k), (int, float)):
+                self.score_sums[k] += float(scores[k])
+        self.weak_counts.update(str(t) for t in evaluation.get("weak_spots", []) if t)
+        self.strength_counts.update(str(t) for t in evaluation.get("strengths", []) if t)
+
+        self.recent.append(
+            {
+                "question": _clip(evaluation.get("question", ""), QUESTION_CHARS),
+                "scores": {k: scores.get(k) for k in self.score_sums if k in scores},
+                "weak_spots": list(evaluation.get("weak_spots", []))[:3],
+                "strengths": list(evaluation.get("strengths", []))[:3],
+                "comment": _clip(evaluation.get("comments", ""), NOTE_CHARS),
+            }
+        )
+        del self.recent[:-RECENT_ENTRIES]
+
+    def averages(self) -> Dict[str, float]:
+        if not self.count:
+            return {}
+        return {k: round(v / self.count, 2) for k, v in self.score_sums.items()}
+
+    def prompt_payload(self) -> Dict[str, Any]:
+        return {
+            "num_questions": self.count,
+            "average_scores": self.averages(),
+            "weak_spot_frequencies": dict(self.weak_counts.most_common(TOP_TOPICS)),
+            "strength_frequencies": dict(self.strength_counts.most_common(TOP_TOPICS)),
+            "recent_answers": self.recent,
+        }
+
+    def local_summary(self) -> Dict[str, Any]:
+        """Summary computed only from the aggregate (used when the LLM is unavailable)."""
+        averages = self.averages()
+        overall = sum(averages.values()) / len(averages) if averages else 0.0
+        summary_text = (
+            f"You completed a {self.count}-question interview practice session for the {self.role} role. "
+            f"Your overall performance averaged {overall:.1f}/10 across all criteria. "
+        )
+        if averages:
+            weakest = min(averages, key=averages.get)
+            strongest = max(averages, key=averages.get)
+            summary_text += (
+                f"Your strongest area was {strongest.replace('_', ' ')} ({averages[strongest]:.1f}) "
+                f"and the one to work on is {weakest.replace('_', ' ')} ({averages[weakest]:.1f}). "
+            )
+        summary_text += (
+            "Continue practicing, focusing on specific examples and structuring your answers "
+            "using the STAR method (Situation, Task, Action, Result)."
+        )
+        return {
+            "summary_text": summary_text,
+            "weak_spot_topics": [t for t, _ in self.weak_counts.most_common(5)],
+            "strength_topics": [t for t, _ in self.strength_counts.most_common(5)],
+        }
+
+    @classmethod
+    def from_evaluations(cls, role: str, evaluations: Iterable[Mapping[str, Any]]) -> "SessionDigest":
+        digest = cls(role=role)
+        for e in evaluations:
+            digest.add(e)
+        return digest
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from interview_partner.config import settings
+from interview_partner.core.metrics import metrics
+from interview_partner.services.checkpoints import get_checkpoint_store
+from interview_partner.services.memory_store import encode_name
+
+from interview_partner.data.models import SessionSummary
+
+if TYPE_CHECKING:  # agents import services, not the other way round at runtime
+    from interview_partner.agents.orchestrator import Orchestrator
+
+# Agents, bank references and interpreter overhead not visible in to_state().
+SESSION_BASE_BYTES = 16 * 1024
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Approximate bytes held by a structure of containers and slotted objects
+    (shared objects, e.g. interned tags, counted once).
+    """
+    seen: set = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(type(item), "__slots__"):
+            for klass in type(item).__mro__:
+                for name in getattr(klass, "__slots__", ()):
+                    if hasattr(item, name):
+                        stack.append(getattr(item, name))
+    return total
+
+
+@dataclass
+class PooledSession:
+    """One interview held by the pool: orchestrator, its audio clips and the final summary."""
+
+    session_id: str
+    orchestrator: "Orchestrator"
+    audio: Dict[str, bytes] = field(default_factory=dict)
+    summary: Optional[SessionSummary] = None
+    last_active: float = field(default_factory=time.time)
+    resident_bytes: int = 0
+    pins: int = 0  # > 0 while a turn is using the session; pinned sessions are never evicted
+
+
+class SessionPool:
+    """
+    Process-wide, memory-bounded home for live interview sessions.
+
+    - every session's footprint is estimated (`measure()`): its checkpoint
+      state, audio clips and summary, plus SESSION_BASE_BYTES
+    - when the resident total exceeds `budget_bytes`, sessions idle for at
+      least `min_idle_s` are evicted least recently used first: the
+      orchestrator is checkpointed (see `services.checkpoints`), audio and
+      summary are spilled under `spill_dir`, and the RAM copy is dropped
+    - `get()` reloads an evicted session transparently; spilled audio is read
+      back lazily, clip by clip, by `get_audio()`
+    - the pool lock only guards bookkeeping: checkpoint / spill I/O and
+      Orchestrator restores run outside it. A session being evicted or
+      reloaded is marked "in transit"; `get()` on it waits for that one
+      session only, and eviction skips sessions already in transit
+
+    Spill layout, sharded like the checkpoints:
+
+        <spill_dir>/<h[0:2]>/<h[2:4]>/<encoded session id>/summary.json
+        <spill_dir>/<h[0:2]>/<h[2:4]>/<encoded session id>/audio/<sha1(key)>.wav
+
+    Counters go to `core.metrics` under "session_pool.*"; see `stats()`.
+    """
+
+    def __init__(self, budget_bytes: int, spill_dir: Path, min_idle_s: float = 120.0) -> None:
+        self.budget_bytes = budget_bytes
+        self.spill_dir = Path(spill_dir)
+        self.min_idle_s = min_idle_s
+        self._resident: "OrderedDict[str, PooledSession]" = OrderedDict()  # LRU first
+        self._spilled: Dict[str, float] = {}  # evicted session id -> last activity
+        self._transit: Dict[str, threading.Event] = {}  # being evicted / reloaded; set when done
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._resident) + len(self._spilled)
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._resident or session_id in self._spilled
+
+    def is_resident(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._resident
+
+    # Sessions -------------------------------------------------------------- #
+    def add(self, orchestrator: "Orchestrator") -> PooledSession:
+        session = PooledSession(session_id=orchestrator.checkpoint_id, orchestrator=orchestrator)
+        self.measure(session)
+        with self._lock:
+            self._resident[session.session_id] = session
+        metrics.incr("session_pool.added")
+        self.enforce_budget()
+        return session
+
+    def get(self, session_id: str) -> PooledSession:
+        """The session, reloaded from disk if it was evicted; KeyError if unknown."""
+        return self._acquire(session_id, pin=False)
+
+    def _acquire(self, session_id: str, pin: bool) -> PooledSession:
+        """Touch (and optionally pin) the session, waiting out or doing its reload."""
+        while True:
+            with self._lock:
+                gate = self._transit.get(session_id)
+                if gate is None:
+                    session = self._resident.get(session_id)
+                    if session is not None:
+                        session.last_active = time.time()
+                        session.pins += 1 if pin else 0
+                        self._resident.move_to_end(session_id)
+                        return session
+                    gate = self._transit[session_id] = threading.Event()
+                    break  # this thread reloads it
+            gate.wait()  # evicted or reloaded by another thread; look again
+
+        try:
+            session = self._reload(session_id)
+        except BaseException:
+            with self._lock:
+                del self._transit[session_id]
+            gate.set()
+            raise
+        with self._lock:
+            session.last_active = time.time()
+            session.pins += 1 if pin else 0
+            self._spilled.pop(session_id, None)
+            self._resident[session_id] = session
+            del self._transit[session_id]
+        gate.set()
+        self.enforce_budget()
+        return session
+
+    @contextmanager
+    def use(self, session_id: str) -> Iterator[PooledSession]:
+        """Pin the session for one turn, then re-measure it and enforce the budget."""
+        session = self._acquire(session_id, pin=True)
+        try:
+            yield session
+        finally:
+            self.measure(session)  # still pinned: nothing else mutates or evicts it
+            with self._lock:
+                session.pins -= 1
+                session.last_active = time.time()
+            self.enforce_budget()
+
+    def remove(self, session_id: str) -> bool:
+        """Forget the session entirely: RAM copy, checkpoint and spilled files."""
+        with self._lock:
+            known = self._resident.pop(session_id, None) is not None
+            known = self._spilled.pop(session_id, None) is not None or known
+        get_checkpoint_store().delete(session_id)
+        shutil.rmtree(self._spill_path(session_id), ignore_errors=True)
+        return known
+
+    def reap_idle(self, ttl: float) -> int:
+        """Remove sessions (resident or spilled) idle for more than `ttl` seconds."""
+        cutoff = time.time() - ttl
+        with self._lock:
+            idle = [
+                sid
+                for sid, s in self._resident.items()
+                if s.last_active < cutoff and not s.pins and sid not in self._transit
+            ]
+            idle += [sid for sid, last in self._spilled.items() if last < cutoff and sid not in self._transit]
+        for sid in idle:
+            self.remove(sid)
+        if idle:
+            metrics.incr("session_pool.reaped", len(idle))
+        return len(idle)
+
+    # Audio ----------------------------------------------------------------- #
+    def put_audio(self, session_id: str, key: str, data: bytes) -> None:
+        """Store a clip (b"" records a failed synthesis, so it is not retried)."""
+        session = self.get(session_id)
+        with self._lock:
+            session.audio[key] = data
+            self.measure(session)
+        self.enforce_budget()
+
+    def get_audio(self, session_id: str, key: str) -> Optional[bytes]:
+        """The clip for `key`, read back from the spill directory if needed; None if unknown."""
+        session = self.get(session_id)
+        with self._lock:
+            data = session.audio.get(key)
+        if data is None:
+            path = self._audio_path(session_id, key)
+            if not path.exists():
+                return None
+            data = path.read_bytes()
+            with self._lock:
+                data = session.audio.setdefault(key, data)
+                self.measure(session)
+            metrics.incr("session_pool.audio_reloaded")
+            self.enforce_budget()
+        return data
+
+    # Footprint / eviction -------------------------------------------------- #
+    def measure(self, session: PooledSession) -> int:
+        orch = session.orchestrator
+        # One pass, so evaluations shared by the orchestrator and the summary count once.
+        session.resident_bytes = (
+            SESSION_BASE_BYTES
+            + deep_sizeof((orch.to_state(include_evaluations=False), orch.evaluations, session.summary))
+            + sum(len(k) + len(v) for k, v in session.audio.items())
+        )
+        return session.resident_bytes
+
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(s.resident_bytes for s in self._resident.values())
+
+    def enforce_budget(self) -> int:
+        """
+        Evict idle sessions, least recently used first, until under budget.
+
+        Victims are picked and marked in transit under the lock; their
+        checkpoints and spill files are written after releasing it.
+        """
+        if not settings.CHECKPOINTS:
+            return 0  # nothing to reload evicted sessions from
+        victims: List[PooledSession] = []
+        with self._lock:
+            # Sessions another thread is already evicting are as good as gone.
+            total = sum(s.resident_bytes for sid, s in self._resident.items() if sid not in self._transit)
+            if total <= self.budget_bytes:
+                return 0
+            cutoff = time.time() - self.min_idle_s
+            for sid, session in self._resident.items():
+                if total <= self.budget_bytes:
+                    break
+                if session.pins or session.last_active > cutoff or sid in self._transit:
+                    continue
+                self._transit[sid] = threading.Event()
+                victims.append(session)
+                total -= session.resident_bytes
+
+        evicted = 0
+        for session in victims:
+            sid = session.session_id
+            try:
+                self._spill(session)
+                spilled = True
+            except Exception as e:
+                print(f"[SessionPool] Could not evict {sid}: {e}")
+                spilled = False
+            with self._lock:
+                gate = self._transit.pop(sid)
+                if spilled and self._resident.get(sid) is session:
+                    del self._resident[sid]
+                    self._spilled[sid] = session.last_active
+                    evicted += 1
+            gate.set()
+        if evicted:
+            metrics.incr("session_pool.evicted", evicted)
+        return evicted
+
+    def _spill(self, session: PooledSession) -> None:
+        started = time.perf_counter()
+        session.orchestrator.checkpoint()
+        base = self._spill_path(session.session_id)
+        for key, data in list(session.audio.items()):
+            path = self._audio_path(session.session_id, key)
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(data)
+        if session.summary is not None:
+            base.mkdir(parents=True, exist_ok=True)
+            (base / "summary.json").write_text(
+                json.dumps(session.summary.to_dict(), ensure_ascii=False), encoding="utf-8"
+            )
+        metrics.observe("session_pool.spill_s", time.perf_counter() - started)
+
+    def _reload(self, session_id: str) -> PooledSession:
+        """Restore a session from disk; called without the lock, with `session_id` in transit."""
+        from interview_partner.agents.orchestrator import Orchestrator
+
+        started = time.perf_counter()
+        orch = Orchestrator.restore(session_id)
+        if orch is None:
+            with self._lock:
+                self._spilled.pop(session_id, None)
+            raise KeyError(session_id)
+        session = PooledSession(session_id=session_id, orchestrator=orch)
+        summary_path = self._spill_path(session_id) / "summary.json"
+        if summary_path.exists():
+            summary = SessionSummary.from_dict(json.loads(summary_path.read_text(encoding="utf-8")))
+            # Re-link to the restored evaluations instead of keeping a second copy.
+            summary.evaluations = orch.evaluations
+            session.summary = summary
+        self.measure(session)
+        metrics.incr("session_pool.reloaded")
+        metrics.observe("session_pool.reload_s", time.perf_counter() - started)
+        return session
+
+    def _spill_path(self, session_id: str) -> Path:
+        digest = hashlib.sha1(session_id.encode("utf-8")).hexdigest()
+        return self.spill_dir / digest[:2] / digest[2:4] / encode_name(session_id)
+
+    def _audio_path(self, session_id: str, key: str) -> Path:
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self._spill_path(session_id) / "audio" / f"{name}.wav"
+
+    def stats(self, top: int = 10) -> Dict[str, Any]:
+        """Pool totals plus the `top` largest resident sessions (bytes)."""
+        with self._lock:
+            sizes: List[Tuple[int, str]] = sorted(
+                ((s.resident_bytes, sid) for sid, s in self._resident.items()), reverse=True
+            )
+            spilled = len(self._spilled)
+        return {
+            "budget_bytes": self.budget_bytes,
+            "resident_bytes": sum(b for b, _ in sizes),
+            "resident_sessions": len(sizes),
+            "spilled_sessions": spilled,
+            "largest_sessions": {sid: b for b, sid in sizes[:top]},
+            "evicted": metrics.counter("session_pool.evicted"),
+            "reloaded": metrics.counter("session_pool.reloaded"),
+        }
+
+
+_pool: Optional[SessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """Process-wide pool shared by the Streamlit app and the headless server."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SessionPool(
+                    budget_bytes=settings.SESSION_POOL_BUDGET_MB * 1024 * 1024,
+                    spill_dir=settings.SESSION_SPILL_DIR,
+                    min_idle_s=settings.SESSION_POOL_MIN_IDLE_S,
+                )
+    return _pool
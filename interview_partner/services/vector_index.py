@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from interview_partner.config import settings
+from interview_partner.core.metrics import metrics
+from interview_partner.services.memory_store import _read_json, _write_json, encode_name
+from interview_partner.services.retrieval import EMBED_DIM, embed
+
+MIN_CAPACITY = 64
+MAX_DOCUMENTS = 8  # per user; older document versions are dropped first
+
+
+class UserVectorIndex:
+    """
+    Persistent chunk vectors for one user's resumes / job descriptions.
+
+    Layout under `<root>/<encoded user id>/`:
+    - `vectors-<gen>.npy`: float32 (capacity, dim) matrix, rows [0, count) in use
+    - `chunks-<gen>.jsonl`: chunk text, one JSON string per line, row-aligned
+      with the vectors
+    - `meta.json`: the authoritative sidecar, mapping each document's content
+      hash to its row range and chunk-text byte range, plus the current file
+      generation, row count and committed chunk-text length
+
+    Rows and chunk text are appended in place and only become visible once
+    meta.json is rewritten, so a crash mid-append loses nothing (the next
+    append overwrites the uncommitted tail). When capacity runs out the live
+    rows are compacted into new generation files; the old ones are removed
+    after meta.json points at the new files. Reads are zero-copy slices of an
+    `mmap_mode="r"` load plus one seek into the chunk file; parsed meta.json
+    is cached per file version, and a read racing a compaction reloads it
+    and retries once.
+    """
+
+    def __init__(self, user_id: str, root: Optional[Path] = None, dim: int = EMBED_DIM) -> None:
+        self.user_id = user_id
+        self.dir = Path(root or settings.VECTOR_INDEX_DIR) / encode_name(user_id)
+        self.dim = dim
+        self._lock = _user_lock(self.dir)
+
+    # Metadata -------------------------------------------------------------- #
+    @property
+    def meta_path(self) -> Path:
+        return self.dir / "meta.json"
+
+    def _load_meta(self) -> Dict[str, Any]:
+        """Fresh parse of meta.json; writers mutate the result."""
+        meta = _read_json(self.meta_path)
+        if not isinstance(meta, dict) or meta.get("dim") != self.dim:
+            return {"dim": self.dim, "generation": 0, "count": 0, "capacity": 0, "text_bytes": 0, "documents": {}}
+        return meta
+
+    def _meta(self) -> Dict[str, Any]:
+        """Parsed meta.json, cached per file version; shared, so read-only."""
+        try:
+            st = self.meta_path.stat()
+        except OSError:
+            return self._load_meta()
+        version = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _meta_cache.get(self.meta_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        meta = self._load_meta()
+        _meta_cache[self.meta_path] = (version, meta)
+        return meta
+
+    def _file(self, meta: Dict[str, Any]) -> Path:
+        return self.dir / f"vectors-{meta['generation']}.npy"
+
+    def _chunks_file(self, meta: Dict[str, Any]) -> Path:
+        return self.dir / f"chunks-{meta['generation']}.jsonl"
+
+    # Reads ----------------------------------------------------------------- #
+    def get(self, content_hash: str) -> Optional[Tuple[List[str], np.ndarray]]:
+        """Chunks and a read-only mmap view of their vectors, or None if unknown."""
+        try:
+            return self._get(content_hash)
+        except FileNotFoundError:
+            # Compacted between reading meta.json and opening the generation
+            # files; the reloaded meta.json points at the new ones.
+            metrics.incr("vector_index.stale_reads")
+            return self._get(content_hash)
+
+    def _get(self, content_hash: str) -> Optional[Tuple[List[str], np.ndarray]]:
+        meta = self._meta()
+        doc = meta["documents"].get(content_hash)
+        if doc is None:
+            metrics.incr("vector_index.miss")
+            return None
+        chunks = self._read_chunks(meta, doc)
+        if doc["stop"] == doc["start"]:
+            vectors = np.zeros((0, self.dim), dtype=np.float32)
+        else:
+            vectors = np.load(self._file(meta), mmap_mode="r")[doc["start"] : doc["stop"]]
+        metrics.incr("vector_index.hit")
+        return chunks, vectors
+
+    def _read_chunks(self, meta: Dict[str, Any], doc: Dict[str, Any]) -> List[str]:
+        if "chunks" in doc:
+            return list(doc["chunks"])  # stored inline before chunk files; moved on compaction
+        start, stop = doc["text"]
+        if start == stop:
+            return []
+        with self._chunks_file(meta).open("rb") as f:
+            f.seek(start)
+            data = f.read(stop - start)
+        return [json.loads(line) for line in data.split(b"\n") if line]
+
+    # Writes ---------------------------------------------------------------- #
+    def put(self, content_hash: str, kind: str, chunks: Sequence[str]) -> np.ndarray:
+        """
+        Embed and append a new document version (no-op if already stored);
+        returns the mmap view of its vectors.
+        """
+        with self._lock:
+            meta = self._load_meta()
+            if content_hash not in meta["documents"]:
+                with metrics.timer("vector_index.embed_s"):
+                    vectors = np.stack([embed(c, self.dim) for c in chunks]) if chunks else None
+                self._append(meta, content_hash, kind, list(chunks), vectors)
+        found = self.get(content_hash)
+        assert found is not None
+        return found[1]
+
+    def _append(
+        self,
+        meta: Dict[str, Any],
+        content_hash: str,
+        kind: str,
+        chunks: List[str],
+        vectors: Optional[np.ndarray],
+    ) -> None:
+        docs: Dict[str, Dict[str, Any]] = meta["documents"]
+        while len(docs) >= MAX_DOCUMENTS:
+            oldest = min(docs, key=lambda h: docs[h]["added"])
+            del docs[oldest]
+
+        n = 0 if vectors is None else len(vectors)
+        live = sum(d["stop"] - d["start"] for d in docs.values())
+        if meta["count"] + n > meta["capacity"]:
+            self._compact(meta, needed=live + n)
+
+        start = meta["count"]
+        text_start = text_stop = meta.get("text_bytes", 0)
+        if n:
+            matrix = open_memmap(self._file(meta), mode="r+")
+            matrix[start : start + n] = vectors
+            matrix.flush()
+            del matrix
+            text_stop = self._write_chunks(self._chunks_file(meta), text_start, _encode_chunks(chunks))
+        docs[content_hash] = {
+            "kind": kind,
+            "start": start,
+            "stop": start + n,
+            "text": [text_start, text_stop],
+            "added": time.time(),
+        }
+        meta["count"] = start + n
+        meta["text_bytes"] = text_stop
+        _write_json(self.meta_path, meta)
+        metrics.incr("vector_index.rows_written", n)
+
+    @staticmethod
+    def _write_chunks(path: Path, offset: int, data: bytes) -> int:
+        """Write `data` at `offset` (dropping any uncommitted tail); returns the new end."""
+        with path.open("r+b" if path.exists() else "w+b") as f:
+            f.seek(offset)
+            f.truncate()
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
+
+    def _compact(self, meta: Dict[str, Any], needed: int) -> None:
+        """Copy live rows and their chunk text into fresh, larger generation files."""
+        old_file = self._file(meta) if meta["capacity"] else None
+        old_chunks = self._chunks_file(meta)
+        capacity = max(MIN_CAPACITY, 1 << max(0, needed - 1).bit_length())
+
+        self.dir.mkdir(parents=True, exist_ok=True)
+        new_meta = dict(meta, generation=meta["generation"] + 1, capacity=capacity)
+        new_file = self._file(new_meta)
+        matrix = open_memmap(new_file, mode="w+", dtype=np.float32, shape=(capacity, self.dim))
+        old = np.load(old_file, mmap_mode="r") if old_file is not None else None
+        text = bytearray()
+        row = 0
+        for doc in sorted(meta["documents"].values(), key=lambda d: d["start"]):
+            n = doc["stop"] - doc["start"]
+            if n and old is not None:
+                matrix[row : row + n] = old[doc["start"] : doc["stop"]]
+            text_start = len(text)
+            text += _encode_chunks(self._read_chunks(meta, doc))
+            doc.pop("chunks", None)
+            doc["start"], doc["stop"] = row, row + n
+            doc["text"] = [text_start, len(text)]
+            row += n
+        matrix.flush()
+        del matrix, old
+        self._write_chunks(self._chunks_file(new_meta), 0, bytes(text))
+
+        new_meta["count"] = row
+        new_meta["text_bytes"] = len(text)
+        _write_json(self.meta_path, new_meta)
+        meta.update(new_meta)
+        for stale in (old_file, old_chunks):
+            if stale is None or not stale.exists():
+                continue
+            try:
+                os.remove(stale)
+            except OSError as e:
+                print(f"[VectorIndex] Could not remove {stale}: {e}")
+        metrics.incr("vector_index.compactions")
+
+
+def _encode_chunks(chunks: Sequence[str]) -> bytes:
+    return "".join(json.dumps(c, ensure_ascii=False) + "\n" for c in chunks).encode("utf-8")
+
+
+_meta_cache: Dict[Path, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+_locks: Dict[Path, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _user_lock(path: Path) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(path, threading.Lock())
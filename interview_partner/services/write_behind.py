@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+FSYNC_POLICIES = ("always", "batch", "never")
+
+# apply_batch(user_id, payloads) persists every staged payload for one user.
+ApplyBatch = Callable[[str, List[Dict[str, Any]]], None]
+
+
+class WriteBehindQueue:
+    """
+    Durable write-behind queue for per-user memory updates.
+
+    - `stage()` appends the payload to a JSONL journal and returns immediately.
+    - A background thread groups staged payloads by user and hands each group
+      to `apply_batch`, so one load/aggregate/write covers several sessions.
+    - Applied entries are dropped from the journal; anything still in the
+      journal at startup is re-staged, so `apply_batch` must be idempotent.
+
+    fsync policy:
+    - "always": fsync the journal on every stage (durable acknowledgement)
+    - "batch":  fsync once per journal compaction after a flush
+    - "never":  leave it to the OS
+    """
+
+    def __init__(
+        self,
+        journal_path: Path,
+        apply_batch: ApplyBatch,
+        fsync_policy: str = "always",
+        flush_interval: float = 0.5,
+        max_batch: int = 64,
+    ) -> None:
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy {fsync_policy!r}; expected one of {FSYNC_POLICIES}")
+
+        self.journal_path = journal_path
+        self.apply_batch = apply_batch
+        self.fsync_policy = fsync_policy
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+
+        self._cond = threading.Condition()
+        self._pending: Dict[int, Dict[str, Any]] = {}  # seq -> entry, insertion ordered
+        self._in_flight: set[int] = set()
+        self._next_seq = 0
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self._recover()
+
+    # Lifecycle ------------------------------------------------------------ #
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="memory-write-behind", daemon=True)
+        self._thread.start()
+
+    def shutdown(self, timeout: Optional[float] = 10.0) -> None:
+        """Drain everything that is staged, then stop the writer thread."""
+        self.flush(timeout=timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # Public API ----------------------------------------------------------- #
+    def stage(self, user_id: str, payload: Dict[str, Any]) -> None:
+        entry = {"user_id": user_id, "payload": payload}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._cond:
+            with self.journal_path.open("a", encoding="utf-8") as f:
+                f.write(line)
+                if self.fsync_policy == "always":
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._pending[self._next_seq] = entry
+            self._next_seq += 1
+            self._cond.notify_all()
+
+    def pending_for(self, user_id: str) -> List[Dict[str, Any]]:
+        """Payloads staged for `user_id` that may not be on disk yet."""
+        with self._cond:
+            return [e["payload"] for e in self._pending.values() if e["user_id"] == user_id]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every entry staged so far is written. Returns False on timeout."""
+        if self._thread is None:
+            # No writer running (e.g. after shutdown): flush inline, one pass per batch.
+            for _ in range(len(self._pending) // self.max_batch + 1):
+                self._flush_once()
+            with self._cond:
+                return not self._pending
+
+        with self._cond:
+            target = self._next_seq
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not any(seq < target for seq in self._pending), timeout=timeout
+            )
+
+    # Internals ------------------------------------------------------------ #
+    def _recover(self) -> None:
+        if not self.journal_path.exists():
+            return
+        recovered = 0
+        with self.journal_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except Exception:
+                    # A torn final line from a crash mid-append; skip it.
+                    continue
+                self._pending[self._next_seq] = entry
+                self._next_seq += 1
+                recovered += 1
+        if recovered:
+            print(f"Write-behind: recovered {recovered} pending write(s) from {self.journal_path.name}.")
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._stopping or len(self._pending) > len(self._in_flight),
+                    timeout=self.flush_interval,
+                )
+                if self._stopping and not self._pending:
+                    return
+            if not self._flush_once():
+                # Back off instead of spinning on a failing store.
+                time.sleep(self.flush_interval)
+
+    def _flush_once(self) -> bool:
+        with self._cond:
+            batch = [
+                (seq, entry) for seq, entry in self._pending.items() if seq not in self._in_flight
+            ][: self.max_batch]
+            self._in_flight.update(seq for seq, _ in batch)
+        if not batch:
+            return True
+
+        by_user: Dict[str, List[int]] = defaultdict(list)
+        for seq, entry in batch:
+            by_user[entry["user_id"]].append(seq)
+
+        done: List[int] = []
+        for user_id, seqs in by_user.items():
+            payloads = [entry["payload"] for seq, entry in batch if seq in seqs]
+            try:
+                self.apply_batch(user_id, payloads)
+                done.extend(seqs)
+            except Exception as e:
+                # Leave the entries staged; the next flush retries them.
+                print(f"Write-behind flush failed for user {user_id!r}: {e}")
+
+        with self._cond:
+            for seq, _ in batch:
+                self._in_flight.discard(seq)
+            for seq in done:
+                self._pending.pop(seq, None)
+            if done:
+                self._rewrite_journal()
+            self._cond.notify_all()
+        return len(done) == len(batch)
+
+    def _rewrite_journal(self) -> None:
+        """Replace the journal with the still-pending entries (caller holds the lock)."""
+        tmp_path = self.journal_path.with_suffix(self.journal_path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for entry in self._pending.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            if self.fsync_policy != "never":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+
+
+_queues: Dict[Path, WriteBehindQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def get_write_behind_queue(
+    journal_path: Path,
+    apply_batch: ApplyBatch,
+    fsync_policy: str = "always",
+    flush_interval: float = 0.5,
+) -> WriteBehindQueue:
+    """Return the started queue for `journal_path`, recovering its journal on first use."""
+    with _queues_lock:
+        queue = _queues.get(journal_path)
+        if queue is None:
+            queue = WriteBehindQueue(
+                journal_path,
+                apply_batch,
+                fsync_policy=fsync_policy,
+                flush_interval=flush_interval,
+            )
+            queue.start()
+            _queues[journal_path] = queue
+        return queue
+
+
+@atexit.register
+def _drain_all_queues() -> None:
+    for queue in list(_queues.values()):
+        queue.shutdown()
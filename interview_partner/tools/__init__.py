@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+# Offline / operator tooling (bulk exports, batch pipelines, benchmarks).
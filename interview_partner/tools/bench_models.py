@@ -0,0 +1,144 @@
+"""
+Measure per-session memory and (de)serialization cost of the evaluation model.
+
+Builds `--sessions` synthetic sessions of `--questions` evaluations each, the
+way the critic produces them (every evaluation parsed from its own JSON
+response, so tag strings start out as separate objects), once as plain dicts
+and once as `data.models` objects, and reports tracemalloc bytes per session
+plus to_dict / from_dict and JSON round-trip times per evaluation.
+
+    python -m interview_partner.tools.bench_models --sessions 1000 --questions 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from interview_partner.data.models import Evaluation, SessionSummary
+from interview_partner.data.qbank import QUESTION_BANK
+from interview_partner.data.rubrics import RUBRIC_DESCRIPTIONS
+
+TAGS = [
+    "concrete examples", "answer depth", "STAR structure", "quantified impact", "ownership",
+    "system design", "trade-offs", "communication", "conciseness", "stakeholder management",
+]
+ANSWER_WORDS = "we shipped the migration on time by splitting work across three teams and measuring p95 latency".split()
+
+
+def _raw_responses(questions: List[str], n: int, rng: random.Random) -> List[str]:
+    """Critic-style JSON responses, one per answer."""
+    out = []
+    for i in range(n):
+        out.append(
+            json.dumps(
+                {
+                    "question": questions[i % len(questions)],
+                    "answer": " ".join(rng.choice(ANSWER_WORDS) for _ in range(rng.randint(40, 160))),
+                    "scores": {k: rng.randint(3, 9) for k in RUBRIC_DESCRIPTIONS},
+                    "weak_spots": rng.sample(TAGS, 3),
+                    "strengths": rng.sample(TAGS, 2),
+                    "comments": "Good structure; add a measurable result and tighten the opening.",
+                    "source": "full",
+                }
+            )
+        )
+    return out
+
+
+def _build_dicts(responses: List[List[str]]) -> List[Dict[str, Any]]:
+    sessions = []
+    for raw in responses:
+        evaluations = [json.loads(r) for r in raw]
+        sessions.append(
+            {
+                "evaluations": evaluations,
+                "summary": {
+                    "summary_text": "Solid session overall.",
+                    "weak_spot_topics": [t for e in evaluations for t in e["weak_spots"]][:5],
+                    "strength_topics": [t for e in evaluations for t in e["strengths"]][:5],
+                    "evaluations": evaluations,
+                },
+            }
+        )
+    return sessions
+
+
+def _build_models(responses: List[List[str]]) -> List[SessionSummary]:
+    sessions = []
+    for raw in responses:
+        evaluations = [Evaluation.from_dict(json.loads(r)) for r in raw]
+        sessions.append(
+            SessionSummary.from_dict(
+                {
+                    "user_id": "bench",
+                    "role": "bench",
+                    "summary_text": "Solid session overall.",
+                    "weak_spot_topics": [t for e in evaluations for t in e.weak_spots][:5],
+                    "strength_topics": [t for e in evaluations for t in e.strengths][:5],
+                    "evaluations": evaluations,
+                }
+            )
+        )
+    return sessions
+
+
+def _measure(build: Callable[[], Any], sessions: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / sessions
+
+
+def _per_item_us(fn: Callable[[], Any], items: int, repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) / items * 1e6
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark evaluation model memory and serialization.")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--questions", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    role = next(iter(QUESTION_BANK.role_files))
+    questions = [q.text for q in QUESTION_BANK.questions_for_role(role)]
+    responses = [_raw_responses(questions, args.questions, rng) for _ in range(args.sessions)]
+
+    dict_bytes = _measure(lambda: _build_dicts(responses), args.sessions)
+    model_bytes = _measure(lambda: _build_models(responses), args.sessions)
+    print(f"{args.sessions} sessions x {args.questions} evaluations")
+    print(f"  dicts : {dict_bytes / 1024:8.1f} KiB / session")
+    print(f"  models: {model_bytes / 1024:8.1f} KiB / session ({1 - model_bytes / dict_bytes:.0%} smaller)")
+
+    evaluations = [e for s in _build_models(responses[:100]) for e in s.evaluations]
+    as_dicts = [e.to_dict() for e in evaluations]
+    payload = json.dumps(as_dicts)
+    n = len(evaluations)
+    print(f"  to_dict    {_per_item_us(lambda: [e.to_dict() for e in evaluations], n):6.2f} us / evaluation")
+    print(f"  from_dict  {_per_item_us(lambda: [Evaluation.from_dict(d) for d in as_dicts], n):6.2f} us / evaluation")
+    round_trip = _per_item_us(
+        lambda: [Evaluation.from_dict(d) for d in json.loads(json.dumps([e.to_dict() for e in evaluations]))], n
+    )
+    print(f"  JSON round {round_trip:6.2f} us / evaluation ({len(payload) / n:.0f} bytes)")
+
+
+if __name__ == "__main__":
+    main()
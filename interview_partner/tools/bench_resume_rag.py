@@ -0,0 +1,100 @@
+"""
+Benchmark the local Resume RAG pipeline (chunking + BM25 + skill gaps).
+
+Generates synthetic resumes / job descriptions of increasing size from the
+skill vocabulary and reports index build time, per-query latency and the
+end-to-end `extract_topics_from_resume` time, both without persistence and
+warm from a user's vector index. Pass real documents with --resume / --jd to
+time those instead.
+
+    python -m interview_partner.tools.bench_resume_rag --sizes 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import statistics
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from interview_partner.config import settings
+from interview_partner.services.memory_store import encode_name
+from interview_partner.services.resume_rag import (
+    build_index,
+    extract_topics_from_resume,
+    skill_vocabulary,
+)
+
+BENCH_USER = "_bench_resume_rag"
+
+FILLER = (
+    "led delivered improved owned built designed shipped team project customers "
+    "quarter results growth reduced latency launched worked across partners"
+).split()
+
+
+def synthetic_document(words: int, vocabulary: List[str], rng: random.Random) -> str:
+    out: List[str] = []
+    while len(out) < words:
+        out.extend(rng.choice(vocabulary).split() if rng.random() < 0.2 else [rng.choice(FILLER)])
+        if rng.random() < 0.08:
+            out.append("\n")
+    return " ".join(out[:words])
+
+
+def _time(fn, repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench(resume: str, jd: str, label: str, repeat: int) -> None:
+    vocabulary = skill_vocabulary()
+    index = build_index(resume)
+    build = _time(lambda: build_index(resume), repeat)
+    queries = vocabulary[:50]
+    query = _time(lambda: [index.search(q, k=3) for q in queries], repeat)
+    end_to_end = _time(lambda: extract_topics_from_resume(resume, jd), repeat)
+    extract_topics_from_resume(resume, jd, user_id=BENCH_USER)  # populate the vector index
+    cached = _time(lambda: extract_topics_from_resume(resume, jd, user_id=BENCH_USER), repeat)
+    print(
+        f"{label:>14} | chunks {len(index.chunks):>6} | terms {len(index.postings):>6} | "
+        f"build {statistics.median(build) * 1e3:8.2f} ms | "
+        f"query {statistics.median(query) / len(queries) * 1e6:8.1f} us | "
+        f"gaps {statistics.median(end_to_end) * 1e3:8.2f} ms | "
+        f"cached {statistics.median(cached) * 1e3:8.2f} ms"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark local Resume RAG indexing and queries.")
+    parser.add_argument("--sizes", nargs="*", type=int, default=[500, 5000, 50000], help="Synthetic resume sizes in words.")
+    parser.add_argument("--resume", type=Path, help="Time a real resume file instead.")
+    parser.add_argument("--jd", type=Path, help="Job description file to pair with --resume.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.resume:
+            jd = args.jd.read_text(encoding="utf-8", errors="replace") if args.jd else ""
+            bench(args.resume.read_text(encoding="utf-8", errors="replace"), jd, args.resume.name, args.repeat)
+            return
+
+        rng = random.Random(args.seed)
+        vocabulary = skill_vocabulary()
+        jd = synthetic_document(400, vocabulary, rng)
+        for size in args.sizes:
+            bench(synthetic_document(size, vocabulary, rng), jd, f"{size} words", args.repeat)
+    finally:
+        shutil.rmtree(settings.VECTOR_INDEX_DIR / encode_name(BENCH_USER), ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Measure cold-start import time of the app and its packages.
+
+Imports each module in a fresh interpreter with `python -X importtime`
+(`--repeat` times, median reported) and prints the total import time plus
+the slowest individual modules by self time. Heavy optional dependencies
+that got loaded eagerly are flagged, so a stray top-level import shows up.
+
+    python -m interview_partner.tools.bench_startup
+    python -m interview_partner.tools.bench_startup --modules app interview_partner.server.app --top 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from interview_partner.config import PROJECT_ROOT
+
+DEFAULT_MODULES = [
+    "interview_partner.agents",
+    "interview_partner.agents.orchestrator",
+    "interview_partner.core.audio",
+    "interview_partner.server.app",
+    "app",
+]
+# Should only be imported on first use (see core.llm.get_client and app._answer_panel).
+HEAVY_MODULES = ["google.genai", "streamlit_mic_recorder"]
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def _import_once(module: str) -> Tuple[int, Dict[str, int]]:
+    """(cumulative µs for `module`, self µs per imported module) from one fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+    total = 0
+    self_us: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        own, cumulative, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        self_us[name] = own
+        if name == module and len(indent) <= 1:
+            total = cumulative
+    return total, self_us
+
+
+def bench(module: str, repeat: int) -> Tuple[float, Dict[str, float]]:
+    """Median total ms and median self ms per imported module."""
+    totals: List[int] = []
+    samples: Dict[str, List[int]] = {}
+    for _ in range(repeat):
+        total, self_us = _import_once(module)
+        totals.append(total)
+        for name, us in self_us.items():
+            samples.setdefault(name, []).append(us)
+    per_module = {name: statistics.median(us) / 1e3 for name, us in samples.items()}
+    return statistics.median(totals) / 1e3, per_module
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark cold-start import time.")
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="Slowest modules (self time) to list per target.")
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        try:
+            total_ms, per_module = bench(module, args.repeat)
+        except RuntimeError as e:
+            print(f"{module}: {e}")
+            continue
+        print(f"{module}: {total_ms:8.1f} ms (median of {args.repeat})")
+        for name, ms in sorted(per_module.items(), key=lambda kv: kv[1], reverse=True)[: args.top]:
+            print(f"    {ms:8.1f} ms  {name}")
+        eager = [m for m in HEAVY_MODULES if m in per_module]
+        if eager:
+            print(f"    imported eagerly: {', '.join(eager)}")
+
+
+if __name__ == "__main__":
+    main()
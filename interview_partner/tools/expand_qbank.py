@@ -0,0 +1,296 @@
+"""
+Offline question-bank expansion.
+
+Generates large per-role, per-topic question pools ahead of time so runtime
+turns are served from the bank instead of per-turn LLM calls:
+
+1. plan (role, topic, batch) tasks from the existing bank (or --topics)
+2. run each role/topic's batches in order, topics in a bounded thread pool
+   of LLM calls; every prompt lists the questions accepted so far as "do
+   not repeat" and rotates the bank examples and question angle, and a
+   batch that adds nothing new ends that topic early
+3. checkpoint every finished batch to `_expand_checkpoint.jsonl` (re-runs resume)
+4. normalize tags, drop exact and near-duplicate questions
+5. merge into the bank format (index.json + one JSONL file per role)
+
+    python -m interview_partner.tools.expand_qbank --per-topic 200 --concurrency 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from interview_partner.config import settings
+from interview_partner.core import llm, prompts
+from interview_partner.data.qbank import (
+    QUESTION_BANK,
+    Question,
+    QuestionBank,
+    load_questions_file,
+    normalize_tag,
+    role_slug,
+)
+from interview_partner.services.retrieval import EMBED_DIM, embed
+
+CHECKPOINT_FILE = "_expand_checkpoint.jsonl"
+BATCH_SIZE = 10
+NEAR_DUPLICATE_SIMILARITY = 0.9
+EXAMPLES_PER_PROMPT = 8
+AVOID_PER_PROMPT = 40  # most recent accepted questions listed as "do not repeat"
+ANGLES = (
+    "behavioral (past experience)",
+    "situational (hypothetical scenario)",
+    "technical depth",
+    "trade-offs and judgment calls",
+    "failure, debugging and recovery",
+    "collaboration and communication",
+)
+
+Task = Tuple[str, str, int]  # (role, topic, batch number)
+
+
+def _task_id(task: Task) -> str:
+    role, topic, batch = task
+    return f"{role}|{topic}|{batch}"
+
+
+def plan_tasks(bank: QuestionBank, roles: Sequence[str], topics: Optional[Sequence[str]], per_topic: int) -> List[Task]:
+    tasks: List[Task] = []
+    batches = max(1, -(-per_topic // BATCH_SIZE))
+    for role in roles:
+        role_topics = list(topics) if topics else sorted(
+            {q.topic for q in bank.role_bank(role).questions}
+            | {t for q in bank.role_bank(role).questions for t in q.tags}
+        )
+        for topic in role_topics:
+            tasks.extend((role, normalize_tag(topic), b) for b in range(batches))
+    return tasks
+
+
+def _load_checkpoint(path: Path) -> Dict[str, List[Dict[str, Any]]]:
+    done: Dict[str, List[Dict[str, Any]]] = {}
+    if not path.exists():
+        return done
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except Exception:
+                continue  # torn last line from an interrupted run
+            done[row["task"]] = row["questions"]
+    return done
+
+
+def generate_batch(task: Task, avoid: Sequence[str]) -> List[Dict[str, Any]]:
+    """One LLM call for `task`; `avoid` lists questions the batch must not repeat."""
+    role, topic, batch = task
+    raw = llm.chat_completion(
+        system_prompt=prompts.question_generation_system_prompt(),
+        user_prompt=prompts.question_generation_user_prompt(
+            role=role, topic=topic, count=BATCH_SIZE, examples=list(avoid), angle=ANGLES[batch % len(ANGLES)]
+        ),
+        temperature=0.9,
+        max_output_tokens=2048,
+        json_mode=True,
+    )
+    data = json.loads(raw)
+    out: List[Dict[str, Any]] = []
+    for item in data.get("questions", []):
+        text = str(item.get("text", "")).strip()
+        if not text:
+            continue
+        tags = [normalize_tag(str(t)) for t in item.get("tags", []) if str(t).strip()]
+        out.append(
+            {
+                "text": text,
+                "topic": normalize_tag(str(item.get("topic", ""))) or topic,
+                "tags": list(dict.fromkeys([topic, *tags])),
+            }
+        )
+    return out
+
+
+def run_chain(
+    bank: QuestionBank,
+    chain: List[Task],
+    done: Dict[str, List[Dict[str, Any]]],
+    ckpt: Any,
+    lock: threading.Lock,
+) -> int:
+    """
+    Run one role/topic's batches in order; returns the number of LLM calls made.
+
+    Checkpointed batches are replayed instead of regenerated, so a resumed run
+    rebuilds the "do not repeat" list without new LLM calls.
+    """
+    role, topic, _ = chain[0]
+    examples = [q for q in bank.role_bank(role).questions if q.topic == topic or topic in q.tags]
+    accepted: List[Question] = list(examples)
+    generated: List[str] = []
+    calls = 0
+    for task in chain:
+        with lock:
+            questions = done.get(_task_id(task))
+        if questions is None:
+            shift = (task[2] * EXAMPLES_PER_PROMPT) % len(examples) if examples else 0
+            shown = [q.text for q in (examples[shift:] + examples[:shift])[:EXAMPLES_PER_PROMPT]]
+            questions = generate_batch(task, shown + generated[-AVOID_PER_PROMPT:])
+            calls += 1
+            with lock:
+                ckpt.write(json.dumps({"task": _task_id(task), "questions": questions}, ensure_ascii=False) + "\n")
+                ckpt.flush()
+                done[_task_id(task)] = questions
+            print(f"{_task_id(task)}: {len(questions)} questions")
+        added = deduplicate(accepted, questions)
+        if not added:
+            print(f"{role}|{topic}: batch {task[2]} added nothing new; skipping the remaining batches.")
+            break
+        accepted.extend(added)
+        generated.extend(q.text for q in added)
+    return calls
+
+
+def run_tasks(
+    bank: QuestionBank, tasks: List[Task], checkpoint: Path, concurrency: int
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Run every unfinished task, one role/topic chain per worker, `concurrency` workers."""
+    done = _load_checkpoint(checkpoint)
+    chains: Dict[Tuple[str, str], List[Task]] = {}
+    for task in tasks:
+        chains.setdefault(task[:2], []).append(task)
+    pending = sum(1 for t in tasks if _task_id(t) not in done)
+    print(f"{len(tasks)} tasks planned, {len(tasks) - pending} already checkpointed, up to {pending} to run.")
+
+    lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool, checkpoint.open("a", encoding="utf-8") as ckpt:
+        futures = {
+            pool.submit(run_chain, bank, sorted(chain, key=lambda t: t[2]), done, ckpt, lock): key
+            for key, chain in chains.items()
+        }
+        for n, future in enumerate(as_completed(futures), start=1):
+            role, topic = futures[future]
+            try:
+                calls = future.result()
+            except Exception as e:
+                # The failed batch is not checkpointed, so the next run resumes the chain there.
+                print(f"[{n}/{len(chains)}] {role}|{topic} failed: {e}")
+                continue
+            print(f"[{n}/{len(chains)}] {role}|{topic} done ({calls} calls)")
+    return done
+
+
+def deduplicate(existing: Sequence[Question], candidates: List[Dict[str, Any]]) -> List[Question]:
+    """Drop candidates that exactly or nearly (cosine >= threshold) repeat earlier questions."""
+    seen_text = {" ".join(q.text.lower().split()) for q in existing}
+    # Preallocated so each accepted question is one row write, not a re-stack.
+    matrix = np.zeros((len(existing) + len(candidates), EMBED_DIM), dtype=np.float32)
+    n = 0
+    for q in existing:
+        matrix[n] = embed(q.text)
+        n += 1
+
+    accepted: List[Question] = []
+    for item in candidates:
+        key = " ".join(item["text"].lower().split())
+        if key in seen_text:
+            continue
+        vec = embed(item["text"])
+        if n and float(np.max(matrix[:n] @ vec)) >= NEAR_DUPLICATE_SIMILARITY:
+            continue
+        seen_text.add(key)
+        matrix[n] = vec
+        n += 1
+        accepted.append(Question(text=item["text"], topic=item["topic"], tags=item["tags"]))
+    return accepted
+
+
+def write_bank(out_dir: Path, role_questions: Dict[str, List[Question]], source: QuestionBank) -> None:
+    """
+    Write role files and index.json in the bank format (atomic per file).
+
+    When writing to a new directory, roles that were not expanded and the
+    generic fallback file are copied over so the output is a complete bank.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    fallback = str(source.manifest.get("fallback", "_generic.jsonl"))
+    manifest = {"roles": dict(source.role_files), "fallback": fallback}
+    for role in role_questions:
+        manifest["roles"].setdefault(role, f"{role_slug(role)}.jsonl")
+
+    copy_unchanged = out_dir.resolve() != source.bank_dir.resolve()
+    files: Dict[str, List[Question]] = {}
+    for role, file_name in manifest["roles"].items():
+        if role in role_questions:
+            files[file_name] = role_questions[role]
+        elif copy_unchanged:
+            files[file_name] = list(source.role_bank(role).questions)
+    if copy_unchanged:
+        files[fallback] = load_questions_file(source.bank_dir / fallback)
+
+    for file_name, questions in files.items():
+        _atomic_write_lines(
+            out_dir / file_name,
+            (
+                json.dumps({"text": q.text, "topic": q.topic, "tags": q.tags}, ensure_ascii=False)
+                for q in questions
+            ),
+        )
+    _atomic_write_lines(out_dir / "index.json", [json.dumps(manifest, ensure_ascii=False, indent=2)])
+
+
+def _atomic_write_lines(path: Path, lines: Any) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line + "\n")
+    os.replace(tmp, path)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Expand the question bank offline with batched LLM generation.")
+    parser.add_argument("--roles", nargs="*", help="Roles to expand (default: every role in the bank).")
+    parser.add_argument("--topics", nargs="*", help="Topics to cover (default: the bank's topics and tags).")
+    parser.add_argument("--per-topic", type=int, default=50, help="Questions to request per role/topic.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Max LLM calls in flight.")
+    parser.add_argument("--source", type=Path, default=settings.QUESTION_BANK_DIR, help="Existing bank directory.")
+    parser.add_argument("--out", type=Path, default=None, help="Output bank directory (default: --source).")
+    parser.add_argument("--work-dir", type=Path, default=None, help="Checkpoint directory (default: --out).")
+    args = parser.parse_args(argv)
+
+    out_dir = args.out or args.source
+    work_dir = args.work_dir or out_dir
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    bank = QuestionBank(args.source)
+    roles = args.roles or list(bank.role_files)
+    tasks = plan_tasks(bank, roles, args.topics, args.per_topic)
+
+    started = time.perf_counter()
+    done = run_tasks(bank, tasks, work_dir / CHECKPOINT_FILE, args.concurrency)
+
+    role_questions: Dict[str, List[Question]] = {}
+    for role in roles:
+        existing = list(bank.role_bank(role).questions) if role in bank else []
+        candidates = [q for t in tasks if t[0] == role for q in done.get(_task_id(t), [])]
+        added = deduplicate(existing, candidates)
+        role_questions[role] = existing + added
+        print(f"{role}: {len(existing)} existing + {len(added)} new (from {len(candidates)} generated)")
+
+    write_bank(out_dir, role_questions, bank)
+    for written in (bank, QUESTION_BANK):
+        if written.bank_dir.resolve() == out_dir.resolve():
+            written.invalidate()
+    print(f"Wrote bank to {out_dir} in {time.perf_counter() - started:.1f}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""
+Bulk columnar export of stored sessions and evaluations.
+
+Walks the memory store with a process pool and writes one pair of part files
+(sessions + evaluations) per chunk of users, so memory stays bounded by
+`--chunk-users`. Output is Parquet when pyarrow is installed, otherwise
+NumPy .npz. Runs are incremental: `_export_state.json` in the output
+directory records how many sessions of each user were already exported.
+
+    python -m interview_partner.tools.export_evaluations --out exports/
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from interview_partner.agents.memory_agent import aggregate_scores, legacy_session_id
+from interview_partner.config import settings
+from interview_partner.data.rubrics import RUBRIC_DESCRIPTIONS
+from interview_partner.services.memory_store import get_memory_store
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except Exception:  # pragma: no cover - pyarrow is optional
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+
+SCORE_KEYS: List[str] = list(RUBRIC_DESCRIPTIONS)
+MISSING_SCORE = -1
+STATE_FILE = "_export_state.json"
+
+Columns = Dict[str, List[Any]]
+
+
+def _empty_session_columns() -> Columns:
+    cols: Columns = {
+        "user_id": [], "session_id": [], "timestamp": [], "role": [],
+        "num_questions": [], "weak_spot_topics": [], "strength_topics": [],
+    }
+    cols.update({f"avg_{k}": [] for k in SCORE_KEYS})
+    return cols
+
+
+def _empty_evaluation_columns(include_text: bool) -> Columns:
+    cols: Columns = {
+        "user_id": [], "session_id": [], "timestamp": [], "role": [],
+        "question_index": [], "weak_spots": [], "strengths": [],
+    }
+    cols.update({k: [] for k in SCORE_KEYS})
+    if include_text:
+        cols.update({"question": [], "answer": [], "comments": []})
+    return cols
+
+
+def extract_user(
+    backend: str, root: str, user_id: str, skip_sessions: int, include_text: bool
+) -> Tuple[str, int, Columns, Columns, int]:
+    """
+    Worker: read one user's new sessions into column lists.
+
+    Legacy sessions that still embed their evaluations get the same id and
+    averages the memory agent's migration would give them; headers with
+    neither a session id nor embedded evaluations cannot be joined to
+    anything and are skipped.
+
+    Returns (user_id, total_session_count, session_columns,
+    evaluation_columns, skipped_session_count).
+    """
+    store = get_memory_store(backend, root=Path(root), fsync=False)
+    data = store.load_user(user_id) or {}
+    sessions: List[Dict[str, Any]] = data.get("sessions", [])
+
+    s_cols = _empty_session_columns()
+    e_cols = _empty_evaluation_columns(include_text)
+    skipped = 0
+    for session in sessions[skip_sessions:]:
+        # Legacy sessions may still embed their evaluations.
+        evaluations = session.get("evaluations")
+        session_id = session.get("session_id")
+        if not session_id:
+            if evaluations is None:
+                skipped += 1
+                continue
+            session_id = legacy_session_id(session, evaluations)
+        timestamp = session.get("timestamp", "")
+        role = session.get("role", "")
+        averages = session.get("scores") or (aggregate_scores(evaluations) if evaluations else {})
+
+        s_cols["user_id"].append(user_id)
+        s_cols["session_id"].append(session_id)
+        s_cols["timestamp"].append(timestamp)
+        s_cols["role"].append(role)
+        s_cols["num_questions"].append(int(session.get("num_questions", len(evaluations or ()))))
+        s_cols["weak_spot_topics"].append(list(session.get("weak_spot_topics", [])))
+        s_cols["strength_topics"].append(list(session.get("strength_topics", [])))
+        for k in SCORE_KEYS:
+            s_cols[f"avg_{k}"].append(float(averages.get(k, np.nan)))
+
+        if evaluations is None:
+            evaluations = store.load_evaluations(user_id, session_id) or []
+        for idx, ev in enumerate(evaluations):
+            scores = ev.get("scores") or {}
+            e_cols["user_id"].append(user_id)
+            e_cols["session_id"].append(session_id)
+            e_cols["timestamp"].append(timestamp)
+            e_cols["role"].append(role)
+            e_cols["question_index"].append(idx)
+            e_cols["weak_spots"].append(list(ev.get("weak_spots", [])))
+            e_cols["strengths"].append(list(ev.get("strengths", [])))
+            for k in SCORE_KEYS:
+                value = scores.get(k)
+                e_cols[k].append(int(value) if isinstance(value, (int, float)) else MISSING_SCORE)
+            if include_text:
+                e_cols["question"].append(ev.get("question", ""))
+                e_cols["answer"].append(ev.get("answer", ""))
+                e_cols["comments"].append(ev.get("comments", ""))
+
+    return user_id, len(sessions), s_cols, e_cols, skipped
+
+
+# Writers ------------------------------------------------------------------ #
+_INT_COLUMNS = {"num_questions": np.int16, "question_index": np.int16, **{k: np.int8 for k in SCORE_KEYS}}
+
+
+def _timestamps_ns(values: List[str]) -> np.ndarray:
+    return np.array(
+        [np.datetime64(v.rstrip("Z"), "ns") if v else np.datetime64("NaT", "ns") for v in values],
+        dtype="datetime64[ns]",
+    )
+
+
+def _write_parquet(path: Path, cols: Columns) -> None:
+    arrays = {}
+    for name, values in cols.items():
+        if name == "timestamp":
+            arrays[name] = pa.array(_timestamps_ns(values), type=pa.timestamp("ns", tz="UTC"))
+        elif name in _INT_COLUMNS:
+            arrays[name] = pa.array(np.asarray(values, dtype=_INT_COLUMNS[name]))
+        elif name.startswith("avg_"):
+            arrays[name] = pa.array(np.asarray(values, dtype=np.float32))
+        elif values and isinstance(values[0], list):
+            arrays[name] = pa.array(values, type=pa.list_(pa.string()))
+        else:
+            arrays[name] = pa.array(values, type=pa.string())
+    pq.write_table(pa.table(arrays), path, compression="zstd")
+
+
+def _write_npz(path: Path, cols: Columns) -> None:
+    arrays: Dict[str, np.ndarray] = {}
+    for name, values in cols.items():
+        if name == "timestamp":
+            arrays[name] = _timestamps_ns(values)
+        elif name in _INT_COLUMNS:
+            arrays[name] = np.asarray(values, dtype=_INT_COLUMNS[name])
+        elif name.startswith("avg_"):
+            arrays[name] = np.asarray(values, dtype=np.float32)
+        elif values and isinstance(values[0], list):
+            # List columns are stored "|"-joined to keep a fixed dtype.
+            arrays[name] = np.asarray(["|".join(v) for v in values], dtype=str)
+        else:
+            arrays[name] = np.asarray(values, dtype=str)
+    np.savez_compressed(path, **arrays)
+
+
+def _write_part(out_dir: Path, table: str, run_id: str, part: int, cols: Columns, fmt: str) -> Optional[Path]:
+    if not next(iter(cols.values())):
+        return None
+    suffix = "parquet" if fmt == "parquet" else "npz"
+    path = out_dir / f"{table}-{run_id}-{part:05d}.{suffix}"
+    if fmt == "parquet":
+        _write_parquet(path, cols)
+    else:
+        _write_npz(path, cols)
+    return path
+
+
+# Driver ------------------------------------------------------------------- #
+def _chunks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    it = iter(items)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _load_state(out_dir: Path) -> Dict[str, int]:
+    path = out_dir / STATE_FILE
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f).get("exported_sessions", {})
+
+
+def _save_state(out_dir: Path, exported: Dict[str, int]) -> None:
+    tmp = out_dir / (STATE_FILE + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump({"exported_sessions": exported}, f, separators=(",", ":"))
+    os.replace(tmp, out_dir / STATE_FILE)
+
+
+def export(
+    out_dir: Path,
+    backend: str = settings.MEMORY_BACKEND,
+    root: Path = settings.DATA_DIR,
+    fmt: str = "auto",
+    workers: Optional[int] = None,
+    chunk_users: int = 500,
+    full: bool = False,
+    include_text: bool = False,
+) -> Dict[str, Any]:
+    """Export new sessions/evaluations under `root` into part files in `out_dir`."""
+    if fmt == "auto":
+        fmt = "parquet" if pq is not None else "npz"
+    if fmt == "parquet" and pq is None:
+        raise RuntimeError("Parquet export needs pyarrow; install it or use --format npz.")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    exported = {} if full else _load_state(out_dir)
+    run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+    store = get_memory_store(backend, root=root, fsync=False)
+
+    # The in-memory backend is process-local, so it cannot be fanned out.
+    executor = ProcessPoolExecutor(max_workers=workers) if backend != "memory" else None
+    stats = {"users": 0, "sessions": 0, "evaluations": 0, "skipped_sessions": 0, "files": []}
+    started = time.perf_counter()
+    try:
+        for part, user_ids in enumerate(_chunks(store.iter_user_ids(), chunk_users)):
+            args = [
+                (backend, str(root), uid, exported.get(uid, 0), include_text) for uid in user_ids
+            ]
+            if executor is not None:
+                results = executor.map(extract_user, *zip(*args), chunksize=16)
+            else:
+                results = (extract_user(*a) for a in args)
+
+            s_cols = _empty_session_columns()
+            e_cols = _empty_evaluation_columns(include_text)
+            for user_id, total, user_s, user_e, skipped in results:
+                exported[user_id] = total
+                stats["skipped_sessions"] += skipped
+                for name in s_cols:
+                    s_cols[name].extend(user_s[name])
+                for name in e_cols:
+                    e_cols[name].extend(user_e[name])
+
+            stats["users"] += len(user_ids)
+            stats["sessions"] += len(s_cols["session_id"])
+            stats["evaluations"] += len(e_cols["session_id"])
+            for table, cols in (("sessions", s_cols), ("evaluations", e_cols)):
+                path = _write_part(out_dir, table, run_id, part, cols, fmt)
+                if path is not None:
+                    stats["files"].append(str(path))
+            # Checkpoint after every chunk so an interrupted run resumes cleanly.
+            _save_state(out_dir, exported)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    stats["seconds"] = round(time.perf_counter() - started, 3)
+    stats["format"] = fmt
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", type=Path, required=True, help="Output directory for part files.")
+    parser.add_argument("--format", choices=["auto", "parquet", "npz"], default="auto")
+    parser.add_argument("--backend", default=settings.MEMORY_BACKEND, help="Memory store backend.")
+    parser.add_argument("--root", type=Path, default=settings.DATA_DIR, help="Memory store root.")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPUs).")
+    parser.add_argument("--chunk-users", type=int, default=500, help="Users per part file.")
+    parser.add_argument("--full", action="store_true", help="Ignore previous export state.")
+    parser.add_argument(
+        "--include-text", action="store_true", help="Also export question/answer/comments."
+    )
+    args = parser.parse_args(argv)
+
+    stats = export(
+        args.out,
+        backend=args.backend,
+        root=args.root,
+        fmt=args.format,
+        workers=args.workers,
+        chunk_users=args.chunk_users,
+        full=args.full,
+        include_text=args.include_text,
+    )
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()